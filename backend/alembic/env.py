@@ -11,6 +11,8 @@ from alembic import context
 # Import base and models
 from app.infrastructure.database.base import Base
 from app.infrastructure.database.models.transcription_model import TranscriptionModel
+from app.infrastructure.database.models.summary_model import ActionItemModel, SummaryModel
+from app.infrastructure.database.models.search_document_model import SearchDocumentModel
 from app.infrastructure.config.settings import settings
 
 # this is the Alembic Config object
@@ -0,0 +1,43 @@
+"""Record the model that generated each summary
+
+Revision ID: 3c1f7a9d2b64
+Revises: 98239f4cd697
+Create Date: 2026-10-19 16:05:31.270114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9d2b64'
+down_revision: Union[str, None] = '98239f4cd697'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _summary_columns() -> set[str] | None:
+    """Existing summaries columns, or None if the table is created at app startup"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("summaries"):
+        return None
+    return {column["name"] for column in inspector.get_columns("summaries")}
+
+
+def upgrade() -> None:
+    columns = _summary_columns()
+    if columns is None or "model" in columns:
+        return
+
+    op.add_column("summaries", sa.Column("model", sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    columns = _summary_columns()
+    if columns is None or "model" not in columns:
+        return
+
+    with op.batch_alter_table("summaries") as batch_op:
+        batch_op.drop_column("model")
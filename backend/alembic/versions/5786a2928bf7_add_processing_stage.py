@@ -0,0 +1,54 @@
+"""Add processing stage checkpoint
+
+Revision ID: 5786a2928bf7
+Revises: feaee3325458
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5786a2928bf7'
+down_revision: Union[str, None] = 'feaee3325458'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _transcription_columns() -> set[str] | None:
+    """Existing transcriptions columns, or None if the table is created at app startup"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("transcriptions"):
+        return None
+    return {column["name"] for column in inspector.get_columns("transcriptions")}
+
+
+def upgrade() -> None:
+    columns = _transcription_columns()
+    if columns is None or "stage" in columns:
+        return
+
+    op.add_column(
+        "transcriptions",
+        sa.Column("stage", sa.String(length=20), nullable=False, server_default="stored"),
+    )
+
+    # Backfill checkpoints for rows that already finished a stage
+    op.execute(
+        "UPDATE transcriptions SET stage = 'transcribed' WHERE transcript_text IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE transcriptions SET stage = 'summarized' WHERE summary_json IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    columns = _transcription_columns()
+    if columns is None or "stage" not in columns:
+        return
+
+    with op.batch_alter_table("transcriptions") as batch_op:
+        batch_op.drop_column("stage")
@@ -0,0 +1,46 @@
+"""Record the prompt version of each summary
+
+Revision ID: 7e4b2c9a1f05
+Revises: 3c1f7a9d2b64
+Create Date: 2026-10-19 18:42:10.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e4b2c9a1f05'
+down_revision: Union[str, None] = '3c1f7a9d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _summary_columns() -> set[str] | None:
+    """Existing summaries columns, or None if the table is created at app startup"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("summaries"):
+        return None
+    return {column["name"] for column in inspector.get_columns("summaries")}
+
+
+def upgrade() -> None:
+    columns = _summary_columns()
+    if columns is None or "prompt_version" in columns:
+        return
+
+    # Existing summaries keep NULL: their prompt version is unknown, so they count as outdated
+    op.add_column("summaries", sa.Column("prompt_version", sa.String(length=32), nullable=True))
+    op.create_index("ix_summaries_prompt_version", "summaries", ["prompt_version"])
+
+
+def downgrade() -> None:
+    columns = _summary_columns()
+    if columns is None or "prompt_version" not in columns:
+        return
+
+    op.drop_index("ix_summaries_prompt_version", table_name="summaries")
+    with op.batch_alter_table("summaries") as batch_op:
+        batch_op.drop_column("prompt_version")
@@ -0,0 +1,179 @@
+"""Move summaries from summary_json into summaries and action_items tables
+
+Revision ID: 928a02e73ab7
+Revises: be16a80a55f8
+Create Date: 2026-10-19 13:02:55.671340
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '928a02e73ab7'
+down_revision: Union[str, None] = 'be16a80a55f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSONList = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _uuid_type() -> sa.types.TypeEngine:
+    return postgresql.UUID(as_uuid=False) if _is_postgresql() else sa.CHAR(36)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("transcriptions"):
+        # Fresh database: tables are created at app startup
+        return
+
+    if not inspector.has_table("summaries"):
+        op.create_table(
+            "summaries",
+            sa.Column("id", _uuid_type(), primary_key=True),
+            sa.Column(
+                "transcription_id",
+                _uuid_type(),
+                sa.ForeignKey("transcriptions.id", ondelete="CASCADE"),
+                nullable=False,
+                unique=True,
+            ),
+            sa.Column("muhtasari", sa.Text(), nullable=False),
+            sa.Column("maamuzi", JSONList, nullable=False),
+            sa.Column("masuala_yaliyoahirishwa", JSONList, nullable=False),
+        )
+    if not inspector.has_table("action_items"):
+        op.create_table(
+            "action_items",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "summary_id",
+                _uuid_type(),
+                sa.ForeignKey("summaries.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("position", sa.Integer(), nullable=False),
+            sa.Column("person", sa.String(length=255), nullable=False),
+            sa.Column("task", sa.Text(), nullable=False),
+            sa.Column("due_date", sa.String(length=100), nullable=True),
+        )
+        op.create_index("ix_action_items_summary_id", "action_items", ["summary_id"])
+        op.create_index("ix_action_items_person", "action_items", ["person"])
+        op.create_index("ix_action_items_due_date", "action_items", ["due_date"])
+
+    columns = {column["name"] for column in inspector.get_columns("transcriptions")}
+    if "summary_json" not in columns:
+        return
+
+    # Copy existing JSON blobs into the new tables
+    summaries = sa.table(
+        "summaries",
+        sa.column("id"),
+        sa.column("transcription_id"),
+        sa.column("muhtasari"),
+        sa.column("maamuzi", JSONList),
+        sa.column("masuala_yaliyoahirishwa", JSONList),
+    )
+    action_items = sa.table(
+        "action_items",
+        sa.column("summary_id"),
+        sa.column("position"),
+        sa.column("person"),
+        sa.column("task"),
+        sa.column("due_date"),
+    )
+
+    rows = op.get_bind().execute(
+        sa.text("SELECT summary_json FROM transcriptions WHERE summary_json IS NOT NULL")
+    )
+    summary_rows = []
+    item_rows = []
+    for (summary_json,) in rows:
+        data = json.loads(summary_json)
+        summary_rows.append({
+            "id": data["id"],
+            "transcription_id": data["transcription_id"],
+            "muhtasari": data.get("muhtasari") or "",
+            "maamuzi": data.get("maamuzi") or [],
+            "masuala_yaliyoahirishwa": data.get("masuala_yaliyoahirishwa") or [],
+        })
+        for position, item in enumerate(data.get("kazi") or []):
+            item_rows.append({
+                "summary_id": data["id"],
+                "position": position,
+                "person": item.get("person") or "",
+                "task": item.get("task") or "",
+                "due_date": item.get("due_date"),
+            })
+
+    if summary_rows:
+        op.bulk_insert(summaries, summary_rows)
+    if item_rows:
+        op.bulk_insert(action_items, item_rows)
+
+    with op.batch_alter_table("transcriptions") as batch_op:
+        batch_op.drop_column("summary_json")
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("transcriptions"):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("transcriptions")}
+    if "summary_json" not in columns:
+        with op.batch_alter_table("transcriptions") as batch_op:
+            batch_op.add_column(sa.Column("summary_json", sa.Text(), nullable=True))
+
+    if not inspector.has_table("summaries"):
+        return
+
+    bind = op.get_bind()
+    items_by_summary = {}
+    if inspector.has_table("action_items"):
+        for summary_id, person, task, due_date in bind.execute(
+            sa.text(
+                "SELECT summary_id, person, task, due_date FROM action_items "
+                "ORDER BY summary_id, position"
+            )
+        ):
+            items_by_summary.setdefault(str(summary_id), []).append(
+                {"person": person, "task": task, "due_date": due_date}
+            )
+
+    for summary_id, transcription_id, muhtasari, maamuzi, masuala in bind.execute(
+        sa.text(
+            "SELECT id, transcription_id, muhtasari, maamuzi, masuala_yaliyoahirishwa "
+            "FROM summaries"
+        )
+    ):
+        if isinstance(maamuzi, str):
+            maamuzi = json.loads(maamuzi)
+        if isinstance(masuala, str):
+            masuala = json.loads(masuala)
+        summary_json = json.dumps({
+            "id": str(summary_id),
+            "transcription_id": str(transcription_id),
+            "muhtasari": muhtasari,
+            "maamuzi": maamuzi,
+            "kazi": items_by_summary.get(str(summary_id), []),
+            "masuala_yaliyoahirishwa": masuala,
+        })
+        bind.execute(
+            sa.text("UPDATE transcriptions SET summary_json = :summary_json WHERE id = :id"),
+            {"summary_json": summary_json, "id": transcription_id},
+        )
+
+    if inspector.has_table("action_items"):
+        op.drop_table("action_items")
+    op.drop_table("summaries")
@@ -0,0 +1,98 @@
+"""Add full-text search index over transcripts and summaries
+
+Revision ID: 98239f4cd697
+Revises: 928a02e73ab7
+Create Date: 2026-10-19 15:20:07.402913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.infrastructure.database.models.search_document_model import (
+    FTS_TABLE,
+    POSTGRESQL_SEARCH_DDL,
+    SQLITE_SEARCH_DDL,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '98239f4cd697'
+down_revision: Union[str, None] = '928a02e73ab7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _terms(text) -> str:
+    return " ".join(SwahiliProcessor.search_terms(text))
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("transcriptions"):
+        # Fresh database: tables are created at app startup
+        return
+
+    if not inspector.has_table("search_documents"):
+        op.create_table(
+            "search_documents",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "transcription_id",
+                postgresql.UUID(as_uuid=False) if _is_postgresql() else sa.CHAR(36),
+                sa.ForeignKey("transcriptions.id", ondelete="CASCADE"),
+                nullable=False,
+                unique=True,
+            ),
+            sa.Column("summary_terms", sa.Text(), nullable=False, server_default=""),
+            sa.Column("transcript_terms", sa.Text(), nullable=False, server_default=""),
+        )
+
+    for statement in POSTGRESQL_SEARCH_DDL if _is_postgresql() else SQLITE_SEARCH_DDL:
+        op.execute(statement)
+
+    # Index every transcription that has text but no search document yet
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT t.id, t.transcript_text, s.muhtasari, s.maamuzi "
+            "FROM transcriptions t "
+            "LEFT JOIN summaries s ON s.transcription_id = t.id "
+            "LEFT JOIN search_documents d ON d.transcription_id = t.id "
+            "WHERE d.id IS NULL AND (t.transcript_text IS NOT NULL OR s.id IS NOT NULL)"
+        ).columns(maamuzi=sa.JSON())
+    ).all()
+    if rows:
+        op.bulk_insert(
+            sa.table(
+                "search_documents",
+                sa.column("transcription_id"),
+                sa.column("summary_terms"),
+                sa.column("transcript_terms"),
+            ),
+            [
+                {
+                    "transcription_id": transcription_id,
+                    "summary_terms": _terms("\n".join([muhtasari or "", *(maamuzi or [])])),
+                    "transcript_terms": _terms(transcript_text),
+                }
+                for transcription_id, transcript_text, muhtasari, maamuzi in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("search_documents"):
+        return
+
+    if not _is_postgresql():
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    op.drop_table("search_documents")
@@ -0,0 +1,54 @@
+"""Record the prompt mode and token usage of each summary
+
+Revision ID: b5d8e3f6a217
+Revises: 7e4b2c9a1f05
+Create Date: 2026-10-19 21:07:44.193825
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8e3f6a217'
+down_revision: Union[str, None] = '7e4b2c9a1f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ("prompt_mode", sa.String(length=20)),
+    ("prompt_tokens", sa.Integer()),
+    ("completion_tokens", sa.Integer()),
+)
+
+
+def _summary_columns() -> set[str] | None:
+    """Existing summaries columns, or None if the table is created at app startup"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("summaries"):
+        return None
+    return {column["name"] for column in inspector.get_columns("summaries")}
+
+
+def upgrade() -> None:
+    columns = _summary_columns()
+    if columns is None:
+        return
+
+    # Existing summaries keep NULL: their usage was never recorded
+    for name, column_type in _COLUMNS:
+        if name not in columns:
+            op.add_column("summaries", sa.Column(name, column_type, nullable=True))
+
+
+def downgrade() -> None:
+    columns = _summary_columns()
+    if columns is None:
+        return
+
+    with op.batch_alter_table("summaries") as batch_op:
+        for name, _ in reversed(_COLUMNS):
+            if name in columns:
+                batch_op.drop_column(name)
@@ -0,0 +1,70 @@
+"""Add indexes for listing and job status queries
+
+Revision ID: be16a80a55f8
+Revises: 5786a2928bf7
+Create Date: 2026-10-19 12:31:07.402913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'be16a80a55f8'
+down_revision: Union[str, None] = '5786a2928bf7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE_STATUSES = sa.text("status IN ('pending', 'processing')")
+
+
+def _existing_indexes() -> set[str] | None:
+    """Existing transcriptions indexes, or None if the table is created at app startup"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("transcriptions"):
+        return None
+    return {index["name"] for index in inspector.get_indexes("transcriptions")}
+
+
+def upgrade() -> None:
+    indexes = _existing_indexes()
+    if indexes is None:
+        return
+
+    if "ix_transcriptions_created_at_id" not in indexes:
+        op.create_index(
+            "ix_transcriptions_created_at_id",
+            "transcriptions",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+        )
+    if "ix_transcriptions_status_created_at" not in indexes:
+        op.create_index(
+            "ix_transcriptions_status_created_at",
+            "transcriptions",
+            ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+        )
+    if "ix_transcriptions_active_created_at" not in indexes:
+        op.create_index(
+            "ix_transcriptions_active_created_at",
+            "transcriptions",
+            ["created_at"],
+            postgresql_where=ACTIVE_STATUSES,
+            sqlite_where=ACTIVE_STATUSES,
+        )
+
+
+def downgrade() -> None:
+    indexes = _existing_indexes()
+    if indexes is None:
+        return
+
+    for name in (
+        "ix_transcriptions_active_created_at",
+        "ix_transcriptions_status_created_at",
+        "ix_transcriptions_created_at_id",
+    ):
+        if name in indexes:
+            op.drop_index(name, table_name="transcriptions")
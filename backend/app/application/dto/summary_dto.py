@@ -24,6 +24,8 @@ class SummaryDTO:
     maamuzi: List[str] = field(default_factory=list)
     kazi: List[ActionItemDTO] = field(default_factory=list)
     masuala_yaliyoahirishwa: List[str] = field(default_factory=list)
+    model: Optional[str] = None
+    prompt_version: Optional[str] = None
     
     @classmethod
     def from_entity(cls, summary: Summary) -> "SummaryDTO":
@@ -42,5 +44,7 @@ class SummaryDTO:
                 for item in summary.kazi
             ],
             masuala_yaliyoahirishwa=summary.masuala_yaliyoahirishwa,
+            model=summary.model,
+            prompt_version=summary.prompt_version,
         )
 
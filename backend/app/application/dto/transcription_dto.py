@@ -15,6 +15,7 @@ class TranscriptionDTO:
     id: UUID
     filename: str
     status: str
+    stage: Optional[str] = None
     transcript_text: Optional[str] = None
     created_at: datetime = None
     updated_at: datetime = None
@@ -26,6 +27,7 @@ class TranscriptionDTO:
             id=transcription.id,
             filename=transcription.filename,
             status=transcription.status.value,
+            stage=transcription.stage.value,
             transcript_text=transcription.transcript_text,
             created_at=transcription.created_at,
             updated_at=transcription.updated_at,
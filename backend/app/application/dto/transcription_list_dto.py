@@ -0,0 +1,43 @@
+"""Transcription listing DTOs"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.value_objects.transcription_listing import TranscriptionListItem
+
+
+@dataclass
+class TranscriptionListItemDTO:
+    """Data Transfer Object for a transcription list entry"""
+    
+    id: UUID
+    filename: str
+    status: str
+    stage: str
+    has_transcript: bool
+    has_summary: bool
+    created_at: datetime
+    updated_at: datetime
+    
+    @classmethod
+    def from_item(cls, item: TranscriptionListItem) -> "TranscriptionListItemDTO":
+        """Create DTO from listing projection"""
+        return cls(
+            id=item.id,
+            filename=item.filename,
+            status=item.status.value,
+            stage=item.stage.value,
+            has_transcript=item.has_transcript,
+            has_summary=item.has_summary,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+        )
+
+
+@dataclass
+class TranscriptionPageDTO:
+    """One page of transcriptions with the cursor for the next page"""
+    
+    items: List[TranscriptionListItemDTO] = field(default_factory=list)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,25 @@
+"""Transcription search DTOs"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+
+@dataclass
+class TranscriptionSearchHitDTO:
+    """Data Transfer Object for a search hit"""
+    
+    id: UUID
+    filename: str
+    status: str
+    rank: float
+    snippet: Optional[str]
+    created_at: datetime
+
+
+@dataclass
+class TranscriptionSearchResultDTO:
+    """Ranked search hits for a query"""
+    
+    query: str
+    items: List[TranscriptionSearchHitDTO] = field(default_factory=list)
@@ -0,0 +1,337 @@
+"""Priority-aware job scheduler for transcription processing"""
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from app.shared.logging import get_logger
+from app.shared.metrics import JOB_QUEUE_WAIT_SECONDS
+from app.shared.timing import record_timing
+
+logger = get_logger(__name__)
+
+JobHandler = Callable[[UUID], Awaitable[None]]
+
+
+class JobPriority(IntEnum):
+    """Priority class of a processing job (lower value runs first)"""
+    
+    INTERACTIVE = 0
+    STANDARD = 1
+    BATCH = 2
+
+
+_current_priority: ContextVar[Optional[JobPriority]] = ContextVar("job_priority", default=None)
+
+
+def current_job_priority() -> Optional[JobPriority]:
+    """Priority class of the job being run, if any"""
+    return _current_priority.get()
+
+
+def set_job_priority(priority: JobPriority) -> None:
+    """Run the current task's remaining work as a job of the given priority class"""
+    _current_priority.set(priority)
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    """Queued job ordered by its fair-queuing finish tag"""
+    
+    finish_tag: float
+    seq: int
+    job_id: UUID = field(compare=False)
+    handler: JobHandler = field(compare=False)
+    priority: JobPriority = field(compare=False)
+    fair_key: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    context: contextvars.Context = field(compare=False, default_factory=contextvars.copy_context)
+    enqueued_at: float = field(compare=False, default_factory=time.monotonic)
+
+
+@dataclass
+class _PriorityLane:
+    """Per-priority queue using self-clocked weighted fair queuing"""
+    
+    heap: List[_QueuedJob] = field(default_factory=list)
+    virtual_time: float = 0.0
+    last_finish: Dict[str, float] = field(default_factory=dict)
+
+
+class JobScheduler:
+    """
+    Schedules processing jobs onto a bounded pool of worker slots
+    
+    Jobs are split into priority lanes by origin: interactive origins
+    (live browser recordings, meeting extension) always run ahead of
+    regular file uploads, which run ahead of batch work. Within a lane,
+    jobs are interleaved per tenant (or origin when no tenant is given)
+    using weighted fair queuing, so one caller submitting hundreds of
+    files cannot monopolise the lane. A number of worker slots can be
+    reserved for interactive jobs so they never wait behind bulk loads.
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 4,
+        reserved_interactive_workers: int = 1,
+        interactive_origins: Optional[Set[str]] = None,
+        batch_origins: Optional[Set[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        logger=None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if not 0 <= reserved_interactive_workers < max_workers:
+            raise ValueError(
+                "reserved_interactive_workers must be between 0 and max_workers - 1"
+            )
+        
+        self._max_workers = max_workers
+        self._reserved_interactive = reserved_interactive_workers
+        self._interactive_origins = interactive_origins or set()
+        self._batch_origins = batch_origins or set()
+        self._weights = weights or {}
+        self._logger = logger or get_logger(__name__)
+        
+        self._lanes: Dict[JobPriority, _PriorityLane] = {
+            priority: _PriorityLane() for priority in JobPriority
+        }
+        self._seq = itertools.count()
+        self._running: Dict[UUID, asyncio.Task] = {}
+        self._running_non_interactive = 0
+    
+    @property
+    def running_count(self) -> int:
+        """Number of jobs currently occupying a worker slot"""
+        return len(self._running)
+    
+    @property
+    def queued_count(self) -> int:
+        """Number of jobs waiting for a worker slot"""
+        return sum(len(lane.heap) for lane in self._lanes.values())
+    
+    def is_scheduled(self, job_id: UUID) -> bool:
+        """Check whether a job is queued or running"""
+        if job_id in self._running:
+            return True
+        return any(
+            job.job_id == job_id and not job.future.done()
+            for lane in self._lanes.values()
+            for job in lane.heap
+        )
+    
+    def classify(self, origin: Optional[str]) -> JobPriority:
+        """Map an upload origin to its priority class"""
+        if origin in self._interactive_origins:
+            return JobPriority.INTERACTIVE
+        if origin in self._batch_origins:
+            return JobPriority.BATCH
+        return JobPriority.STANDARD
+    
+    def submit(
+        self,
+        job_id: UUID,
+        handler: JobHandler,
+        origin: Optional[str] = None,
+        tenant: Optional[str] = None,
+        cost: float = 1.0,
+    ) -> asyncio.Future:
+        """
+        Queue a job and dispatch it as soon as a worker slot allows
+        
+        Args:
+            job_id: ID of the job (transcription ID)
+            handler: Coroutine function invoked with job_id when the job runs
+            origin: Upload origin used to select the priority class
+            tenant: Optional tenant key for fair queuing (defaults to origin)
+            cost: Relative cost of the job used for fair-share accounting
+        
+        Returns:
+            Future resolved with the handler's result or exception
+        """
+        priority = self.classify(origin)
+        fair_key = tenant or origin or "default"
+        lane = self._lanes[priority]
+        
+        # Self-clocked fair queuing: a key's next job finishes one weighted
+        # cost after either its previous job or the lane's current clock
+        weight = self._weights.get(fair_key, 1.0)
+        start_tag = max(lane.virtual_time, lane.last_finish.get(fair_key, 0.0))
+        finish_tag = start_tag + cost / weight
+        lane.last_finish[fair_key] = finish_tag
+        
+        future = asyncio.get_running_loop().create_future()
+        # Background submissions may never be awaited; mark the outcome
+        # as retrieved so failures don't surface as unhandled warnings
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        
+        heapq.heappush(
+            lane.heap,
+            _QueuedJob(
+                finish_tag=finish_tag,
+                seq=next(self._seq),
+                job_id=job_id,
+                handler=handler,
+                priority=priority,
+                fair_key=fair_key,
+                future=future,
+            ),
+        )
+        
+        self._logger.info(
+            "scheduler.job.queued",
+            transcription_id=str(job_id),
+            priority=priority.name.lower(),
+            fair_key=fair_key,
+            queued=self.queued_count,
+            running=self.running_count,
+        )
+        
+        self._dispatch()
+        return future
+    
+    async def cancel(self, job_id: UUID) -> bool:
+        """
+        Cancel a queued or running job
+        
+        A running job is cancelled through its task, so the cancellation
+        propagates into whatever provider call or storage transfer it is
+        awaiting. Its worker slot is released before this returns.
+        
+        Args:
+            job_id: ID of the job to cancel
+        
+        Returns:
+            True if a queued or running job was cancelled
+        """
+        cancelled = False
+        for lane in self._lanes.values():
+            remaining = []
+            removed_keys = set()
+            for job in lane.heap:
+                if job.job_id == job_id:
+                    cancelled = job.future.cancel() or cancelled
+                    removed_keys.add(job.fair_key)
+                else:
+                    remaining.append(job)
+            if removed_keys:
+                heapq.heapify(remaining)
+                lane.heap = remaining
+                self._roll_back_finish_tags(lane, removed_keys)
+        
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            cancelled = True
+        
+        if cancelled:
+            self._logger.info("scheduler.job.cancelled", transcription_id=str(job_id))
+        return cancelled
+    
+    async def shutdown(self) -> None:
+        """Cancel queued and running jobs"""
+        for lane in self._lanes.values():
+            for job in lane.heap:
+                job.future.cancel()
+            lane.heap.clear()
+        
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    def _roll_back_finish_tags(lane: _PriorityLane, fair_keys: Set[str]) -> None:
+        """Charge keys only for the jobs they still have queued after a cancel"""
+        for fair_key in fair_keys:
+            tags = [job.finish_tag for job in lane.heap if job.fair_key == fair_key]
+            if tags:
+                lane.last_finish[fair_key] = max(tags)
+            else:
+                # Nothing left queued: the next job starts at the lane's clock
+                lane.last_finish.pop(fair_key, None)
+    
+    def _can_start(self, priority: JobPriority) -> bool:
+        """Check whether a job of the given priority may take a free slot"""
+        if len(self._running) >= self._max_workers:
+            return False
+        if priority == JobPriority.INTERACTIVE:
+            return True
+        shared_slots = self._max_workers - self._reserved_interactive
+        return self._running_non_interactive < shared_slots
+    
+    def _dispatch(self) -> None:
+        """Start queued jobs while worker slots are available"""
+        while len(self._running) < self._max_workers:
+            job = None
+            for priority in JobPriority:
+                lane = self._lanes[priority]
+                if lane.heap and self._can_start(priority):
+                    job = heapq.heappop(lane.heap)
+                    lane.virtual_time = job.finish_tag
+                    break
+            
+            if job is None:
+                return
+            
+            if job.future.cancelled():
+                continue
+            
+            if job.priority != JobPriority.INTERACTIVE:
+                self._running_non_interactive += 1
+            # Run in the submitter's context (request timings, request ID),
+            # not that of whichever job happened to free the slot
+            self._running[job.job_id] = asyncio.create_task(self._run(job), context=job.context)
+    
+    async def _run(self, job: _QueuedJob) -> None:
+        """Run a job in its worker slot and release the slot when done"""
+        _current_priority.set(job.priority)
+        queue_wait = time.monotonic() - job.enqueued_at
+        JOB_QUEUE_WAIT_SECONDS.labels(priority=job.priority.name.lower()).observe(queue_wait)
+        record_timing("queue", queue_wait)
+        self._logger.info(
+            "scheduler.job.started",
+            transcription_id=str(job.job_id),
+            priority=job.priority.name.lower(),
+            queue_wait=f"{queue_wait:.3f}s",
+        )
+        
+        try:
+            result = await job.handler(job.job_id)
+        except asyncio.CancelledError:
+            job.future.cancel()
+            raise
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._running.pop(job.job_id, None)
+            if job.priority != JobPriority.INTERACTIVE:
+                self._running_non_interactive -= 1
+            self._dispatch()
+
+
+async def wait_for_job(job: asyncio.Future) -> None:
+    """
+    Wait for a scheduled job to finish
+    
+    The job is shielded so cancelling the waiter does not cancel the job.
+    A job that was itself cancelled returns normally instead of raising.
+    """
+    try:
+        await asyncio.shield(job)
+    except asyncio.CancelledError:
+        if not job.cancelled():
+            raise
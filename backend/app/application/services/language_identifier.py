@@ -0,0 +1,179 @@
+"""Character n-gram Swahili/English identification per segment"""
+import unicodedata
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from app.application.services import language_samples
+
+SWAHILI = "sw"
+ENGLISH = "en"
+MIXED = "mixed"
+
+# Letters a-z are symbols 1-26; everything else is a word boundary (0)
+_SYMBOLS = 27
+_TRIGRAMS = _SYMBOLS ** 3
+
+# Characters that end a segment
+_SEGMENT_BREAKS = np.array([ord(char) for char in ".!?\n"], dtype=np.uint32)
+
+
+def _symbol_table() -> np.ndarray:
+    """Symbol of each Latin-1 code point (accented letters fold to a-z)"""
+    table = np.zeros(256, dtype=np.int32)
+    for code in range(256):
+        base = unicodedata.normalize("NFKD", chr(code))[:1].lower()
+        if "a" <= base <= "z":
+            table[code] = ord(base) - ord("a") + 1
+    return table
+
+
+_SYMBOL_TABLE = _symbol_table()
+
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _symbols(code_points: np.ndarray) -> np.ndarray:
+    return np.where(
+        code_points < 256,
+        _SYMBOL_TABLE[np.minimum(code_points, 255)],
+        0,
+    )
+
+
+def _trigram_ids(symbols: np.ndarray) -> np.ndarray:
+    """Id of the trigram centred on each character"""
+    padded = np.concatenate(([0], symbols, [0]))
+    return (padded[:-2] * _SYMBOLS + padded[1:-1]) * _SYMBOLS + padded[2:]
+
+
+@dataclass(frozen=True)
+class LanguageSegment:
+    """A sentence-like span of text and its language"""
+    
+    start: int
+    end: int
+    language: str
+    english_share: float
+
+
+@dataclass(frozen=True)
+class LanguageAnalysis:
+    """Per-segment languages of a text"""
+    
+    segments: Tuple[LanguageSegment, ...]
+    english_ratio: float
+    code_switching_ratio: float
+    
+    @property
+    def dominant_language(self) -> str:
+        """Language of most identified letters"""
+        return ENGLISH if self.english_ratio > 0.5 else SWAHILI
+
+
+class LanguageIdentifier:
+    """
+    Tags text segments as Swahili, English or mixed
+    
+    Each word is scored by summing, over its character trigrams (with word
+    boundaries), the log-probability ratio of Swahili to English from a
+    table precomputed from sample text. Segments (sentences or lines) are
+    tagged by the share of their letters in confidently English words.
+    Scoring is vectorized over the whole text, so an hour-long transcript
+    takes a few milliseconds.
+    
+    Args:
+        word_margin: Minimum absolute word score (nats) for a word to count
+        mixed_share: Minority-language share of a segment's letters above
+            which the segment is tagged mixed
+    """
+    
+    def __init__(self, word_margin: float = 2.0, mixed_share: float = 0.2):
+        self._word_margin = word_margin
+        self._mixed_share = mixed_share
+        swahili = self._log_probabilities(language_samples.SWAHILI)
+        english = self._log_probabilities(language_samples.ENGLISH)
+        self._scores = (swahili - english).astype(np.float32)
+        # Trigrams centred on a boundary carry no word evidence
+        centre = (np.arange(_TRIGRAMS) // _SYMBOLS) % _SYMBOLS
+        self._scores[centre == 0] = 0.0
+    
+    @staticmethod
+    def _log_probabilities(sample: str, smoothing: float = 0.5) -> np.ndarray:
+        ids = _trigram_ids(_symbols(_code_points(sample)))
+        counts = np.bincount(ids, minlength=_TRIGRAMS).astype(np.float64)
+        return np.log((counts + smoothing) / (counts.sum() + smoothing * _TRIGRAMS))
+    
+    def analyze(self, text: str) -> LanguageAnalysis:
+        """
+        Tag each segment of the text
+        
+        Segments end at sentence punctuation or line breaks; segments
+        without a confidently identified word are left out.
+        
+        Args:
+            text: Text to analyze
+        
+        Returns:
+            Segments with their language, the share of identified letters
+            that are English, and the share of segments whose language
+            differs from the dominant one (mixed segments included)
+        """
+        code_points = _code_points(text or "")
+        symbols = _symbols(code_points)
+        is_letter = symbols != 0
+        if not is_letter.any():
+            return LanguageAnalysis(segments=(), english_ratio=0.0, code_switching_ratio=0.0)
+        position_scores = self._scores[_trigram_ids(symbols)]
+        
+        # Words: runs of letters
+        starts = is_letter & ~np.concatenate(([False], is_letter[:-1]))
+        word_starts = np.flatnonzero(starts)
+        word_of = np.cumsum(starts) - 1
+        letters = word_of[is_letter]
+        word_scores = np.bincount(letters, weights=position_scores[is_letter])
+        word_lengths = np.bincount(letters)
+        english_words = word_scores < -self._word_margin
+        swahili_words = word_scores > self._word_margin
+        
+        # Segments: split after sentence punctuation and line breaks
+        breaks = np.flatnonzero(np.isin(code_points, _SEGMENT_BREAKS)) + 1
+        segment_starts = np.concatenate(([0], breaks))
+        segment_of_word = np.searchsorted(segment_starts, word_starts, side="right") - 1
+        segment_count = len(segment_starts)
+        english = np.bincount(
+            segment_of_word, weights=word_lengths * english_words, minlength=segment_count
+        )
+        swahili = np.bincount(
+            segment_of_word, weights=word_lengths * swahili_words, minlength=segment_count
+        )
+        identified = english + swahili
+        
+        segments = []
+        segment_ends = np.concatenate((breaks, [len(code_points)]))
+        for index in np.flatnonzero(identified):
+            share = float(english[index] / identified[index])
+            if min(share, 1 - share) >= self._mixed_share:
+                language = MIXED
+            else:
+                language = ENGLISH if share > 0.5 else SWAHILI
+            segments.append(LanguageSegment(
+                start=int(segment_starts[index]),
+                end=int(segment_ends[index]),
+                language=language,
+                english_share=round(share, 3),
+            ))
+        
+        if not segments:
+            return LanguageAnalysis(segments=(), english_ratio=0.0, code_switching_ratio=0.0)
+        english_ratio = float(english.sum() / identified.sum())
+        dominant = ENGLISH if english_ratio > 0.5 else SWAHILI
+        switched = sum(1 for segment in segments if segment.language != dominant)
+        return LanguageAnalysis(
+            segments=tuple(segments),
+            english_ratio=round(english_ratio, 3),
+            code_switching_ratio=round(switched / len(segments), 3),
+        )
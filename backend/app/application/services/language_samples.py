@@ -0,0 +1,110 @@
+"""Sample text the language identifier's n-gram tables are built from"""
+
+SWAHILI = """
+Habari za asubuhi, karibuni wote kwenye kikao cha leo. Tutaanza na taarifa
+ya wiki iliyopita kisha tutajadili mipango ya mwezi ujao. Mwenyekiti alisema
+kwamba kazi nyingi zimekamilika lakini bado kuna changamoto kadhaa. Timu ya
+fedha imeandaa bajeti mpya na itawasilisha ripoti yake kesho asubuhi.
+Tunahitaji kuhakikisha kwamba kila mtu anaelewa majukumu yake. Naomba kila
+kiongozi wa idara aeleze maendeleo ya kazi zake kwa ufupi. Baada ya hapo
+tutapanga tarehe ya mkutano ujao na kugawa kazi mpya.
+
+Mimi nadhani tunapaswa kuongeza muda wa mradi kwa sababu wateja wameomba
+mabadiliko mengi. Hatuwezi kumaliza kila kitu kabla ya mwisho wa mwezi huu.
+Ni muhimu tuwasiliane na wateja mapema ili wajue hali halisi. Wao wanataka
+huduma bora, na sisi tunataka kuwapa huduma hiyo bila kuchelewa. Kama
+hatutafanya hivyo, tutapoteza imani yao na biashara yetu itaathirika.
+
+Ndiyo, nakubaliana nawe kabisa. Lakini pia tuangalie gharama, kwa sababu
+fedha tulizonazo ni chache. Tumeshatumia sehemu kubwa ya bajeti katika robo
+ya kwanza ya mwaka. Je, kuna njia nyingine ya kupunguza matumizi bila
+kuathiri ubora wa kazi? Labda tunaweza kuajiri wafanyakazi wa muda badala ya
+wafanyakazi wa kudumu. Hilo ni wazo zuri, tutalifikiria zaidi.
+
+Wanafunzi walikwenda shuleni mapema asubuhi na walimu wakawafundisha hesabu,
+historia na jiografia. Mvua ilinyesha usiku kucha na barabara zikajaa maji.
+Wakulima wanafurahi kwa sababu mazao yao yatastawi vizuri mwaka huu. Soko la
+mjini lilikuwa na watu wengi waliokuja kununua matunda, mboga na samaki.
+Bei ya chakula imepanda kidogo lakini watu bado wanaweza kumudu mahitaji yao.
+
+Serikali imetangaza mpango mpya wa kuboresha huduma za afya vijijini.
+Hospitali nyingi zitapata vifaa vipya na madaktari zaidi wataajiriwa. Wananchi
+wameombwa kushirikiana na viongozi wao ili mpango huu ufanikiwe. Waziri
+alisisitiza umuhimu wa elimu kwa watoto wote, wavulana kwa wasichana.
+
+Kazi hii inahitaji umakini mkubwa. Tafadhali soma maelezo yote kabla ya
+kuanza, na uulize swali lolote kama kuna jambo usilolielewa. Tutakutana tena
+Ijumaa ijayo saa nne asubuhi kujadili matokeo. Asanteni sana kwa muda wenu,
+mkutano umeahirishwa hadi wiki ijayo. Kwaheri na siku njema kwenu nyote.
+
+Juma aliniambia kwamba hatakuja kesho kwa sababu mama yake ni mgonjwa.
+Amina atachukua nafasi yake na kuongoza mazungumzo na wageni. Tuliamua
+kwamba mfumo mpya utaanza kutumika mwezi ujao baada ya mafunzo kwa
+wafanyakazi wote. Kila mmoja atapewa nenosiri lake na maelekezo ya matumizi.
+Tatizo kubwa ni kwamba mtandao unakatika mara kwa mara ofisini kwetu.
+Fundi atakuja kurekebisha tatizo hilo haraka iwezekanavyo.
+
+Nimefurahi sana kusikia habari hizo njema. Tunashukuru kwa juhudi zenu zote.
+Tuendelee kufanya kazi kwa bidii na kwa ushirikiano. Hakuna haja ya kuwa na
+wasiwasi, kila kitu kitakwenda sawa. Ningependa kujua maoni yenu kuhusu
+pendekezo hili kabla hatujafanya uamuzi wa mwisho. Wengi wamesema wanakubali,
+wachache wanapinga. Basi tumeamua kwamba tutaendelea na mpango huu.
+"""
+
+ENGLISH = """
+Good morning everyone, and welcome to today's meeting. We will start with
+the update from last week and then discuss the plans for next month. The
+chair said that most of the work has been completed but there are still a
+few challenges. The finance team has prepared a new budget and will present
+their report tomorrow morning. We need to make sure that everyone understands
+their responsibilities. I would like each department head to briefly explain
+the progress of their work. After that we will set the date of the next
+meeting and assign new tasks.
+
+I think we should extend the project timeline because the customers have
+asked for many changes. We cannot finish everything before the end of this
+month. It is important that we talk to the customers early so they know the
+real situation. They want good service, and we want to give them that service
+without delays. If we do not do that, we will lose their trust and our
+business will suffer.
+
+Yes, I completely agree with you. But we also have to look at the costs,
+because the money we have is limited. We have already spent a large part of
+the budget in the first quarter of the year. Is there another way to reduce
+spending without affecting the quality of the work? Maybe we could hire
+temporary staff instead of permanent employees. That is a good idea, we will
+think about it some more.
+
+The deployment failed again last night because the database server ran out of
+memory. We should check the logs, fix the configuration and then deploy the
+new release to production. The frontend team is working on the login page and
+the backend team is writing the API for payments. Please review the pull
+request before the end of the day and leave your comments on the code.
+Testing should be automated so that every change is checked before it is
+merged into the main branch.
+
+The government has announced a new plan to improve health services in rural
+areas. Many hospitals will get new equipment and more doctors will be hired.
+Citizens have been asked to cooperate with their leaders so that this plan
+succeeds. The minister stressed the importance of education for all children,
+both boys and girls.
+
+This work requires a lot of attention. Please read all the instructions
+before you start, and ask any question if there is something you do not
+understand. We will meet again next Friday at ten in the morning to discuss
+the results. Thank you very much for your time, the meeting is adjourned until
+next week. Goodbye and have a nice day, all of you.
+
+John told me that he will not come tomorrow because his mother is sick.
+Sarah will take his place and lead the discussion with the visitors. We
+decided that the new system will be used from next month after training for
+all the staff. Everyone will be given a password and instructions on how to
+use it. The biggest problem is that the network at our office keeps going
+down. The technician will come to fix that problem as soon as possible.
+
+I am very happy to hear such good news. We are grateful for all your efforts.
+Let us keep working hard and together. There is no need to worry, everything
+will be fine. I would like to know what you think about this proposal before
+we make the final decision. Most of you said you agree, a few are against it.
+So we have decided that we will go ahead with this plan.
+"""
@@ -0,0 +1,212 @@
+"""Domain lexicons with hot reload and per-tenant overlays"""
+import asyncio
+import bisect
+import hashlib
+import threading
+from typing import Dict, Iterable, Mapping, Optional, Protocol, Tuple
+
+from app.application.services.term_matcher import TermMatcher
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Lexicon categories
+TECHNICAL_TERMS = "technical_terms"
+PROPER_NOUNS = "proper_nouns"
+FILLER_WORDS = "filler_words"  # Dropped from transcripts, never preserved
+CATEGORIES = (TECHNICAL_TERMS, PROPER_NOUNS, FILLER_WORDS)
+
+
+class Lexicon:
+    """
+    Immutable term lists by category
+    
+    Terms are stored lowercased, deduplicated and sorted in one tuple per
+    category, so membership is a binary search and the lists stay compact.
+    The original spelling is kept only for terms that are not lowercase.
+    """
+    
+    __slots__ = ("_terms", "_spellings", "_version")
+    
+    def __init__(self, terms: Optional[Mapping[str, Iterable[str]]] = None):
+        self._spellings: Dict[str, str] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        for category, values in (terms or {}).items():
+            normalized = set()
+            for value in values:
+                value = value.strip() if value else ""
+                if not value:
+                    continue
+                term = value.lower()
+                normalized.add(term)
+                if value != term:
+                    self._spellings.setdefault(term, value)
+            self._terms[category] = tuple(sorted(normalized))
+        digest = hashlib.sha256()
+        for category in sorted(self._terms):
+            digest.update(category.encode())
+            for term in self._terms[category]:
+                digest.update(b"\0" + self.spelling(term).encode())
+        self._version = digest.hexdigest()[:16]
+    
+    @property
+    def version(self) -> str:
+        """Content hash, identical for identical lexicons"""
+        return self._version
+    
+    def terms(self, category: str) -> Tuple[str, ...]:
+        """Sorted terms of a category"""
+        return self._terms.get(category, ())
+    
+    def spelling(self, term: str) -> str:
+        """Original spelling of a term (e.g. "M-Pesa" for "m-pesa")"""
+        return self._spellings.get(term, term)
+    
+    def contains(self, category: str, term: str) -> bool:
+        """Check whether a term belongs to a category"""
+        terms = self.terms(category)
+        term = term.lower()
+        index = bisect.bisect_left(terms, term)
+        return index < len(terms) and terms[index] == term
+    
+    def merged(self, overlay: "Lexicon") -> "Lexicon":
+        """Lexicon with the overlay's terms added to this one's"""
+        categories = set(self._terms) | set(overlay._terms)
+        return Lexicon({
+            category: [self.spelling(term) for term in self.terms(category)]
+            + [overlay.spelling(term) for term in overlay.terms(category)]
+            for category in categories
+        })
+
+
+class LexiconSnapshot:
+    """
+    Base lexicon plus per-tenant overlays, with matchers compiled up front
+    
+    Snapshots are never modified; a reload builds a new one and swaps it in,
+    so a request holding a snapshot sees one consistent version throughout.
+    """
+    
+    def __init__(self, base: Lexicon, overlays: Optional[Mapping[str, Lexicon]] = None):
+        self.base = base
+        self._overlays: Dict[str, Lexicon] = dict(overlays or {})
+        self._lexicons: Dict[Optional[str], Lexicon] = {None: base}
+        for tenant, overlay in self._overlays.items():
+            self._lexicons[tenant] = base.merged(overlay)
+        self._matchers = {
+            (tenant, category): TermMatcher(lexicon.terms(category))
+            for tenant, lexicon in self._lexicons.items()
+            for category in CATEGORIES
+        }
+    
+    @property
+    def tenants(self) -> Tuple[str, ...]:
+        """Tenants with an overlay"""
+        return tuple(sorted(tenant for tenant in self._lexicons if tenant is not None))
+    
+    def lexicon(self, tenant: Optional[str] = None) -> Lexicon:
+        """Lexicon of a tenant (the base lexicon for tenants without an overlay)"""
+        return self._lexicons.get(tenant, self.base)
+    
+    def overlay(self, tenant: Optional[str]) -> Lexicon:
+        """Terms a tenant adds to the base lexicon (empty without an overlay)"""
+        return self._overlays.get(tenant) or Lexicon()
+    
+    def matcher(self, category: str, tenant: Optional[str] = None) -> TermMatcher:
+        """Compiled matcher for a category of a tenant's lexicon"""
+        if tenant not in self._lexicons:
+            tenant = None
+        return self._matchers[(tenant, category)]
+
+
+class LexiconSource(Protocol):
+    """Where lexicon terms are loaded from"""
+    
+    def fingerprint(self) -> str:
+        """Cheap value that changes whenever the lexicons change"""
+        ...
+    
+    def load(self) -> Tuple[Lexicon, Dict[str, Lexicon]]:
+        """Load the base lexicon and the overlay of each tenant"""
+        ...
+
+
+class LexiconRegistry:
+    """
+    Holds the current lexicon snapshot and reloads it when the source changes
+    
+    The built-in terms are always part of the base lexicon. Reloads run in
+    a worker thread and replace the snapshot in a single assignment, so
+    in-flight requests are never blocked and keep the snapshot they started
+    with. A failed reload keeps the previous snapshot.
+    """
+    
+    def __init__(
+        self,
+        defaults: Mapping[str, Iterable[str]],
+        source: Optional[LexiconSource] = None,
+    ):
+        self._defaults = Lexicon(defaults)
+        self._source = source
+        self._fingerprint: Optional[str] = None
+        self._reload_lock = threading.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._snapshot = LexiconSnapshot(self._defaults)
+    
+    @property
+    def snapshot(self) -> LexiconSnapshot:
+        """The current snapshot"""
+        return self._snapshot
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        Rebuild the snapshot if the source changed
+        
+        Args:
+            force: Rebuild even if the source fingerprint is unchanged
+        
+        Returns:
+            True if a new snapshot was installed
+        """
+        if self._source is None:
+            return False
+        with self._reload_lock:
+            fingerprint = self._source.fingerprint()
+            if not force and fingerprint == self._fingerprint:
+                return False
+            base, overlays = self._source.load()
+            snapshot = LexiconSnapshot(self._defaults.merged(base), overlays)
+            self._snapshot = snapshot
+            self._fingerprint = fingerprint
+        logger.info(
+            "lexicon.reloaded",
+            version=snapshot.base.version,
+            technical_terms=len(snapshot.base.terms(TECHNICAL_TERMS)),
+            proper_nouns=len(snapshot.base.terms(PROPER_NOUNS)),
+            tenants=len(snapshot.tenants),
+        )
+        return True
+    
+    def watch(self, interval: float) -> None:
+        """Start polling the source for changes every `interval` seconds"""
+        if self._watch_task is None and self._source is not None:
+            self._watch_task = asyncio.create_task(self._watch_loop(interval))
+    
+    async def shutdown(self) -> None:
+        """Stop polling the source"""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            await asyncio.gather(self._watch_task, return_exceptions=True)
+            self._watch_task = None
+    
+    async def _watch_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.reload)
+            except Exception as e:
+                logger.warning(
+                    "lexicon.reload.failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
@@ -0,0 +1,130 @@
+"""In-process progress events of transcriptions being processed"""
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+# Event names
+TRANSCRIBED = "transcribed"
+SUMMARY_SECTION = "summary.section"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TERMINAL_EVENTS = (COMPLETED, FAILED, CANCELLED)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Something that happened while processing a transcription"""
+    
+    event: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class _Topic:
+    """Events published so far for one transcription, and their subscribers"""
+    
+    __slots__ = ("history", "subscribers")
+    
+    def __init__(self):
+        self.history: List[ProgressEvent] = []
+        self.subscribers: Set[asyncio.Queue] = set()
+
+
+class ProgressChannel:
+    """
+    Publishes progress events per transcription to live subscribers
+    
+    Events of a job in progress are kept until its terminal event
+    (completed, failed or cancelled), so a client subscribing late first receives what
+    it missed. Subscriptions end after the terminal event. Events only
+    reach subscribers in the process that runs the job.
+    
+    Args:
+        max_history: Events kept per transcription for late subscribers
+    """
+    
+    def __init__(self, max_history: int = 64):
+        self._max_history = max_history
+        self._topics: Dict[UUID, _Topic] = {}
+    
+    def is_open(self, transcription_id: UUID) -> bool:
+        """Check whether events are being published for a transcription"""
+        return transcription_id in self._topics
+    
+    def publish(self, transcription_id: UUID, event: str, **data: Any) -> None:
+        """
+        Publish an event to the transcription's subscribers
+        
+        A terminal event closes the transcription's topic.
+        
+        Args:
+            transcription_id: ID of the transcription
+            event: Event name
+            **data: Event payload
+        """
+        topic = self._topics.setdefault(transcription_id, _Topic())
+        progress = ProgressEvent(event=event, data=data)
+        if len(topic.history) < self._max_history:
+            topic.history.append(progress)
+        for queue in topic.subscribers:
+            queue.put_nowait(progress)
+        if event in TERMINAL_EVENTS:
+            del self._topics[transcription_id]
+    
+    def subscribe(self, transcription_id: UUID) -> "Subscription":
+        """
+        Start receiving the transcription's events
+        
+        The subscription is registered before this returns, so no event
+        published afterwards is missed. Close it when done.
+        
+        Args:
+            transcription_id: ID of the transcription
+        
+        Returns:
+            Subscription replaying the events already published
+        """
+        topic = self._topics.setdefault(transcription_id, _Topic())
+        subscription = Subscription(self, transcription_id, topic)
+        for progress in topic.history:
+            subscription.queue.put_nowait(progress)
+        topic.subscribers.add(subscription.queue)
+        return subscription
+    
+    def _unsubscribe(self, subscription: "Subscription") -> None:
+        topic = subscription.topic
+        topic.subscribers.discard(subscription.queue)
+        if not topic.subscribers and not topic.history:
+            # Nothing was published: do not keep an empty topic around
+            if self._topics.get(subscription.transcription_id) is topic:
+                del self._topics[subscription.transcription_id]
+
+
+class Subscription:
+    """Events of one transcription, received through a ProgressChannel"""
+    
+    def __init__(self, channel: ProgressChannel, transcription_id: UUID, topic: _Topic):
+        self.transcription_id = transcription_id
+        self.topic = topic
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._channel = channel
+    
+    async def next(self, timeout: Optional[float] = None) -> Optional[ProgressEvent]:
+        """
+        Wait for the next event
+        
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+        
+        Returns:
+            The event, or None if none arrived in time
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+    
+    def close(self) -> None:
+        """Stop receiving events"""
+        self._channel._unsubscribe(self)
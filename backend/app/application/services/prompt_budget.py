@@ -0,0 +1,134 @@
+"""Fitting transcripts into a prompt token budget"""
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from app.shared.tokens import TokenCounter
+
+# Prompt modes
+DIRECT = "direct"  # The whole transcript in one prompt
+TRIMMED = "trimmed"  # The middle of the transcript cut to fit one prompt
+MAP_REDUCE = "map_reduce"  # Parts summarized separately, then combined
+
+TRIM_MARKER = "\n[...]\n"
+
+_WORD = re.compile(r"\S+\s*")
+
+
+@dataclass(frozen=True)
+class PromptPlan:
+    """How a transcript is sent to the model"""
+    
+    mode: str
+    prompt_tokens: int  # Tokens of the prompt with the whole transcript
+    parts: Tuple[str, ...]  # Transcript text of each call (several only in map-reduce mode)
+
+
+class PromptBudget:
+    """
+    Chooses how a transcript is summarized within a prompt token budget
+    
+    A prompt that fits is sent as is. A transcript slightly over budget
+    (by at most `trim_tolerance` of its tokens) loses sentences from the
+    middle, keeping the opening and the conclusions. Anything larger is
+    split at sentence boundaries into parts that each fit, for map-reduce
+    summarization; a sentence too long for one call is split between words,
+    and a word too long for one call into token slices. Sentences are
+    counted once each, so planning is linear in the transcript length.
+    
+    Args:
+        counter: Token counter of the model
+        max_prompt_tokens: Largest prompt sent in one call
+        trim_tolerance: Share of a transcript that may be trimmed rather than
+            summarized in parts
+    """
+    
+    def __init__(self, counter: TokenCounter, max_prompt_tokens: int, trim_tolerance: float = 0.1):
+        self._counter = counter
+        self._max_prompt_tokens = max_prompt_tokens
+        self._trim_tolerance = trim_tolerance
+    
+    @property
+    def max_prompt_tokens(self) -> int:
+        """Largest prompt sent in one call"""
+        return self._max_prompt_tokens
+    
+    def plan(self, transcript: str, prompt_tokens: int, map_reduce: bool = True) -> PromptPlan:
+        """
+        Plan the calls for a transcript
+        
+        Args:
+            transcript: Transcript to summarize
+            prompt_tokens: Tokens of the complete prompt built around it
+            map_reduce: Allow splitting; when False an oversized transcript
+                is always trimmed
+        
+        Returns:
+            Prompt mode and the transcript text of each call
+        
+        Raises:
+            ValueError: If the prompt without any transcript exceeds the budget
+        """
+        if prompt_tokens <= self._max_prompt_tokens:
+            return PromptPlan(DIRECT, prompt_tokens, (transcript,))
+        
+        sentences = self._counter.sentences(transcript)
+        transcript_tokens = sum(tokens for _, tokens in sentences)
+        overhead = max(0, prompt_tokens - transcript_tokens)
+        available = self._max_prompt_tokens - overhead
+        if available <= 0:
+            raise ValueError(
+                f"Prompt template needs {overhead} tokens, over the budget of {self._max_prompt_tokens}"
+            )
+        
+        # No piece may exceed what a call can take; long sentences are split
+        # anyway so that trimming keeps more than a few of them
+        pieces = list(self._pieces(sentences, min(available, max(1, self._max_prompt_tokens // 4))))
+        
+        if not map_reduce or transcript_tokens - available <= transcript_tokens * self._trim_tolerance:
+            return PromptPlan(TRIMMED, prompt_tokens, (self._trim(pieces, available),))
+        return PromptPlan(MAP_REDUCE, prompt_tokens, tuple(self._split(pieces, available)))
+    
+    def _pieces(self, sentences: List[Tuple[str, int]], max_tokens: int) -> Iterator[Tuple[str, int]]:
+        """Sentences of at most `max_tokens`; larger ones split into words, then token slices"""
+        for sentence, tokens in sentences:
+            if tokens <= max_tokens:
+                yield sentence, tokens
+                continue
+            for match in _WORD.finditer(sentence):
+                word = match.group()
+                tokens = self._counter.count(word)
+                if tokens <= max_tokens:
+                    yield word, tokens
+                else:
+                    yield from self._counter.slices(word, max_tokens)
+    
+    def _trim(self, sentences: List[Tuple[str, int]], available: int) -> str:
+        """Opening and closing sentences that fit together, around a marker"""
+        budget = available - self._counter.count(TRIM_MARKER)
+        head_end, used = 0, 0
+        while head_end < len(sentences) and used + sentences[head_end][1] <= budget // 2:
+            used += sentences[head_end][1]
+            head_end += 1
+        tail_start = len(sentences)
+        while tail_start > head_end and used + sentences[tail_start - 1][1] <= budget:
+            tail_start -= 1
+            used += sentences[tail_start][1]
+        
+        head = "".join(sentence for sentence, _ in sentences[:head_end])
+        tail = "".join(sentence for sentence, _ in sentences[tail_start:])
+        return head.rstrip() + TRIM_MARKER + tail.lstrip()
+    
+    @staticmethod
+    def _split(sentences: List[Tuple[str, int]], available: int) -> Iterator[str]:
+        """Consecutive sentences grouped into parts of at most `available` tokens"""
+        part: List[str] = []
+        used = 0
+        for sentence, tokens in sentences:
+            if part and used + tokens > available:
+                yield "".join(part).strip()
+                part, used = [], 0
+            part.append(sentence)
+            used += tokens
+        if part:
+            yield "".join(part).strip()
@@ -0,0 +1,231 @@
+"""Background refresh of summaries generated with outdated prompts"""
+import asyncio
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.application.services.job_scheduler import JobPriority, set_job_priority
+from app.domain.exceptions.domain_exceptions import InvalidStatusTransitionError
+from app.domain.exceptions.validation_exceptions import SummarizationProviderError
+from app.domain.interfaces.summarization_provider import SummarizationProvider
+from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.shared.logging import get_logger
+
+# Job states
+IDLE = "idle"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+STOPPED = "stopped"
+
+
+@dataclass(frozen=True)
+class ResummarizationProgress:
+    """Progress of a re-summarization run"""
+    
+    state: str
+    prompt_version: str
+    total: int = 0  # Outdated summaries when the run started
+    processed: int = 0
+    refreshed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    
+    @property
+    def remaining(self) -> int:
+        """Outdated summaries not yet processed (estimate)"""
+        return max(0, self.total - self.processed)
+
+
+class ResummarizationJob:
+    """
+    Regenerates summaries whose prompt version is not the current one
+    
+    Outdated summaries are found with keyset scans over the summaries'
+    transcription IDs, and each is regenerated from the transcript already
+    stored; audio is never transcribed again. Calls are paced to
+    `rate_per_minute` and made as batch-priority work, so the summarization
+    router keeps its reserved headroom for interactive jobs. Transcriptions
+    queued or being processed are skipped, since the pipeline writes them a
+    fresh summary anyway.
+    
+    Args:
+        transcription_repo: Repository of the transcripts and summaries
+        summarization_provider: Provider generating the new summaries
+        prompt_version: Current prompt version
+        rate_per_minute: Maximum summaries regenerated per minute
+        page_size: Transcription IDs read per keyset scan
+    """
+    
+    def __init__(
+        self,
+        transcription_repo: TranscriptionRepository,
+        summarization_provider: SummarizationProvider,
+        prompt_version: str,
+        rate_per_minute: float = 30.0,
+        page_size: int = 100,
+        logger=None,
+    ):
+        self._repo = transcription_repo
+        self._provider = summarization_provider
+        self._prompt_version = prompt_version
+        self._interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._page_size = page_size
+        self._logger = logger or get_logger(__name__)
+        self._progress = ResummarizationProgress(state=IDLE, prompt_version=prompt_version)
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def progress(self) -> ResummarizationProgress:
+        """Progress of the current or last run"""
+        return self._progress
+    
+    @property
+    def is_running(self) -> bool:
+        """Check whether a run is in progress"""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> bool:
+        """
+        Start a run in the background
+        
+        Returns:
+            False if a run is already in progress
+        """
+        if self.is_running:
+            return False
+        self._task = asyncio.create_task(self.run())
+        return True
+    
+    async def stop(self) -> None:
+        """Stop the background run, keeping the summaries refreshed so far"""
+        if self.is_running:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+    
+    async def run(self) -> ResummarizationProgress:
+        """
+        Refresh every outdated summary
+        
+        Returns:
+            Final progress of the run
+        """
+        set_job_priority(JobPriority.BATCH)
+        total = await self._repo.count_outdated_summaries(self._prompt_version)
+        self._progress = ResummarizationProgress(
+            state=RUNNING,
+            prompt_version=self._prompt_version,
+            total=total,
+            started_at=datetime.utcnow(),
+        )
+        self._logger.info(
+            "resummarization.started",
+            prompt_version=self._prompt_version,
+            outdated=total,
+        )
+        
+        loop = asyncio.get_running_loop()
+        try:
+            after: Optional[UUID] = None
+            while True:
+                page = await self._repo.list_outdated_summaries(
+                    self._prompt_version,
+                    limit=self._page_size,
+                    after=after,
+                )
+                if not page:
+                    break
+                after = page[-1]
+                for transcription_id in page:
+                    started = loop.time()
+                    outcome = await self._refresh(transcription_id)
+                    self._count(outcome)
+                    await asyncio.sleep(max(0.0, self._interval - (loop.time() - started)))
+                self._log_progress("resummarization.progress")
+        except asyncio.CancelledError:
+            self._finish(STOPPED)
+            self._log_progress("resummarization.stopped")
+            raise
+        except Exception as e:
+            self._finish(FAILED, error=str(e))
+            self._logger.error(
+                "resummarization.failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return self._progress
+        
+        self._finish(COMPLETED)
+        self._log_progress("resummarization.completed")
+        return self._progress
+    
+    async def _refresh(self, transcription_id: UUID) -> str:
+        """Regenerate one summary; returns "refreshed", "failed" or "skipped" """
+        transcription = await self._repo.get_by_id(transcription_id)
+        if not transcription.transcript_text or transcription.status in (
+            ProcessingStatus.PENDING,
+            ProcessingStatus.PROCESSING,
+        ):
+            return "skipped"
+        
+        try:
+            summary = await self._provider.summarize(
+                transcript=transcription.transcript_text,
+                transcription_id=transcription_id,
+                language="sw",
+            )
+        except SummarizationProviderError as e:
+            self._logger.warning(
+                "resummarization.summary.failed",
+                transcription_id=str(transcription_id),
+                error=str(e),
+            )
+            if e.rate_limited:
+                # Every model is throttled: give them time before the next call
+                await asyncio.sleep(e.retry_after or self._interval)
+            return "failed"
+        
+        # Re-read so a job started meanwhile is not overwritten
+        transcription = await self._repo.get_by_id(transcription_id)
+        try:
+            transcription.complete_with_summary(summary)
+        except InvalidStatusTransitionError:
+            return "skipped"
+        await self._repo.update(transcription)
+        return "refreshed"
+    
+    def _count(self, outcome: str) -> None:
+        progress = self._progress
+        self._progress = replace(
+            progress,
+            processed=progress.processed + 1,
+            refreshed=progress.refreshed + (outcome == "refreshed"),
+            failed=progress.failed + (outcome == "failed"),
+            skipped=progress.skipped + (outcome == "skipped"),
+        )
+    
+    def _finish(self, state: str, error: Optional[str] = None) -> None:
+        self._progress = replace(
+            self._progress,
+            state=state,
+            finished_at=datetime.utcnow(),
+            error=error,
+        )
+    
+    def _log_progress(self, event: str) -> None:
+        progress = self._progress
+        self._logger.info(
+            event,
+            prompt_version=progress.prompt_version,
+            total=progress.total,
+            processed=progress.processed,
+            refreshed=progress.refreshed,
+            failed=progress.failed,
+            skipped=progress.skipped,
+        )
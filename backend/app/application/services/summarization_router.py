@@ -0,0 +1,190 @@
+"""Summarization model routing by transcript size, load and job priority"""
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from app.application.services.job_scheduler import JobPriority, current_job_priority
+from app.domain.entities.summary import Summary
+from app.domain.exceptions.validation_exceptions import SummarizationProviderError
+from app.domain.interfaces.summarization_provider import SectionCallback, SummarizationProvider
+from app.shared.logging import get_logger
+from app.shared.metrics import SUMMARIZATION_ROUTED_TOTAL
+from app.shared.tokens import TokenCounter
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """
+    A model in the routing table
+    
+    Args:
+        model: Model name (recorded on the summaries it serves)
+        provider: Provider calling the model
+        max_input_tokens: Largest transcript, in tokens, routed to the model
+        max_concurrency: Calls in flight before the model counts as saturated
+            (the provider should cap its own API calls to the same number)
+    """
+    
+    model: str
+    provider: SummarizationProvider
+    max_input_tokens: int
+    max_concurrency: int = 4
+
+
+class _ModelState:
+    """Live load of a route: calls in flight and rate-limit cooldown"""
+    
+    __slots__ = ("in_flight", "cooldown_until")
+    
+    def __init__(self):
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+
+
+class SummarizationRouter(SummarizationProvider):
+    """
+    Picks a summarization model per call from a routing table
+    
+    Routes are listed in preference order (typically fastest or cheapest
+    first). A call goes to the first route that fits the transcript and
+    has headroom: fewer calls in flight than its concurrency limit and no
+    rate-limit cooldown. Batch jobs additionally leave
+    `reserved_interactive` calls of headroom free for interactive work.
+    When no route has headroom, the least loaded fitting route is used.
+    
+    Transient failures (429, 5xx, timeouts) fall through to the next
+    fitting route; a 429 also puts the model in cooldown for its
+    Retry-After (or `cooldown_seconds`). The serving model is recorded on
+    the returned summary.
+    """
+    
+    def __init__(
+        self,
+        routes: Sequence[ModelRoute],
+        reserved_interactive: int = 1,
+        cooldown_seconds: float = 30.0,
+        logger=None,
+    ):
+        if not routes:
+            raise ValueError("At least one summarization route is required")
+        self._routes = list(routes)
+        self._reserved_interactive = reserved_interactive
+        self._cooldown_seconds = cooldown_seconds
+        self._state: Dict[str, _ModelState] = {route.model: _ModelState() for route in routes}
+        self._counter = TokenCounter()
+        self._logger = logger or get_logger(__name__)
+    
+    def headroom(self, model: str) -> int:
+        """Calls the model can take before reaching its limit (0 while cooling down)"""
+        state = self._state[model]
+        if state.cooldown_until > time.monotonic():
+            return 0
+        route = next(route for route in self._routes if route.model == model)
+        return max(0, route.max_concurrency - state.in_flight)
+    
+    def candidates(self, tokens: int, priority: JobPriority) -> List[ModelRoute]:
+        """
+        Routes to try for a call, best first
+        
+        Args:
+            tokens: Transcript size in tokens
+            priority: Priority class of the job
+        
+        Returns:
+            Fitting routes: those with headroom in table order, then the
+            rest from most to least headroom
+        """
+        fitting = [route for route in self._routes if route.max_input_tokens >= tokens]
+        if not fitting:
+            # Nothing fits: the largest context is the best chance
+            fitting = sorted(self._routes, key=lambda route: route.max_input_tokens, reverse=True)
+        
+        required = 1
+        if priority == JobPriority.BATCH:
+            required += self._reserved_interactive
+        
+        headroom = {route.model: self.headroom(route.model) for route in fitting}
+        available = [route for route in fitting if headroom[route.model] >= required]
+        saturated = sorted(
+            (route for route in fitting if headroom[route.model] < required),
+            key=lambda route: headroom[route.model],
+            reverse=True,
+        )
+        return available + saturated
+    
+    async def summarize(
+        self,
+        transcript: str,
+        transcription_id: UUID,
+        language: str = "sw",
+        on_section: Optional[SectionCallback] = None,
+    ) -> Summary:
+        """
+        Summarize with the best available model, falling back on transient errors
+        
+        Args:
+            transcript: Transcript text to summarize
+            transcription_id: ID of the transcription
+            language: Language code (default: "sw" for Swahili)
+            on_section: Passed on to the serving provider; after a fallback,
+                sections streamed by the failed model are sent again
+        
+        Returns:
+            Summary entity, with the serving model recorded
+        
+        Raises:
+            SummarizationProviderError: If every fitting model failed, or on
+                a non-transient failure
+        """
+        tokens = self._counter.count(transcript)
+        priority = current_job_priority()
+        if priority is None:
+            priority = JobPriority.STANDARD
+        routes = self.candidates(tokens, priority)
+        
+        error: Optional[SummarizationProviderError] = None
+        for attempt, route in enumerate(routes):
+            state = self._state[route.model]
+            state.in_flight += 1
+            try:
+                summary = await route.provider.summarize(
+                    transcript=transcript,
+                    transcription_id=transcription_id,
+                    language=language,
+                    on_section=on_section,
+                )
+            except SummarizationProviderError as e:
+                if not e.retryable:
+                    raise
+                if e.rate_limited:
+                    cooldown = e.retry_after or self._cooldown_seconds
+                    state.cooldown_until = time.monotonic() + cooldown
+                self._logger.warning(
+                    "summarization.route.failed",
+                    transcription_id=str(transcription_id),
+                    model=route.model,
+                    attempt=attempt + 1,
+                    error=str(e),
+                )
+                error = e
+                continue
+            finally:
+                state.in_flight -= 1
+            
+            summary.model = summary.model or route.model
+            SUMMARIZATION_ROUTED_TOTAL.labels(
+                model=route.model,
+                route="primary" if attempt == 0 else "fallback",
+            ).inc()
+            self._logger.info(
+                "summarization.routed",
+                transcription_id=str(transcription_id),
+                model=route.model,
+                priority=priority.name.lower(),
+                transcript_tokens=tokens,
+                attempts=attempt + 1,
+            )
+            return summary
+        
+        raise error
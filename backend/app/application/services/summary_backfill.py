@@ -0,0 +1,182 @@
+"""Offline re-summarization of stored transcripts through batch files"""
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Sequence, Set
+from uuid import UUID
+
+from app.domain.exceptions.domain_exceptions import InvalidStatusTransitionError
+from app.domain.interfaces.batch_summarization_provider import BatchSummarizationProvider
+from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.summary_batch import BatchState
+from app.shared.logging import get_logger
+
+
+@dataclass
+class BackfillReport:
+    """Counts of a backfill run"""
+    
+    batches: int = 0
+    submitted: int = 0
+    summarized: int = 0
+    failed: int = 0
+    skipped: int = 0
+    oversized: int = 0  # Too large for one request; left to realtime summarization
+
+
+class SummaryBackfill:
+    """
+    Summarizes many stored transcripts through a batch provider
+    
+    Transcripts are packed into batches of `batch_size` requests, all
+    batches are submitted up front, and each is polled until it finishes;
+    its summaries are then written in one transaction. Nothing goes through
+    the job scheduler or the realtime summarization models, so a backfill
+    never takes capacity from interactive work.
+    
+    Transcriptions queued or being processed when results arrive are left
+    to the pipeline and counted as skipped. Transcripts the provider cannot
+    summarize in one request are not submitted; they are logged and counted
+    as oversized, for the realtime (map-reduce) path.
+    
+    Args:
+        transcription_repo: Repository the transcripts are read from and
+            the summaries written to
+        provider: Batch summarization provider
+        batch_size: Requests per batch
+        poll_interval_seconds: Wait between polls of unfinished batches
+    """
+    
+    def __init__(
+        self,
+        transcription_repo: TranscriptionRepository,
+        provider: BatchSummarizationProvider,
+        batch_size: int = 1000,
+        poll_interval_seconds: float = 60.0,
+        logger=None,
+    ):
+        self._repo = transcription_repo
+        self._provider = provider
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._logger = logger or get_logger(__name__)
+    
+    async def run(
+        self,
+        transcription_ids: Optional[Sequence[UUID]] = None,
+        limit: Optional[int] = None,
+    ) -> BackfillReport:
+        """
+        Summarize transcriptions and store their summaries
+        
+        Args:
+            transcription_ids: Transcriptions to (re-)summarize; by default,
+                every transcription with a transcript but no summary
+            limit: Maximum number of transcriptions to submit
+        
+        Returns:
+            Counts of submitted, summarized, failed and skipped transcriptions
+        """
+        report = BackfillReport()
+        pending: Set[str] = set()
+        
+        async for chunk in self._chunks(transcription_ids, limit):
+            transcriptions = await self._repo.get_many(chunk)
+            requests = []
+            for transcription in transcriptions:
+                if not transcription.transcript_text:
+                    report.skipped += 1
+                elif not self._provider.accepts(transcription.transcript_text):
+                    report.oversized += 1
+                    self._logger.warning(
+                        "summary_backfill.transcript.oversized",
+                        transcription_id=str(transcription.id),
+                    )
+                else:
+                    requests.append((transcription.id, transcription.transcript_text))
+            report.skipped += len(chunk) - len(transcriptions)  # Deleted meanwhile
+            if not requests:
+                continue
+            pending.add(await self._provider.submit(requests))
+            report.batches += 1
+            report.submitted += len(requests)
+        
+        while pending:
+            await asyncio.sleep(self._poll_interval_seconds)
+            for batch_id in sorted(pending):
+                state = await self._provider.poll(batch_id)
+                if state.finished:
+                    pending.discard(batch_id)
+                    await self._store_results(state, report)
+        
+        self._logger.info(
+            "summary_backfill.completed",
+            batches=report.batches,
+            submitted=report.submitted,
+            summarized=report.summarized,
+            failed=report.failed,
+            skipped=report.skipped,
+            oversized=report.oversized,
+        )
+        return report
+    
+    async def _chunks(
+        self,
+        transcription_ids: Optional[Sequence[UUID]],
+        limit: Optional[int],
+    ) -> AsyncIterator[List[UUID]]:
+        """Transcription IDs to submit, a batch at a time"""
+        if transcription_ids is not None:
+            ids = list(dict.fromkeys(transcription_ids))[:limit]
+            for start in range(0, len(ids), self._batch_size):
+                yield ids[start:start + self._batch_size]
+            return
+        
+        after: Optional[UUID] = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = self._batch_size if remaining is None else min(remaining, self._batch_size)
+            chunk = await self._repo.list_awaiting_summary(limit=size, after=after)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            after = chunk[-1]
+            yield chunk
+    
+    async def _store_results(self, state: BatchState, report: BackfillReport) -> None:
+        """Write the summaries of a finished batch and count its outcomes"""
+        results = await self._provider.results(state.id)
+        summaries = {result.transcription_id: result.summary for result in results if result.summary}
+        
+        for result in results:
+            if result.summary is None:
+                self._logger.warning(
+                    "summary_backfill.request.failed",
+                    batch_id=state.id,
+                    transcription_id=str(result.transcription_id),
+                    error=result.error,
+                )
+        # Requests without any outcome (expired or cancelled batch) failed too
+        report.failed += max(len(results), state.total) - len(summaries)
+        
+        transcriptions = await self._repo.get_many(list(summaries))
+        report.skipped += len(summaries) - len(transcriptions)  # Deleted meanwhile
+        updated = []
+        for transcription in transcriptions:
+            try:
+                transcription.complete_with_summary(summaries[transcription.id])
+            except (InvalidStatusTransitionError, ValueError):
+                report.skipped += 1
+                continue
+            updated.append(transcription)
+        if updated:
+            await self._repo.update_many(updated)
+        report.summarized += len(updated)
+        
+        self._logger.info(
+            "summary_backfill.batch.stored",
+            batch_id=state.id,
+            status=state.status,
+            summarized=len(updated),
+            failed=len(results) - len(summaries),
+        )
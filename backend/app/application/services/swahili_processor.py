@@ -1,12 +1,21 @@
 """Swahili-specific text processing"""
+import html
 import re
-from typing import Set
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.application.services import lexicon
+from app.application.services.language_identifier import LanguageAnalysis, LanguageIdentifier
+from app.application.services.lexicon import LexiconRegistry, LexiconSnapshot
+from app.application.services.term_matcher import TermMatch
+from app.application.services.transcript_cleaner import CleanedTranscript, TranscriptCleaner
 
 
 class SwahiliProcessor:
     """Handles Swahili-specific text processing"""
     
-    # Technical terms that should be preserved in English
+    # Built-in technical terms that should be preserved in English
+    # (extended at runtime by the loaded lexicons)
     TECHNICAL_TERMS: Set[str] = {
         "deployment",
         "api",
@@ -61,20 +70,215 @@ class SwahiliProcessor:
         "android",
     }
     
-    # Common proper nouns that should be preserved
+    # Built-in proper nouns that should be preserved, in their usual spelling
     COMMON_PROPER_NOUNS: Set[str] = {
-        "tanzania",
-        "kenya",
-        "uganda",
-        "dar es salaam",
-        "nairobi",
-        "kampala",
-        "dodoma",
-        "arusha",
-        "mwanza",
-        "zanzibar",
+        "Tanzania",
+        "Kenya",
+        "Uganda",
+        "Dar es Salaam",
+        "Nairobi",
+        "Kampala",
+        "Dodoma",
+        "Arusha",
+        "Mwanza",
+        "Zanzibar",
+    }
+    
+    # Built-in hesitation sounds dropped from transcripts (discourse words
+    # such as "yaani" or "sasa" carry meaning and are left to the lexicons)
+    FILLER_WORDS: Set[str] = {
+        "eeh",
+        "ehh",
+        "eee",
+        "aah",
+        "ahh",
+        "mmh",
+        "mhm",
+        "mm",
+        "mmm",
+        "hmm",
+        "hmmm",
+        "umm",
+        "um",
+        "uh",
+        "uhm",
+        "erm",
+    }
+    
+    # Share of segments in the non-dominant language (or mixed) from which
+    # a transcript counts as code-switched
+    MIN_CODE_SWITCHING_RATIO = 0.05
+    
+    _language_identifier = LanguageIdentifier()
+    _lexicons = LexiconRegistry({
+        lexicon.TECHNICAL_TERMS: TECHNICAL_TERMS,
+        lexicon.PROPER_NOUNS: COMMON_PROPER_NOUNS,
+        lexicon.FILLER_WORDS: FILLER_WORDS,
+    })
+    _transcript_cleaner = TranscriptCleaner()
+    
+    # Function words dropped from search documents and queries
+    SEARCH_STOPWORDS: Set[str] = {
+        "na", "ya", "wa", "za", "la", "cha", "vya", "kwa", "ni", "si",
+        "katika", "kuhusu", "hii", "hiyo", "huo", "hizo", "ile", "hapa",
+        "pia", "lakini", "au", "kama", "sana", "tu", "yetu", "wetu",
+        "the", "a", "an", "of", "and", "to", "in", "is", "for", "on",
+        "we", "where", "about", "that", "this", "with", "at",
     }
     
+    # Subject + tense/aspect verb prefixes (e.g. tu-ta-jadili, a-li-sema)
+    _VERB_PREFIX = re.compile(
+        r"^(?:ni|u|a|tu|mu|m|wa|ki|vi|li|ya|i|zi)(?:ngali|nge|mesha|na|li|ta|me|ki|ka|sha)"
+        r"(?=[a-z]{4,}$)"
+    )
+    _INFINITIVE_PREFIX = re.compile(r"^ku(?=[a-z]{4,}$)")
+    _WORD = re.compile(r"[^\W_]+(?:['\u2019][^\W_]+)*")
+    
+    @classmethod
+    def use_lexicons(cls, registry: LexiconRegistry) -> None:
+        """Replace the built-in lexicons with a (reloadable) registry"""
+        cls._lexicons = registry
+    
+    @classmethod
+    def lexicons(cls) -> LexiconSnapshot:
+        """The current lexicon snapshot"""
+        return cls._lexicons.snapshot
+    
+    @classmethod
+    def use_transcript_cleaner(cls, cleaner: TranscriptCleaner) -> None:
+        """Replace the default transcript post-processing configuration"""
+        cls._transcript_cleaner = cleaner
+    
+    @classmethod
+    def clean_transcript(cls, text: str, tenant: Optional[str] = None) -> CleanedTranscript:
+        """
+        Post-process a raw transcript before it is stored and summarized
+        
+        Drops filler words, collapses phrases repeated in a loop and
+        normalizes whitespace (see TranscriptCleaner).
+        
+        Args:
+            text: Transcript as returned by the transcription provider
+            tenant: Tenant whose filler lexicon overlay applies
+        
+        Returns:
+            Cleaned transcript with the tokens saved
+        """
+        cleaner = cls._transcript_cleaner
+        fillers = None
+        if cleaner.removes_fillers:
+            fillers = cls.lexicons().matcher(lexicon.FILLER_WORDS, tenant)
+        return cleaner.clean(text, fillers)
+    
+    @classmethod
+    def normalize_search_term(cls, word: str) -> str:
+        """
+        Normalize a word to its search form
+        
+        Folds case and diacritics, drops apostrophes (ng'ombe -> ngombe)
+        and strips common verb prefixes so inflected forms share a stem
+        (tutajadili, walijadili, kujadili -> jadili). Technical terms are
+        kept as-is.
+        
+        Args:
+            word: Single word to normalize
+        
+        Returns:
+            Normalized term (may be empty)
+        """
+        decomposed = unicodedata.normalize("NFKD", word.lower())
+        term = "".join(
+            char for char in decomposed
+            if char.isalnum() and not unicodedata.combining(char)
+        )
+        if term in cls.TECHNICAL_TERMS:
+            return term
+        term = cls._VERB_PREFIX.sub("", term)
+        return cls._INFINITIVE_PREFIX.sub("", term)
+    
+    @classmethod
+    def search_terms(cls, text: Optional[str]) -> List[str]:
+        """
+        Tokenize and normalize text for the full-text search index
+        
+        Args:
+            text: Text to tokenize
+        
+        Returns:
+            Normalized terms in document order, without stopwords
+        """
+        if not text:
+            return []
+        terms = []
+        for match in cls._WORD.finditer(text):
+            if match.group().lower() in cls.SEARCH_STOPWORDS:
+                continue
+            term = cls.normalize_search_term(match.group())
+            if len(term) >= 2:
+                terms.append(term)
+        return terms
+    
+    @classmethod
+    def search_snippet(
+        cls,
+        text: Optional[str],
+        terms: Iterable[str],
+        max_words: int = 30,
+    ) -> Optional[str]:
+        """
+        Build a highlighted snippet around the first matching words
+        
+        Words whose search form starts with one of the query terms are
+        wrapped in <mark> tags; the rest of the text is HTML-escaped.
+        
+        Args:
+            text: Original (unnormalized) text
+            terms: Normalized query terms
+            max_words: Maximum number of words in the snippet
+        
+        Returns:
+            Snippet, or None if no word in the text matches
+        """
+        if not text:
+            return None
+        terms = tuple(terms)
+        words = list(cls._WORD.finditer(text))
+        matches = [
+            index for index, word in enumerate(words)
+            if cls.normalize_search_term(word.group()).startswith(terms)
+        ]
+        if not matches:
+            return None
+        
+        # Start a few words before the first match and favour the window
+        # containing the most matches
+        best_start, best_count = 0, -1
+        for first in matches:
+            start = max(0, first - 5)
+            count = sum(1 for index in matches if start <= index < start + max_words)
+            if count > best_count:
+                best_start, best_count = start, count
+        end = min(len(words), best_start + max_words)
+        matched = set(matches)
+        
+        parts = []
+        position = words[best_start].start()
+        for index in range(best_start, end):
+            word = words[index]
+            parts.append(html.escape(text[position:word.start()]))
+            if index in matched:
+                parts.append(f"<mark>{html.escape(word.group())}</mark>")
+            else:
+                parts.append(html.escape(word.group()))
+            position = word.end()
+        
+        snippet = " ".join("".join(parts).split())
+        if best_start > 0:
+            snippet = "… " + snippet
+        if end < len(words):
+            snippet += " …"
+        return snippet
+    
     @classmethod
     def preserve_technical_terms(cls, text: str) -> str:
         """
@@ -97,6 +301,19 @@ class SwahiliProcessor:
         # The actual preservation happens in the prompt instructions
         return text
     
+    @classmethod
+    def analyze_languages(cls, text: str) -> LanguageAnalysis:
+        """
+        Tag each sentence or line of the text as Swahili, English or mixed
+        
+        Args:
+            text: Text to analyze
+        
+        Returns:
+            Per-segment languages with the English and code-switching ratios
+        """
+        return cls._language_identifier.analyze(text)
+    
     @classmethod
     def detect_code_switching(cls, text: str) -> bool:
         """
@@ -108,82 +325,114 @@ class SwahiliProcessor:
         Returns:
             True if code-switching is detected
         """
-        # Simple heuristic: check for English words mixed with Swahili
-        # This is a basic implementation
-        
-        # Common English words that might appear in Swahili text
-        english_indicators = [
-            r'\bthe\b',
-            r'\bis\b',
-            r'\bto\b',
-            r'\bof\b',
-            r'\band\b',
-            r'\bin\b',
-            r'\bfor\b',
-            r'\bwith\b',
-            r'\bon\b',
-            r'\bat\b',
-        ]
+        analysis = cls.analyze_languages(text)
+        return analysis.code_switching_ratio >= cls.MIN_CODE_SWITCHING_RATIO
+    
+    @classmethod
+    def match_technical_terms(cls, text: str, tenant: Optional[str] = None) -> List[TermMatch]:
+        """
+        Find every technical term occurrence with its position
         
-        text_lower = text.lower()
-        english_count = sum(
-            1 for pattern in english_indicators
-            if re.search(pattern, text_lower, re.IGNORECASE)
-        )
+        Args:
+            text: Text to analyze
+            tenant: Tenant whose lexicon overlay applies
+        
+        Returns:
+            Matches in text order
+        """
+        return cls.lexicons().matcher(lexicon.TECHNICAL_TERMS, tenant).find_all(text)
+    
+    @classmethod
+    def count_technical_terms(cls, text: str, tenant: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count occurrences of each technical term
+        
+        Args:
+            text: Text to analyze
+            tenant: Tenant whose lexicon overlay applies
         
-        # If we find multiple English words, likely code-switching
-        return english_count >= 3
+        Returns:
+            Mapping of term to number of occurrences
+        """
+        return cls.lexicons().matcher(lexicon.TECHNICAL_TERMS, tenant).counts(text)
     
     @classmethod
-    def extract_technical_terms(cls, text: str) -> Set[str]:
+    def extract_technical_terms(cls, text: str, tenant: Optional[str] = None) -> Set[str]:
         """
         Extract technical terms from text
         
         Args:
             text: Text to analyze
+            tenant: Tenant whose lexicon overlay applies
         
         Returns:
             Set of technical terms found
         """
-        text_lower = text.lower()
-        found_terms = set()
+        return cls.lexicons().matcher(lexicon.TECHNICAL_TERMS, tenant).distinct(text)
+    
+    @classmethod
+    def extract_proper_nouns(cls, text: str, tenant: Optional[str] = None) -> Set[str]:
+        """
+        Extract known proper nouns (places, people, products) from text
         
-        for term in cls.TECHNICAL_TERMS:
-            # Check if term appears in text (as whole word)
-            pattern = r'\b' + re.escape(term) + r'\b'
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                found_terms.add(term)
+        Args:
+            text: Text to analyze
+            tenant: Tenant whose lexicon overlay applies
         
-        return found_terms
+        Returns:
+            Set of proper nouns found, lowercased
+        """
+        return cls.lexicons().matcher(lexicon.PROPER_NOUNS, tenant).distinct(text)
     
     @classmethod
-    def enhance_prompt_for_code_switching(cls, base_prompt: str, text: str) -> str:
+    def enhance_prompt_for_code_switching(
+        cls,
+        base_prompt: str,
+        text: str,
+        tenant: Optional[str] = None,
+    ) -> str:
         """
         Enhance prompt with code-switching instructions if detected
         
         Args:
             base_prompt: Base prompt template
             text: Text to analyze
+            tenant: Tenant whose lexicon overlay applies
         
         Returns:
             Enhanced prompt
         """
-        if cls.detect_code_switching(text):
-            # Extract technical terms found in the transcript
-            technical_terms = cls.extract_technical_terms(text)
-            
-            enhancement = (
-                "\n\nIMPORTANT: This transcript contains code-switching (Swahili + English). "
-                "Preserve all technical terms, project names, and English words exactly as they appear. "
-                "Do NOT translate technical terms or proper nouns."
-            )
-            
-            # Optionally add specific technical terms found
-            if technical_terms:
-                terms_list = ", ".join(sorted(technical_terms)[:10])  # Limit to first 10
-                enhancement += f"\n\nDetected technical terms to preserve: {terms_list}"
-            
-            return base_prompt + enhancement
-        
-        return base_prompt
-
+        analysis = cls.analyze_languages(text)
+        if analysis.code_switching_ratio < cls.MIN_CODE_SWITCHING_RATIO:
+            return base_prompt
+        
+        # Technical terms are looked up only in the segments that switch
+        # away from the transcript's main language
+        switched_text = "\n".join(
+            text[segment.start:segment.end]
+            for segment in analysis.segments
+            if segment.language != analysis.dominant_language
+        )
+        technical_terms = cls.extract_technical_terms(switched_text, tenant)
+        
+        enhancement = (
+            "\n\nIMPORTANT: This transcript contains code-switching (Swahili + English). "
+            "Preserve all technical terms, project names, and English words exactly as they appear. "
+            "Do NOT translate technical terms or proper nouns."
+            f" About {analysis.code_switching_ratio:.0%} of its sentences switch language."
+        )
+        
+        # Optionally add specific technical terms found
+        if technical_terms:
+            terms_list = ", ".join(sorted(technical_terms)[:10])  # Limit to first 10
+            enhancement += f"\n\nDetected technical terms to preserve: {terms_list}"
+        
+        # Known names, spelled as they first appear in the transcript
+        names: Dict[str, str] = {}
+        for match in cls.lexicons().matcher(lexicon.PROPER_NOUNS, tenant).finditer(text):
+            names.setdefault(match.term, text[match.start:match.end])
+        if names:
+            names_list = ", ".join(names[term] for term in sorted(names)[:10])
+            enhancement += f"\n\nDetected names to keep unchanged: {names_list}"
+        
+        return base_prompt + enhancement
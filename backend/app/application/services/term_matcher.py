@@ -0,0 +1,110 @@
+"""Single-pass matching of a term lexicon against text"""
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List
+
+
+@dataclass(frozen=True)
+class TermMatch:
+    """A lexicon term found in text"""
+    
+    term: str
+    start: int
+    end: int
+
+
+def _trie_pattern(node: dict) -> str:
+    """
+    Build a regex from a character trie
+    
+    Common prefixes are shared, so at each position of the text the regex
+    engine follows one branch per character instead of trying every term.
+    The end-of-term marker is the empty-string key.
+    """
+    terminal = "" in node
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+class TermMatcher:
+    """
+    Precompiled matcher finding every occurrence of a set of terms
+    
+    Terms are matched case-insensitively as whole words (not inside a
+    longer word) in a single left-to-right pass; where terms overlap the
+    longest one wins. Build once per lexicon and reuse.
+    """
+    
+    def __init__(self, terms: Iterable[str]):
+        self._terms = {term.strip().lower() for term in terms if term and term.strip()}
+        
+        trie: dict = {}
+        for term in self._terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        
+        body = _trie_pattern(trie)
+        self._pattern = (
+            re.compile(rf"(?<!\w)(?:{body})(?!\w)", re.IGNORECASE) if body else None
+        )
+    
+    def __len__(self) -> int:
+        return len(self._terms)
+    
+    def __contains__(self, term: str) -> bool:
+        return term.lower() in self._terms
+    
+    @property
+    def terms(self) -> frozenset:
+        """Lowercased terms of the lexicon"""
+        return frozenset(self._terms)
+    
+    def finditer(self, text: str) -> Iterator[TermMatch]:
+        """
+        Iterate over term occurrences in text order
+        
+        Args:
+            text: Text to scan
+        
+        Yields:
+            Matches with the lowercased term and its character span
+        """
+        if self._pattern is None or not text:
+            return
+        for match in self._pattern.finditer(text):
+            yield TermMatch(match.group().lower(), match.start(), match.end())
+    
+    def find_all(self, text: str) -> List[TermMatch]:
+        """All term occurrences in text order"""
+        return list(self.finditer(text))
+    
+    def counts(self, text: str) -> Dict[str, int]:
+        """Number of occurrences of each term found in text"""
+        return dict(Counter(match.term for match in self.finditer(text)))
+    
+    def distinct(self, text: str, limit: int = 0) -> set:
+        """
+        Distinct terms found in text
+        
+        Args:
+            text: Text to scan
+            limit: Stop scanning once this many distinct terms are found (0: no limit)
+        """
+        found = set()
+        for match in self.finditer(text):
+            found.add(match.term)
+            if limit and len(found) >= limit:
+                break
+        return found
@@ -0,0 +1,183 @@
+"""Transcript post-processing: filler words, repeated phrases and whitespace"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from app.application.services.term_matcher import TermMatcher
+from app.shared.tokens import count_tokens
+
+# Characters Whisper sometimes emits that render as nothing
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"))
+_TOKEN = re.compile(r"\S+")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+@dataclass(frozen=True)
+class CleanedTranscript:
+    """A post-processed transcript and what the cleanup saved"""
+    
+    text: str
+    tokens_before: int
+    tokens_after: int
+    fillers_removed: int = 0  # Filler words dropped
+    repeats_removed: int = 0  # Words dropped from repeated phrases
+    
+    @property
+    def tokens_saved(self) -> int:
+        """Prompt tokens saved by the cleanup"""
+        return max(0, self.tokens_before - self.tokens_after)
+
+
+class TranscriptCleaner:
+    """
+    Removes what inflates a transcript without adding meaning
+    
+    Three steps, each a single pass over the text:
+    
+    - filler words (eeh, mmh, ...) from the filler lexicon are dropped,
+      together with the comma or space that followed them;
+    - a phrase of up to `max_ngram` words repeated `min_repeats` or more
+      times in a row (Whisper's "Asante kwa kutazama" loops on silence) is
+      kept once. Words are compared without case and punctuation;
+    - whitespace is collapsed to single spaces, line ends are trimmed and
+      at most one blank line is kept between paragraphs.
+    
+    Repetition is found with one backward pass per phrase length, counting
+    how far each word keeps matching the word n positions ahead, so the
+    cost is linear in the number of words for a fixed `max_ngram`.
+    
+    Args:
+        remove_fillers: Drop filler words
+        max_ngram: Longest repeated phrase collapsed, in words (0 disables)
+        min_repeats: Consecutive occurrences from which a phrase is collapsed
+            (3 keeps intentional doubling such as "sawa sawa")
+        normalize_whitespace: Collapse whitespace and drop invisible characters
+    """
+    
+    def __init__(
+        self,
+        remove_fillers: bool = True,
+        max_ngram: int = 8,
+        min_repeats: int = 3,
+        normalize_whitespace: bool = True,
+    ):
+        self._remove_fillers = remove_fillers
+        self._max_ngram = max(0, max_ngram)
+        self._min_repeats = max(2, min_repeats)
+        self._normalize_whitespace = normalize_whitespace
+    
+    @property
+    def removes_fillers(self) -> bool:
+        """Whether filler words are dropped"""
+        return self._remove_fillers
+    
+    def clean(self, text: str, fillers: Optional[TermMatcher] = None) -> CleanedTranscript:
+        """
+        Post-process a transcript
+        
+        Args:
+            text: Transcript as returned by the transcription provider
+            fillers: Matcher of the filler words to drop
+        
+        Returns:
+            Cleaned text with its tokens before and after
+        """
+        tokens_before = count_tokens(text) if text else 0
+        if not text:
+            return CleanedTranscript(text=text, tokens_before=tokens_before, tokens_after=tokens_before)
+        
+        cleaned = text.translate(_INVISIBLE) if self._normalize_whitespace else text
+        fillers_removed = 0
+        if self._remove_fillers and fillers is not None and len(fillers):
+            cleaned, fillers_removed = self._drop_fillers(cleaned, fillers)
+        
+        repeats_removed = 0
+        if self._max_ngram or self._normalize_whitespace:
+            tokens = self._tokens(cleaned)
+            for n in range(1, self._max_ngram + 1):
+                if len(tokens) < n * self._min_repeats:
+                    break
+                kept = self._collapse_repeats(tokens, n)
+                repeats_removed += len(tokens) - len(kept)
+                tokens = kept
+            cleaned = self._join(tokens, cleaned)
+        
+        return CleanedTranscript(
+            text=cleaned,
+            tokens_before=tokens_before,
+            tokens_after=count_tokens(cleaned) if cleaned else 0,
+            fillers_removed=fillers_removed,
+            repeats_removed=repeats_removed,
+        )
+    
+    @staticmethod
+    def _drop_fillers(text: str, fillers: TermMatcher) -> Tuple[str, int]:
+        """Remove filler words with the separator that followed them"""
+        parts: List[str] = []
+        position = 0
+        removed = 0
+        for match in fillers.finditer(text):
+            start, end = match.start, match.end
+            if start < position:
+                continue
+            # "Sasa, eeh, tuanze" -> "Sasa, tuanze"; "tuanze eeh." -> "tuanze."
+            if end < len(text) and text[end] == ",":
+                end += 1
+            if end < len(text) and text[end].isspace():
+                while end < len(text) and text[end] in " \t":
+                    end += 1
+            else:
+                while start > position and text[start - 1] in " \t":
+                    start -= 1
+            parts.append(text[position:start])
+            position = end
+            removed += 1
+        if not removed:
+            return text, 0
+        parts.append(text[position:])
+        return "".join(parts), removed
+    
+    @staticmethod
+    def _tokens(text: str) -> List[Tuple[str, str, str]]:
+        """Words as (comparison key, word, whitespace before it)"""
+        tokens = []
+        position = 0
+        for match in _TOKEN.finditer(text):
+            word = match.group()
+            tokens.append((_NON_WORD.sub("", word).lower(), word, text[position:match.start()]))
+            position = match.end()
+        return tokens
+    
+    def _collapse_repeats(self, tokens: List[Tuple[str, str, str]], n: int) -> List[Tuple[str, str, str]]:
+        """Keep one copy of every n-word phrase repeated `min_repeats` times in a row"""
+        count = len(tokens)
+        # matching[i]: how many words from i on equal the word n positions ahead
+        matching = [0] * (count + 1)
+        for index in range(count - n - 1, -1, -1):
+            if tokens[index][0] == tokens[index + n][0]:
+                matching[index] = matching[index + 1] + 1
+        
+        kept = []
+        index = 0
+        min_matching = n * (self._min_repeats - 1)
+        while index < count:
+            if matching[index] >= min_matching:
+                copies = matching[index] // n + 1
+                kept.extend(tokens[index:index + n])
+                index += copies * n
+            else:
+                kept.append(tokens[index])
+                index += 1
+        return kept
+    
+    def _join(self, tokens: List[Tuple[str, str, str]], text: str) -> str:
+        """Rebuild the text from the kept words"""
+        if not self._normalize_whitespace:
+            return "".join(gap + word for _, word, gap in tokens) + text[len(text.rstrip()):]
+        parts = []
+        for position, (_, word, gap) in enumerate(tokens):
+            if position:
+                breaks = gap.count("\n")
+                parts.append("\n\n" if breaks > 1 else "\n" if breaks else " ")
+            parts.append(word)
+        return "".join(parts)
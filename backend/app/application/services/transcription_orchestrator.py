@@ -1,111 +1,314 @@
 """Transcription orchestrator service"""
+import asyncio
+import contextlib
+import functools
+from typing import AsyncContextManager, Callable, Optional
 from uuid import UUID
 
+from app.application.services import progress_channel
+from app.application.services.job_scheduler import JobScheduler
+from app.application.services.progress_channel import ProgressChannel
+from app.application.services.swahili_processor import SwahiliProcessor
 from app.domain.interfaces.file_storage import FileStorage
 from app.domain.interfaces.summarization_provider import SummarizationProvider
 from app.domain.interfaces.transcription_provider import TranscriptionProvider
 from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.processing_stage import ProcessingStage
 from app.shared.logging import get_logger
+from app.shared.metrics import (
+    JOBS_TOTAL,
+    PIPELINE_STAGE_SECONDS,
+    TRANSCRIPT_TOKENS_SAVED_TOTAL,
+    TRANSCRIPT_WORDS_REMOVED_TOTAL,
+)
+from app.shared.timing import timed
+from app.shared.tracing import span
 
 logger = get_logger(__name__)
 
 
 class TranscriptionOrchestrator:
-    """Orchestrates the transcription and summarization workflow"""
+    """
+    Orchestrates the transcription and summarization workflow
+    
+    Jobs run concurrently on the scheduler's workers, and a database session
+    must not be shared between tasks. With `repository_scope` every job
+    opens its own repository for the time it runs; a single
+    `transcription_repo` is only safe when jobs never overlap (tests).
+    """
     
     def __init__(
         self,
-        transcription_repo: TranscriptionRepository,
+        transcription_repo: Optional[TranscriptionRepository],
         transcription_provider: TranscriptionProvider,
         summarization_provider: SummarizationProvider,
         file_storage: FileStorage,
+        scheduler: Optional[JobScheduler] = None,
+        progress: Optional[ProgressChannel] = None,
+        deadline_min_seconds: float = 300.0,
+        deadline_per_audio_second: float = 1.0,
         logger=None,
+        repository_scope: Optional[Callable[[], AsyncContextManager[TranscriptionRepository]]] = None,
     ):
-        self._repo = transcription_repo
+        if repository_scope is None:
+            if transcription_repo is None:
+                raise ValueError("Either transcription_repo or repository_scope is required")
+            repository_scope = functools.partial(contextlib.nullcontext, transcription_repo)
+        self._repository_scope = repository_scope
         self._transcription_provider = transcription_provider
         self._summarization_provider = summarization_provider
         self._file_storage = file_storage
+        self._scheduler = scheduler or JobScheduler()
+        self._progress = progress
+        self._deadline_min_seconds = deadline_min_seconds
+        self._deadline_per_audio_second = deadline_per_audio_second
         self._logger = logger or get_logger(__name__)
     
-    async def process_transcription(self, transcription_id: UUID) -> None:
+    def enqueue(
+        self,
+        transcription_id: UUID,
+        origin: Optional[str] = None,
+        tenant: Optional[str] = None,
+        audio_duration_seconds: Optional[float] = None,
+    ) -> asyncio.Future:
+        """
+        Schedule a transcription for processing
+        
+        Args:
+            transcription_id: ID of transcription to process
+            origin: Upload origin, used to pick the job's priority class
+            tenant: Optional tenant key for fair scheduling
+            audio_duration_seconds: Audio duration, used to size the job deadline
+        
+        Returns:
+            Future resolved when processing finishes
+        """
+        deadline = self._deadline_min_seconds
+        if audio_duration_seconds:
+            deadline = max(deadline, audio_duration_seconds * self._deadline_per_audio_second)
+        
+        return self._scheduler.submit(
+            transcription_id,
+            functools.partial(self.process_transcription, deadline_seconds=deadline),
+            origin=origin,
+            tenant=tenant,
+        )
+    
+    async def cancel(self, transcription_id: UUID) -> bool:
+        """
+        Cancel queued or in-flight processing of a transcription
+        
+        Args:
+            transcription_id: ID of transcription to cancel
+        
+        Returns:
+            True if a queued or running job was cancelled
+        """
+        return await self._scheduler.cancel(transcription_id)
+    
+    def is_active(self, transcription_id: UUID) -> bool:
+        """Check whether a transcription is queued or being processed"""
+        return self._scheduler.is_scheduled(transcription_id)
+    
+    async def process_transcription(
+        self,
+        transcription_id: UUID,
+        deadline_seconds: Optional[float] = None,
+    ) -> None:
         """
         Process transcription: transcribe audio and generate summary
         
+        Stages already checkpointed by a previous attempt are skipped, so a
+        retry resumes at the first incomplete stage.
+        
         Args:
             transcription_id: ID of transcription to process
+            deadline_seconds: Optional time budget; in-flight calls are
+                cancelled and the job fails once it is exceeded
         """
+        async with self._repository_scope() as repo:
+            await self._process(repo, transcription_id, deadline_seconds)
+    
+    async def _process(
+        self,
+        repo: TranscriptionRepository,
+        transcription_id: UUID,
+        deadline_seconds: Optional[float],
+    ) -> None:
+        """Run the pipeline within the deadline and record its outcome"""
+        deadline = asyncio.timeout(deadline_seconds)
         try:
-            # Get transcription
-            transcription = await self._repo.get_by_id(transcription_id)
-            
-            # Mark as processing
-            transcription.mark_as_processing()
-            await self._repo.update(transcription)
-            
+            async with deadline:
+                with span("transcription.process", transcription_id=str(transcription_id)):
+                    await self._run_stages(repo, transcription_id)
+        
+        except asyncio.CancelledError:
+            JOBS_TOTAL.labels(outcome="cancelled").inc()
+            self._publish(transcription_id, progress_channel.CANCELLED)
+            # Cancelled by the user (status is set by the caller) or shutdown
             self._logger.info(
-                "transcription.processing.started",
+                "transcription.processing.cancelled",
                 transcription_id=str(transcription_id),
             )
-            
+            raise
+        
+        except TimeoutError as e:
+            JOBS_TOTAL.labels(outcome="timed_out" if deadline.expired() else "failed").inc()
+            if not deadline.expired():
+                await self._mark_as_failed(repo, transcription_id, e)
+                raise
+            error = TimeoutError(f"Processing deadline of {deadline_seconds:.0f}s exceeded")
+            await self._mark_as_failed(repo, transcription_id, error)
+            raise error from e
+        
+        except Exception as e:
+            JOBS_TOTAL.labels(outcome="failed").inc()
+            await self._mark_as_failed(repo, transcription_id, e)
+            raise
+        
+        JOBS_TOTAL.labels(outcome="completed").inc()
+        self._publish(transcription_id, progress_channel.COMPLETED)
+    
+    def _publish(self, transcription_id: UUID, event: str, **data) -> None:
+        """Publish a progress event, if anyone can listen"""
+        if self._progress is not None:
+            self._progress.publish(transcription_id, event, **data)
+    
+    @staticmethod
+    def _stage_timer(stage: str):
+        """Time a pipeline stage for metrics, the request's timings and traces"""
+        return timed(f"stage.{stage}", PIPELINE_STAGE_SECONDS.labels(stage=stage))
+    
+    async def _mark_as_failed(
+        self,
+        repo: TranscriptionRepository,
+        transcription_id: UUID,
+        error: Exception,
+    ) -> None:
+        """Log a processing failure and persist it on the transcription"""
+        # Application layer is the ONLY place to log errors
+        self._logger.error(
+            "transcription.processing.failed",
+            transcription_id=str(transcription_id),
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+        
+        # Mark as failed
+        transcription = await repo.get_by_id(transcription_id)
+        transcription.mark_as_failed(str(error))
+        await repo.update(transcription)
+        self._publish(transcription_id, progress_channel.FAILED, error=str(error))
+    
+    async def _run_stages(self, repo: TranscriptionRepository, transcription_id: UUID) -> None:
+        """Run every pipeline stage not yet checkpointed"""
+        # Get transcription
+        transcription = await repo.get_by_id(transcription_id)
+        
+        # Mark as processing
+        transcription.mark_as_processing()
+        await repo.update(transcription)
+        
+        self._logger.info(
+            "transcription.processing.started",
+            transcription_id=str(transcription_id),
+            resume_from=transcription.stage.value,
+        )
+        
+        if not transcription.has_reached(ProcessingStage.TRANSCRIBED):
             # Load audio file
-            audio_bytes = await self._file_storage.load(transcription.file_path)
+            with self._stage_timer("load_audio"):
+                audio_bytes = await self._file_storage.load(transcription.file_path)
             
             # Transcribe - pass filename so provider can use correct extension
-            transcript = await self._transcription_provider.transcribe(
-                audio_bytes,
-                language_hint="sw",
-                filename=transcription.filename,
-            )
-            
-            # Update with transcript
-            transcription.complete_with_transcript(transcript)
-            await self._repo.update(transcription)
+            with self._stage_timer("transcribe"):
+                transcript = await self._transcription_provider.transcribe(
+                    audio_bytes,
+                    language_hint="sw",
+                    filename=transcription.filename,
+                )
             
+            # Drop fillers, repetition loops and whitespace before anything is stored
+            with self._stage_timer("clean_transcript"):
+                cleaned = SwahiliProcessor.clean_transcript(transcript)
+            TRANSCRIPT_TOKENS_SAVED_TOTAL.inc(cleaned.tokens_saved)
+            TRANSCRIPT_WORDS_REMOVED_TOTAL.labels(step="filler").inc(cleaned.fillers_removed)
+            TRANSCRIPT_WORDS_REMOVED_TOTAL.labels(step="repeat").inc(cleaned.repeats_removed)
             self._logger.info(
-                "transcription.completed",
+                "transcript.cleaned",
                 transcription_id=str(transcription_id),
+                tokens_before=cleaned.tokens_before,
+                tokens_after=cleaned.tokens_after,
+                tokens_saved=cleaned.tokens_saved,
+                fillers_removed=cleaned.fillers_removed,
+                repeats_removed=cleaned.repeats_removed,
             )
             
-            # Summarize
-            summary = await self._summarization_provider.summarize(
-                transcript=transcript,
-                transcription_id=transcription_id,
-                language="sw",
-            )
+            # Checkpoint transcript before summarizing so a retry never re-transcribes
+            with self._stage_timer("save_transcript"):
+                transcription.complete_with_transcript(cleaned.text)
+                await repo.update(transcription)
             
-            # Log generated summary details before saving
             self._logger.info(
-                "summarization.generated",
+                "transcription.completed",
                 transcription_id=str(transcription_id),
-                summary_id=str(summary.id),
-                muhtasari_length=len(summary.muhtasari or ""),
-                maamuzi_count=len(summary.maamuzi or []),
-                kazi_count=len(summary.kazi or []),
-                masuala_count=len(summary.masuala_yaliyoahirishwa or []),
             )
-            
-            # Add summary
-            transcription.add_summary(summary)
-            await self._repo.update(transcription)
+            self._publish(transcription_id, progress_channel.TRANSCRIBED)
+        else:
+            # Resuming: reuse the persisted transcript
+            transcription.complete_with_transcript(transcription.transcript_text)
+            await repo.update(transcription)
             
             self._logger.info(
-                "transcription.processing.completed",
+                "transcription.stage.skipped",
                 transcription_id=str(transcription_id),
+                stage=ProcessingStage.TRANSCRIBED.value,
             )
         
-        except Exception as e:
-            # Application layer is the ONLY place to log errors
-            self._logger.error(
-                "transcription.processing.failed",
+        if transcription.has_reached(ProcessingStage.SUMMARIZED):
+            self._logger.info(
+                "transcription.stage.skipped",
                 transcription_id=str(transcription_id),
-                error=str(e),
-                error_type=type(e).__name__,
+                stage=ProcessingStage.SUMMARIZED.value,
             )
-            
-            # Mark as failed
-            transcription = await self._repo.get_by_id(transcription_id)
-            transcription.mark_as_failed(str(e))
-            await self._repo.update(transcription)
-            
-            raise
-
+            return
+        
+        # Summarize, passing sections on to listeners as they are generated
+        on_section = None
+        if self._progress is not None:
+            async def on_section(name, value):
+                self._publish(
+                    transcription_id,
+                    progress_channel.SUMMARY_SECTION,
+                    section=name,
+                    value=value,
+                )
+        
+        with self._stage_timer("summarize"):
+            summary = await self._summarization_provider.summarize(
+                transcript=transcription.transcript_text,
+                transcription_id=transcription_id,
+                language="sw",
+                on_section=on_section,
+            )
+        
+        # Log generated summary details before saving
+        self._logger.info(
+            "summarization.generated",
+            transcription_id=str(transcription_id),
+            summary_id=str(summary.id),
+            muhtasari_length=len(summary.muhtasari or ""),
+            maamuzi_count=len(summary.maamuzi or []),
+            kazi_count=len(summary.kazi or []),
+            masuala_count=len(summary.masuala_yaliyoahirishwa or []),
+        )
+        
+        # Add summary
+        with self._stage_timer("save_summary"):
+            transcription.add_summary(summary)
+            await repo.update(transcription)
+        
+        self._logger.info(
+            "transcription.processing.completed",
+            transcription_id=str(transcription_id),
+        )
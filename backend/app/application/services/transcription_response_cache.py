@@ -0,0 +1,252 @@
+"""Read-through cache of serialized transcript and summary responses"""
+import hashlib
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.domain.interfaces.response_cache import ResponseCache
+from app.shared.compression import CODECS, base_etag, encoded_etag
+from app.shared.logging import get_logger
+from app.shared.metrics import RESPONSE_CACHE_REQUESTS_TOTAL
+from app.shared.timing import timed
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response body, optionally content-encoded, with its strong ETag"""
+    
+    body: bytes
+    etag: str
+    encoding: Optional[str] = None
+    
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedResponse":
+        """Create a response, deriving the ETag from the body"""
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return cls(body=body, etag=f'"{digest}"')
+    
+    @property
+    def representation_etag(self) -> str:
+        """ETag of this exact representation (suffixed when encoded)"""
+        return encoded_etag(self.etag, self.encoding)
+    
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """
+        Check an If-None-Match header against this response's ETag
+        
+        A tag naming any encoding of the same body matches, since the
+        client then holds an equivalent representation.
+        
+        Args:
+            if_none_match: Raw header value (may list several tags)
+        
+        Returns:
+            True if the client already holds this representation
+        """
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            # If-None-Match uses weak comparison
+            if tag == "*" or base_etag(tag) == self.etag:
+                return True
+        return False
+    
+    def encode(self, encoding: str) -> "CachedResponse":
+        """Compress the identity body with the given encoding"""
+        return CachedResponse(
+            body=CODECS[encoding].compress(self.body),
+            etag=self.etag,
+            encoding=encoding,
+        )
+    
+    def to_bytes(self) -> bytes:
+        """Frame ETag and body for storage"""
+        return self.etag.encode() + b"\n" + self.body
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, encoding: Optional[str] = None) -> "CachedResponse":
+        """Parse a stored frame"""
+        etag, _, body = data.partition(b"\n")
+        return cls(body=body, etag=etag.decode(), encoding=encoding)
+
+
+class TranscriptionResponseCache:
+    """
+    Caches response bytes for transcriptions whose content is final
+    
+    Besides the identity body, a compressed variant is stored per content
+    encoding the first time a client asks for it, so repeat reads of a
+    large transcript cost no compression CPU.
+    
+    Entries are tagged with the transcription's cache generation, read
+    before the response's data is loaded. Invalidation drops the
+    generation, so a reader that loaded a row just before an update and
+    stores it just after the invalidation leaves an entry that is never
+    served.
+    
+    Keys are versioned so a change to the response shape never serves
+    bodies serialized by an older release from the shared tier.
+    """
+    
+    TRANSCRIPT = "transcript"
+    SUMMARY = "summary"
+    KEY_VERSION = "v2"
+    
+    _GENERATION = "generation"
+    
+    def __init__(
+        self,
+        cache: ResponseCache,
+        ttl_seconds: Optional[float] = None,
+        compress_min_size: int = 1024,
+        logger=None,
+    ):
+        self._cache = cache
+        self._ttl = ttl_seconds
+        self._compress_min_size = compress_min_size
+        self._logger = logger or get_logger(__name__)
+    
+    def _key(self, kind: str, transcription_id: UUID, encoding: Optional[str] = None) -> str:
+        key = f"{self.KEY_VERSION}:{kind}:{transcription_id}"
+        return f"{key}:{encoding}" if encoding else key
+    
+    async def generation(self, transcription_id: UUID) -> bytes:
+        """
+        Get the cache generation of a transcription, starting one if needed
+        
+        Read it before loading the data a response is built from, and pass
+        it to get() and put().
+        
+        Args:
+            transcription_id: ID of transcription
+        
+        Returns:
+            Opaque generation token
+        """
+        key = self._key(self._GENERATION, transcription_id)
+        with timed("cache"):
+            generation = await self._cache.get(key)
+        if generation is None:
+            # Concurrent readers may each start one; the last write wins and
+            # the others' entries are only missed
+            generation = uuid.uuid4().hex.encode()
+            await self._cache.set(key, generation, ttl_seconds=self._ttl)
+        return generation
+    
+    async def get(
+        self,
+        kind: str,
+        transcription_id: UUID,
+        generation: bytes,
+        encoding: Optional[str] = None,
+    ) -> Optional[CachedResponse]:
+        """
+        Get a cached response
+        
+        Args:
+            kind: TRANSCRIPT or SUMMARY
+            transcription_id: ID of transcription
+            generation: Current generation (see generation())
+            encoding: Preferred content encoding; the variant is created
+                from the identity body and stored if it is missing
+        
+        Returns:
+            Cached response (encoded when worthwhile), or None on a miss
+        """
+        if encoding:
+            with timed("cache"):
+                data = await self._cache.get(self._key(kind, transcription_id, encoding))
+            data = self._unframe(data, generation)
+            if data is not None:
+                RESPONSE_CACHE_REQUESTS_TOTAL.labels(kind=kind, result="hit").inc()
+                return CachedResponse.from_bytes(data, encoding=encoding)
+        
+        with timed("cache"):
+            data = await self._cache.get(self._key(kind, transcription_id))
+        data = self._unframe(data, generation)
+        if data is None:
+            RESPONSE_CACHE_REQUESTS_TOTAL.labels(kind=kind, result="miss").inc()
+            return None
+        RESPONSE_CACHE_REQUESTS_TOTAL.labels(kind=kind, result="hit").inc()
+        response = CachedResponse.from_bytes(data)
+        return await self._store_variant(kind, transcription_id, response, generation, encoding)
+    
+    async def put(
+        self,
+        kind: str,
+        transcription_id: UUID,
+        body: bytes,
+        generation: bytes,
+        encoding: Optional[str] = None,
+    ) -> CachedResponse:
+        """
+        Cache a serialized response
+        
+        Args:
+            kind: TRANSCRIPT or SUMMARY
+            transcription_id: ID of transcription
+            body: Serialized response body
+            generation: Generation read before the body's data was loaded
+            encoding: Content encoding the caller will send, if any
+        
+        Returns:
+            The cached response (encoded when worthwhile) with its ETag
+        """
+        response = CachedResponse.from_body(body)
+        await self._cache.set(
+            self._key(kind, transcription_id),
+            generation + b"\n" + response.to_bytes(),
+            ttl_seconds=self._ttl,
+        )
+        return await self._store_variant(kind, transcription_id, response, generation, encoding)
+    
+    async def invalidate(self, transcription_id: UUID) -> None:
+        """Drop every cached response and encoded variant of a transcription, and its generation"""
+        await self._cache.delete(
+            self._key(self._GENERATION, transcription_id),
+            *(
+                self._key(kind, transcription_id, encoding)
+                for kind in (self.TRANSCRIPT, self.SUMMARY)
+                for encoding in (None, *CODECS)
+            ),
+        )
+    
+    @staticmethod
+    def _unframe(data: Optional[bytes], generation: bytes) -> Optional[bytes]:
+        """Stored response of the given generation, None if missing or stale"""
+        if data is None:
+            return None
+        tag, _, response = data.partition(b"\n")
+        return response if tag == generation else None
+    
+    async def _store_variant(
+        self,
+        kind: str,
+        transcription_id: UUID,
+        response: CachedResponse,
+        generation: bytes,
+        encoding: Optional[str],
+    ) -> CachedResponse:
+        """Compress and store an encoded variant of a large identity body"""
+        if encoding not in CODECS or len(response.body) < self._compress_min_size:
+            return response
+        
+        variant = response.encode(encoding)
+        await self._cache.set(
+            self._key(kind, transcription_id, encoding),
+            generation + b"\n" + variant.to_bytes(),
+            ttl_seconds=self._ttl,
+        )
+        self._logger.debug(
+            "response_cache.variant.stored",
+            kind=kind,
+            transcription_id=str(transcription_id),
+            encoding=encoding,
+            identity_bytes=len(response.body),
+            encoded_bytes=len(variant.body),
+        )
+        return variant
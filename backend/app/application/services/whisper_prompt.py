@@ -0,0 +1,159 @@
+"""Transcription prompts biased towards lexicon terms"""
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.application.services import lexicon
+from app.application.services.lexicon import LexiconSnapshot
+
+# Whisper only conditions on the last 224 tokens of a prompt
+MAX_PROMPT_TOKENS = 224
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Conservative token count for Whisper's byte-level BPE
+    
+    Rare words (which lexicon terms mostly are) split into short pieces, so
+    this assumes about three bytes per token rather than a word per token.
+    """
+    return math.ceil(len(text.encode("utf-8")) / 3)
+
+
+class WhisperPromptBuilder:
+    """
+    Builds a bounded `prompt` that biases transcription towards known terms
+    
+    Terms are ranked by how likely they are to be misheard and to matter:
+    terms already heard in the preceding text first, then the tenant's own
+    vocabulary, proper nouns, and longer or multi-word technical terms. As
+    many as fit the token budget are listed, followed by the tail of the
+    preceding text (chunked transcription) so the next chunk continues it.
+    
+    The ranking and the context-free prompt are cached per lexicon version,
+    so building a prompt costs no more than a dictionary lookup until the
+    lexicons change.
+    
+    Args:
+        lexicons: Returns the current lexicon snapshot
+        max_tokens: Token budget for the whole prompt
+        max_context_share: Largest share of the budget given to preceding text
+    """
+    
+    PREFIX = "Msamiati: "
+    
+    def __init__(
+        self,
+        lexicons: Callable[[], LexiconSnapshot],
+        max_tokens: int = 200,
+        max_context_share: float = 0.5,
+    ):
+        self._lexicons = lexicons
+        self._max_tokens = min(max_tokens, MAX_PROMPT_TOKENS)
+        self._max_context_share = max_context_share
+        self._lock = threading.Lock()
+        self._ranked: Dict[Tuple[str, Optional[str]], Tuple[Tuple[str, str, int], ...]] = {}
+        self._prompts: Dict[Tuple[str, Optional[str]], str] = {}
+    
+    def build(self, tenant: Optional[str] = None, previous_text: Optional[str] = None) -> str:
+        """
+        Build the prompt for a transcription request
+        
+        Args:
+            tenant: Tenant whose lexicon overlay applies
+            previous_text: Transcript of the preceding audio chunk, if any
+        
+        Returns:
+            Prompt within the token budget (empty if there is nothing to add)
+        """
+        snapshot = self._lexicons()
+        key = (snapshot.lexicon(tenant).version, tenant)
+        if not previous_text and key in self._prompts:
+            return self._prompts[key]
+        
+        ranked = self._ranking(snapshot, tenant, key)
+        tail = ""
+        if previous_text:
+            tail = self._tail(previous_text, int(self._max_tokens * self._max_context_share))
+        budget = self._max_tokens - estimate_tokens(tail) - estimate_tokens(self.PREFIX)
+        
+        # Terms heard in the preceding text are the most likely to recur
+        heard = set()
+        if previous_text:
+            heard = (
+                snapshot.matcher(lexicon.TECHNICAL_TERMS, tenant).distinct(previous_text)
+                | snapshot.matcher(lexicon.PROPER_NOUNS, tenant).distinct(previous_text)
+            )
+        ordered = [entry for entry in ranked if entry[0] in heard]
+        ordered += [entry for entry in ranked if entry[0] not in heard]
+        
+        selected: List[str] = []
+        for _, spelling, tokens in ordered:
+            if tokens + 1 > budget:
+                continue
+            selected.append(spelling)
+            budget -= tokens + 1
+        
+        parts = []
+        if selected:
+            parts.append(self.PREFIX + ", ".join(selected) + ".")
+        if tail:
+            parts.append(tail)
+        prompt = " ".join(parts)
+        
+        if not previous_text:
+            with self._lock:
+                if len(self._prompts) >= 64:
+                    self._prompts.clear()
+                self._prompts[key] = prompt
+        return prompt
+    
+    def _ranking(
+        self,
+        snapshot: LexiconSnapshot,
+        tenant: Optional[str],
+        key: Tuple[str, Optional[str]],
+    ) -> Tuple[Tuple[str, str, int], ...]:
+        """Terms of the tenant's lexicon as (term, spelling, tokens), best first"""
+        ranked = self._ranked.get(key)
+        if ranked is not None:
+            return ranked
+        
+        terms = snapshot.lexicon(tenant)
+        overlay = snapshot.overlay(tenant)
+        
+        def score(category: str, term: str) -> Tuple[bool, bool, bool, int]:
+            own = overlay.contains(category, term)
+            distinctive = terms.spelling(term) != term or " " in term
+            return (own, category == lexicon.PROPER_NOUNS, distinctive, len(term))
+        
+        entries = {}
+        for category in (lexicon.TECHNICAL_TERMS, lexicon.PROPER_NOUNS):
+            for term in terms.terms(category):
+                rank = score(category, term)
+                if term not in entries or rank > entries[term][0]:
+                    entries[term] = (rank, terms.spelling(term))
+        ranked = tuple(
+            (term, spelling, estimate_tokens(spelling))
+            for term, (_, spelling) in sorted(
+                entries.items(), key=lambda item: (item[1][0], item[0]), reverse=True
+            )
+        )
+        
+        with self._lock:
+            if len(self._ranked) >= 64:
+                self._ranked.clear()
+            self._ranked[key] = ranked
+        return ranked
+    
+    @staticmethod
+    def _tail(text: str, max_tokens: int) -> str:
+        """Last whole words of the text within the token budget"""
+        words = text.split()
+        kept: List[str] = []
+        for word in reversed(words):
+            max_tokens -= estimate_tokens(word) + 1
+            if max_tokens < 0:
+                break
+            kept.append(word)
+        return " ".join(reversed(kept))
@@ -0,0 +1,57 @@
+"""Cancel transcription use case"""
+from uuid import UUID
+
+from app.application.dto.transcription_dto import TranscriptionDTO
+from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CancelTranscriptionUseCase:
+    """Use case for cancelling a queued or in-flight transcription"""
+    
+    def __init__(
+        self,
+        transcription_repo: TranscriptionRepository,
+        transcription_orchestrator,
+        logger=None,
+    ):
+        self._repo = transcription_repo
+        self._orchestrator = transcription_orchestrator
+        self._logger = logger or get_logger(__name__)
+    
+    async def execute(self, transcription_id: UUID) -> TranscriptionDTO:
+        """
+        Cancel processing of a transcription
+        
+        In-flight provider calls and storage transfers are cancelled and the
+        job's worker slot is released before the status is updated, which
+        happens once, from the stage the job had checkpointed when it stopped.
+        
+        Args:
+            transcription_id: ID of transcription to cancel
+        
+        Returns:
+            TranscriptionDTO with transcription info
+        
+        Raises:
+            InvalidStatusTransitionError: If the transcription already finished
+        """
+        # The scheduler knows whether work is still running; the stored status
+        # reads completed from the transcript checkpoint onwards
+        job_cancelled = await self._orchestrator.cancel(transcription_id)
+        
+        # Loaded after the job stopped, so checkpoints it made are kept
+        transcription = await self._repo.get_by_id(transcription_id)
+        transcription.mark_as_cancelled()
+        await self._repo.update(transcription)
+        
+        self._logger.info(
+            "transcription.cancelled",
+            transcription_id=str(transcription_id),
+            job_cancelled=job_cancelled,
+            stage=transcription.stage.value,
+        )
+        
+        return TranscriptionDTO.from_entity(transcription)
@@ -1,8 +1,12 @@
 """Get summary use case"""
+from typing import Callable, Optional
 from uuid import UUID
 
 from app.application.dto.summary_dto import SummaryDTO
-from app.domain.entities.transcription import Transcription
+from app.application.services.transcription_response_cache import (
+    CachedResponse,
+    TranscriptionResponseCache,
+)
 from app.domain.interfaces.transcription_repository import TranscriptionRepository
 from app.shared.logging import get_logger
 
@@ -15,9 +19,11 @@ class GetSummaryUseCase:
     def __init__(
         self,
         transcription_repo: TranscriptionRepository,
+        response_cache: Optional[TranscriptionResponseCache] = None,
         logger=None,
     ):
         self._repo = transcription_repo
+        self._response_cache = response_cache
         self._logger = logger or get_logger(__name__)
     
     async def execute(self, transcription_id: UUID) -> SummaryDTO:
@@ -33,10 +39,51 @@ class GetSummaryUseCase:
         Raises:
             ValueError: If transcription has no summary
         """
-        transcription = await self._repo.get_by_id(transcription_id)
+        summary = await self._repo.get_summary(transcription_id)
         
-        if not transcription.summary:
+        if not summary:
             raise ValueError(f"Transcription {transcription_id} has no summary yet")
         
-        return SummaryDTO.from_entity(transcription.summary)
-
+        return SummaryDTO.from_entity(summary)
+    
+    async def execute_serialized(
+        self,
+        transcription_id: UUID,
+        serialize: Callable[[SummaryDTO], bytes],
+        encoding: Optional[str] = None,
+    ) -> CachedResponse:
+        """
+        Get the serialized summary response, reading through the cache
+        
+        Args:
+            transcription_id: ID of transcription
+            serialize: Turns the DTO into response body bytes
+            encoding: Content encoding accepted by the client; cached
+                responses are returned precompressed in it
+        
+        Returns:
+            Response body with its ETag (identity if not cached; the
+            compression middleware then encodes it)
+        
+        Raises:
+            ValueError: If transcription has no summary
+        """
+        cache = self._response_cache
+        if cache is not None:
+            # Read before the row, so an update in between is detected
+            generation = await cache.generation(transcription_id)
+            cached = await cache.get(cache.SUMMARY, transcription_id, generation, encoding)
+            if cached is not None:
+                self._logger.debug(
+                    "response_cache.hit",
+                    kind=cache.SUMMARY,
+                    transcription_id=str(transcription_id),
+                )
+                return cached
+        
+        body = serialize(await self.execute(transcription_id))
+        
+        # A stored summary is final until the transcription is updated
+        if cache is not None:
+            return await cache.put(cache.SUMMARY, transcription_id, body, generation, encoding)
+        return CachedResponse.from_body(body)
@@ -1,8 +1,14 @@
 """Get transcript use case"""
+from typing import Callable, Optional
 from uuid import UUID
 
 from app.application.dto.transcription_dto import TranscriptionDTO
+from app.application.services.transcription_response_cache import (
+    CachedResponse,
+    TranscriptionResponseCache,
+)
 from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.processing_status import ProcessingStatus
 from app.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -14,9 +20,11 @@ class GetTranscriptUseCase:
     def __init__(
         self,
         transcription_repo: TranscriptionRepository,
+        response_cache: Optional[TranscriptionResponseCache] = None,
         logger=None,
     ):
         self._repo = transcription_repo
+        self._response_cache = response_cache
         self._logger = logger or get_logger(__name__)
     
     async def execute(self, transcription_id: UUID) -> TranscriptionDTO:
@@ -31,4 +39,45 @@ class GetTranscriptUseCase:
         """
         transcription = await self._repo.get_by_id(transcription_id)
         return TranscriptionDTO.from_entity(transcription)
-
+    
+    async def execute_serialized(
+        self,
+        transcription_id: UUID,
+        serialize: Callable[[TranscriptionDTO], bytes],
+        encoding: Optional[str] = None,
+    ) -> CachedResponse:
+        """
+        Get the serialized transcript response, reading through the cache
+        
+        Only COMPLETED transcriptions are cached; their transcript no
+        longer changes until the row is updated, which invalidates it.
+        
+        Args:
+            transcription_id: ID of transcription
+            serialize: Turns the DTO into response body bytes
+            encoding: Content encoding accepted by the client; cached
+                responses are returned precompressed in it
+        
+        Returns:
+            Response body with its ETag (identity if not cached; the
+            compression middleware then encodes it)
+        """
+        cache = self._response_cache
+        if cache is not None:
+            # Read before the row, so an update in between is detected
+            generation = await cache.generation(transcription_id)
+            cached = await cache.get(cache.TRANSCRIPT, transcription_id, generation, encoding)
+            if cached is not None:
+                self._logger.debug(
+                    "response_cache.hit",
+                    kind=cache.TRANSCRIPT,
+                    transcription_id=str(transcription_id),
+                )
+                return cached
+        
+        dto = await self.execute(transcription_id)
+        body = serialize(dto)
+        
+        if cache is not None and dto.status == ProcessingStatus.COMPLETED.value:
+            return await cache.put(cache.TRANSCRIPT, transcription_id, body, generation, encoding)
+        return CachedResponse.from_body(body)
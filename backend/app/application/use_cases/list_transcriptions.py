@@ -0,0 +1,67 @@
+"""List transcriptions use case"""
+from typing import List, Optional
+
+from app.application.dto.transcription_list_dto import (
+    TranscriptionListItemDTO,
+    TranscriptionPageDTO,
+)
+from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.domain.value_objects.transcription_listing import ListingCursor
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ListTranscriptionsUseCase:
+    """Use case for paging through transcription history"""
+    
+    MAX_LIMIT = 100
+    
+    def __init__(
+        self,
+        transcription_repo: TranscriptionRepository,
+        logger=None,
+    ):
+        self._repo = transcription_repo
+        self._logger = logger or get_logger(__name__)
+    
+    async def execute(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        statuses: Optional[List[ProcessingStatus]] = None,
+    ) -> TranscriptionPageDTO:
+        """
+        Get one page of transcriptions, newest first
+        
+        Args:
+            limit: Page size (capped at MAX_LIMIT)
+            cursor: Opaque cursor returned with the previous page
+            statuses: Optional status filter
+        
+        Returns:
+            TranscriptionPageDTO with items and the next page cursor
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        after = ListingCursor.decode(cursor)
+        
+        # Fetch one extra row to know whether another page exists
+        items = await self._repo.list_page(
+            limit=limit + 1,
+            after=after,
+            statuses=statuses,
+        )
+        
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = ListingCursor.after(items[-1]).encode()
+        
+        return TranscriptionPageDTO(
+            items=[TranscriptionListItemDTO.from_item(item) for item in items],
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,62 @@
+"""Retry transcription use case"""
+from uuid import UUID
+
+from app.application.dto.transcription_dto import TranscriptionDTO
+from app.application.services.job_scheduler import wait_for_job
+from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.shared.logging import get_logger
+from app.shared.metrics import JOB_RETRIES_TOTAL
+
+logger = get_logger(__name__)
+
+
+class RetryTranscriptionUseCase:
+    """Use case for resuming a failed or interrupted transcription"""
+    
+    def __init__(
+        self,
+        transcription_repo: TranscriptionRepository,
+        transcription_orchestrator,
+        process_in_background: bool = False,
+        logger=None,
+    ):
+        self._repo = transcription_repo
+        self._orchestrator = transcription_orchestrator
+        self._process_in_background = process_in_background
+        self._logger = logger or get_logger(__name__)
+    
+    async def execute(self, transcription_id: UUID, origin: str | None = None) -> TranscriptionDTO:
+        """
+        Resume processing at the first incomplete stage
+        
+        Args:
+            transcription_id: ID of transcription to retry
+            origin: Optional origin used to pick the job's priority class
+        
+        Returns:
+            TranscriptionDTO with transcription info
+        
+        Raises:
+            ValueError: If the transcription is still queued or processing
+            InvalidStatusTransitionError: If the transcription cannot be retried
+        """
+        if self._orchestrator.is_active(transcription_id):
+            raise ValueError(f"Transcription {transcription_id} is already being processed")
+        
+        transcription = await self._repo.get_by_id(transcription_id)
+        transcription.reset_for_retry()
+        await self._repo.update(transcription)
+        
+        self._logger.info(
+            "transcription.retry.requested",
+            transcription_id=str(transcription_id),
+            resume_from=transcription.stage.value,
+        )
+        JOB_RETRIES_TOTAL.labels(resume_stage=transcription.stage.value).inc()
+        
+        job = self._orchestrator.enqueue(transcription_id, origin=origin)
+        if not self._process_in_background:
+            await wait_for_job(job)
+        
+        updated_transcription = await self._repo.get_by_id(transcription_id)
+        return TranscriptionDTO.from_entity(updated_transcription)
@@ -0,0 +1,79 @@
+"""Search transcriptions use case"""
+from typing import List, Optional
+
+from app.application.dto.transcription_search_dto import (
+    TranscriptionSearchHitDTO,
+    TranscriptionSearchResultDTO,
+)
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.transcription_search import TranscriptionSearchHit
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SearchTranscriptionsUseCase:
+    """Use case for full-text search over transcripts and summaries"""
+    
+    MAX_LIMIT = 50
+    MAX_TERMS = 16
+    
+    def __init__(
+        self,
+        transcription_repo: TranscriptionRepository,
+        logger=None,
+    ):
+        self._repo = transcription_repo
+        self._logger = logger or get_logger(__name__)
+    
+    async def execute(self, query: str, limit: int = 20) -> TranscriptionSearchResultDTO:
+        """
+        Search transcriptions, best match first
+        
+        Args:
+            query: Free-text query in Swahili and/or English
+            limit: Maximum number of hits (capped at MAX_LIMIT)
+        
+        Returns:
+            TranscriptionSearchResultDTO with ranked hits and snippets
+        
+        Raises:
+            ValueError: If the query has no searchable words
+        """
+        terms = list(dict.fromkeys(SwahiliProcessor.search_terms(query)))[:self.MAX_TERMS]
+        if not terms:
+            raise ValueError("Search query has no searchable words")
+        
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        hits = await self._repo.search(terms, limit=limit)
+        
+        self._logger.info(
+            "transcriptions.search.completed",
+            terms=len(terms),
+            hits=len(hits),
+        )
+        
+        return TranscriptionSearchResultDTO(
+            query=query,
+            items=[
+                TranscriptionSearchHitDTO(
+                    id=hit.id,
+                    filename=hit.filename,
+                    status=hit.status.value,
+                    rank=hit.rank,
+                    snippet=self._snippet(hit, terms),
+                    created_at=hit.created_at,
+                )
+                for hit in hits
+            ],
+        )
+    
+    @staticmethod
+    def _snippet(hit: TranscriptionSearchHit, terms: List[str]) -> Optional[str]:
+        """Snippet from the first source text containing a match"""
+        for text in (hit.transcript_text, hit.muhtasari, "; ".join(hit.maamuzi)):
+            snippet = SwahiliProcessor.search_snippet(text, terms)
+            if snippet:
+                return snippet
+        return None
@@ -4,10 +4,14 @@ from typing import Optional
 from fastapi import UploadFile
 
 from app.application.dto.transcription_dto import TranscriptionDTO
+from app.application.services.job_scheduler import wait_for_job
 from app.domain.interfaces.file_storage import FileStorage
 from app.domain.interfaces.transcription_repository import TranscriptionRepository
 from app.domain.value_objects.file_info import FileInfo
 from app.shared.logging import get_logger
+from app.shared.metrics import UPLOAD_SIZE_BYTES
+from app.shared.timing import timed
+from app.shared.tracing import annotate, traced
 
 logger = get_logger(__name__)
 
@@ -20,13 +24,16 @@ class UploadAudioUseCase:
         transcription_repo: TranscriptionRepository,
         file_storage: FileStorage,
         transcription_orchestrator,
+        process_in_background: bool = False,
         logger=None,
     ):
         self._repo = transcription_repo
         self._storage = file_storage
         self._orchestrator = transcription_orchestrator
+        self._process_in_background = process_in_background
         self._logger = logger or get_logger(__name__)
     
+    @traced("upload_audio")
     async def execute(
         self,
         file: UploadFile,
@@ -42,7 +49,8 @@ class UploadAudioUseCase:
             TranscriptionDTO with transcription info
         """
         # Read file content
-        file_content = await file.read()
+        with timed("upload.read"):
+            file_content = await file.read()
         
         # Create file info and validate
         file_info = FileInfo.from_upload_file(
@@ -59,6 +67,8 @@ class UploadAudioUseCase:
             size_bytes=file_info.size_bytes,
             origin=file_info.origin,
         )
+        UPLOAD_SIZE_BYTES.labels(extension=file_info.extension).observe(file_info.size_bytes)
+        annotate(size_bytes=file_info.size_bytes, origin=file_info.origin)
         
         # Save file
         file_path = await self._storage.save(file_content, file_info.filename)
@@ -72,11 +82,18 @@ class UploadAudioUseCase:
         
         # Persist
         await self._repo.create(transcription)
+        annotate(transcription_id=str(transcription.id))
         
-        # Process asynchronously (in background for production)
-        # For MVP, we'll process synchronously
+        # Schedule processing; interactive origins get priority worker slots.
+        # Unless background processing is enabled, wait for the job to finish
         # Don't catch/log here - orchestrator handles error logging
-        await self._orchestrator.process_transcription(transcription.id)
+        job = self._orchestrator.enqueue(
+            transcription.id,
+            origin=file_info.origin,
+            audio_duration_seconds=file_info.estimated_duration_seconds,
+        )
+        if not self._process_in_background:
+            await wait_for_job(job)
         
         # Return DTO
         updated_transcription = await self._repo.get_by_id(transcription.id)
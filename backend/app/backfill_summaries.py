@@ -0,0 +1,53 @@
+"""
+Summarize stored transcripts through the Batch API
+
+Usage:
+    python -m app.backfill_summaries [--limit N] [TRANSCRIPTION_ID ...]
+
+Without IDs, every transcription with a transcript but no summary is
+summarized. Runs as its own process, apart from the API and its workers.
+Progress and the final report (`summary_backfill.completed`) are logged
+like the API's events.
+"""
+import argparse
+import asyncio
+from typing import List, Optional
+from uuid import UUID
+
+from app.application.services.summary_backfill import BackfillReport
+from app.container import ApplicationContainer
+from app.infrastructure.config.settings import settings
+from app.shared.logging import configure_logging, shutdown_logging
+
+
+async def backfill(transcription_ids: List[UUID], limit: Optional[int]) -> BackfillReport:
+    """Run a backfill and return its report"""
+    container = ApplicationContainer()
+    try:
+        return await container.summary_backfill.run(transcription_ids or None, limit=limit)
+    finally:
+        await container.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("transcription_ids", nargs="*", type=UUID, help="Transcriptions to re-summarize")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum transcriptions to submit")
+    args = parser.parse_args()
+    
+    configure_logging(
+        settings.log_level,
+        async_output=settings.log_async,
+        queue_size=settings.log_queue_size,
+        sample_rates=settings.log_sample_rates_map,
+        max_field_length=settings.log_max_field_length,
+    )
+    try:
+        # The report is logged as summary_backfill.completed
+        asyncio.run(backfill(args.transcription_ids, args.limit))
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,52 @@
+from contextlib import asynccontextmanager
+
 from openai import AsyncOpenAI
 
+from app.application.services import lexicon
+from app.application.services.job_scheduler import JobScheduler
+from app.application.services.lexicon import LexiconRegistry
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.application.services.transcription_response_cache import (
+    TranscriptionResponseCache,
+)
+from app.application.services.progress_channel import ProgressChannel
+from app.application.services.summarization_router import ModelRoute, SummarizationRouter
+from app.application.services.resummarization_job import ResummarizationJob
+from app.application.services.summary_backfill import SummaryBackfill
+from app.application.services.transcript_cleaner import TranscriptCleaner
 from app.application.services.transcription_orchestrator import TranscriptionOrchestrator
+from app.application.services.whisper_prompt import WhisperPromptBuilder
+from app.application.use_cases.cancel_transcription import CancelTranscriptionUseCase
 from app.application.use_cases.get_summary import GetSummaryUseCase
 from app.application.use_cases.get_transcript import GetTranscriptUseCase
+from app.application.use_cases.list_transcriptions import ListTranscriptionsUseCase
+from app.application.use_cases.retry_transcription import RetryTranscriptionUseCase
+from app.application.use_cases.search_transcriptions import SearchTranscriptionsUseCase
 from app.application.use_cases.upload_audio import UploadAudioUseCase
+from app.infrastructure.cache.memory_response_cache import InMemoryResponseCache
+from app.infrastructure.cache.redis_response_cache import RedisResponseCache
+from app.infrastructure.cache.tiered_response_cache import TieredResponseCache
 from app.infrastructure.config.settings import settings
 from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.lexicons.file_lexicon_source import FileLexiconSource
+from app.infrastructure.providers.openai_batch_summarization_provider import (
+    OpenAIBatchSummarizationProvider,
+)
 from app.infrastructure.providers.openai_summarization_provider import (
     OpenAISummarizationProvider,
 )
 from app.infrastructure.providers.openai_whisper_provider import OpenAIWhisperProvider
+from app.infrastructure.providers.prompts import PROMPT_VERSION
 from app.infrastructure.repositories.transcription_repository_impl import (
     TranscriptionRepositoryImpl,
 )
 from app.infrastructure.storage.local_file_storage import LocalFileStorage
 from app.infrastructure.storage.cloudflare_r2_storage import CloudflareR2Storage
+from app.infrastructure.tracing.file_span_exporter import FileSpanExporter
+from app.infrastructure.tracing.otlp_http_span_exporter import OtlpHttpSpanExporter
 from app.shared.logging import get_logger
+from app.shared.metrics import JOBS_IN_FLIGHT
+from app.shared.tracing import Tracer, set_tracer
 
 
 class ApplicationContainer:
@@ -26,6 +57,45 @@ class ApplicationContainer:
         # Logger
         self._logger = get_logger()
         
+        # Tracing - spans are exported in the background, batched
+        self._tracer = None
+        if settings.tracing_enabled:
+            if settings.tracing_otlp_endpoint:
+                exporter = OtlpHttpSpanExporter(settings.tracing_otlp_endpoint)
+            else:
+                exporter = FileSpanExporter(settings.tracing_export_path)
+            self._tracer = Tracer(exporter, service_name=settings.tracing_service_name)
+            self._tracer.start()
+            set_tracer(self._tracer)
+            self._logger.info(
+                "tracing.initialized",
+                exporter="otlp" if settings.tracing_otlp_endpoint else "file",
+            )
+        
+        # Lexicons - built-in terms plus files, reloaded in the background
+        self._lexicons = None
+        if settings.lexicon_dir:
+            self._lexicons = LexiconRegistry(
+                {
+                    lexicon.TECHNICAL_TERMS: SwahiliProcessor.TECHNICAL_TERMS,
+                    lexicon.PROPER_NOUNS: SwahiliProcessor.COMMON_PROPER_NOUNS,
+                    lexicon.FILLER_WORDS: SwahiliProcessor.FILLER_WORDS,
+                },
+                source=FileLexiconSource(settings.lexicon_dir),
+            )
+            self._lexicons.reload()
+            if settings.lexicon_reload_interval_seconds > 0:
+                self._lexicons.watch(settings.lexicon_reload_interval_seconds)
+            SwahiliProcessor.use_lexicons(self._lexicons)
+        
+        # Post-processing of raw transcripts before they are stored
+        SwahiliProcessor.use_transcript_cleaner(TranscriptCleaner(
+            remove_fillers=settings.transcript_remove_fillers,
+            max_ngram=settings.transcript_max_repeated_ngram,
+            min_repeats=settings.transcript_min_repeats,
+            normalize_whitespace=settings.transcript_normalize_whitespace,
+        ))
+        
         # OpenAI client
         self._openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
         
@@ -38,12 +108,47 @@ class ApplicationContainer:
         # Providers
         self._transcription_provider = OpenAIWhisperProvider(
             client=self._openai_client,
-            model=settings.openai_whisper_model
+            model=settings.openai_whisper_model,
+            prompt_builder=WhisperPromptBuilder(
+                SwahiliProcessor.lexicons,
+                max_tokens=settings.whisper_prompt_max_tokens,
+            ) if settings.whisper_prompt_enabled else None,
         )
         
-        self._summarization_provider = OpenAISummarizationProvider(
-            client=self._openai_client,
-            model=settings.openai_model
+        # Progress events of running jobs, for live subscribers
+        self._progress_channel = ProgressChannel()
+        
+        # Refresh of outdated summaries (created on first use)
+        self._resummarization_job = None
+        
+        # Batch summary backfill, with its own client and session (created on first use)
+        self._summary_backfill = None
+        self._summary_backfill_client = None
+        self._summary_backfill_session = None
+        
+        # Summarization - routed across models by size, load and job priority
+        self._summarization_provider = SummarizationRouter(
+            [
+                ModelRoute(
+                    model=model,
+                    provider=OpenAISummarizationProvider(
+                        client=self._openai_client,
+                        model=model,
+                        stream=settings.summarization_streaming,
+                        max_prompt_tokens=settings.summarization_max_prompt_tokens,
+                        completion_reserve_tokens=settings.summarization_completion_reserve_tokens,
+                        trim_tolerance=settings.summarization_trim_tolerance,
+                        # Part calls of map-reduce summaries count against the route's limit
+                        max_concurrency=max_concurrency,
+                    ),
+                    max_input_tokens=max_input_tokens,
+                    max_concurrency=max_concurrency,
+                )
+                for model, max_input_tokens, max_concurrency in settings.summarization_routes_list
+            ],
+            reserved_interactive=settings.reserved_interactive_workers,
+            cooldown_seconds=settings.summarization_cooldown_seconds,
+            logger=self._logger,
         )
         
         # Storage - choose based on settings
@@ -72,10 +177,57 @@ class ApplicationContainer:
             self._file_storage = LocalFileStorage(upload_dir=settings.upload_dir)
             self._logger.info("storage.initialized", storage_type="local")
         
+        # Job scheduler - priority lanes and fair queuing for processing jobs
+        self._job_scheduler = JobScheduler(
+            max_workers=settings.worker_concurrency,
+            reserved_interactive_workers=settings.reserved_interactive_workers,
+            interactive_origins=settings.interactive_origins_set,
+            batch_origins=settings.batch_origins_set,
+            weights=settings.scheduler_weights_map,
+            logger=self._logger,
+        )
+        JOBS_IN_FLIGHT.labels(state="running").set_function(
+            lambda: self._job_scheduler.running_count
+        )
+        JOBS_IN_FLIGHT.labels(state="queued").set_function(
+            lambda: self._job_scheduler.queued_count
+        )
+        
+        # Response cache - in-process LRU, optionally in front of a shared tier
+        self._response_cache = None
+        self._shared_response_cache = None
+        if settings.response_cache_enabled:
+            cache = InMemoryResponseCache(
+                max_entries=settings.response_cache_max_entries,
+                max_bytes=settings.response_cache_max_mb * 1024 * 1024,
+                default_ttl_seconds=settings.response_cache_local_ttl_seconds,
+            )
+            if settings.response_cache_url:
+                self._shared_response_cache = RedisResponseCache(settings.response_cache_url)
+                cache = TieredResponseCache(
+                    local=cache,
+                    shared=self._shared_response_cache,
+                    local_ttl_seconds=settings.response_cache_local_ttl_seconds,
+                )
+            self._response_cache = TranscriptionResponseCache(
+                cache,
+                ttl_seconds=settings.response_cache_ttl_seconds,
+                compress_min_size=settings.compression_minimum_size,
+                logger=self._logger,
+            )
+            self._logger.info(
+                "response_cache.initialized",
+                shared_tier=bool(settings.response_cache_url),
+            )
+        
         # Initialize use cases after repository is available (lazy initialization)
         self._upload_audio_use_case = None
         self._get_transcript_use_case = None
         self._get_summary_use_case = None
+        self._retry_transcription_use_case = None
+        self._cancel_transcription_use_case = None
+        self._list_transcriptions_use_case = None
+        self._search_transcriptions_use_case = None
         self._transcription_orchestrator = None
     
     @property
@@ -83,15 +235,24 @@ class ApplicationContainer:
         """Get transcription repository (lazy initialization)"""
         if self._transcription_repository is None:
             session = self._db_session_factory()
-            self._transcription_repository = TranscriptionRepositoryImpl(session)
+            self._transcription_repository = TranscriptionRepositoryImpl(
+                session,
+                response_cache=self._response_cache,
+            )
             
             # Initialize orchestrator and use cases after repository is ready
             if self._transcription_orchestrator is None:
                 self._transcription_orchestrator = TranscriptionOrchestrator(
-                    transcription_repo=self._transcription_repository,
+                    # Jobs run concurrently, so each gets its own session
+                    transcription_repo=None,
+                    repository_scope=self._job_repository,
                     transcription_provider=self._transcription_provider,
                     summarization_provider=self._summarization_provider,
                     file_storage=self._file_storage,
+                    scheduler=self._job_scheduler,
+                    progress=self._progress_channel,
+                    deadline_min_seconds=settings.job_deadline_min_seconds,
+                    deadline_per_audio_second=settings.job_deadline_per_audio_second,
                     logger=self._logger,
                 )
                 
@@ -99,21 +260,115 @@ class ApplicationContainer:
                     transcription_repo=self._transcription_repository,
                     file_storage=self._file_storage,
                     transcription_orchestrator=self._transcription_orchestrator,
+                    process_in_background=settings.process_in_background,
                     logger=self._logger,
                 )
                 
                 self._get_transcript_use_case = GetTranscriptUseCase(
                     transcription_repo=self._transcription_repository,
+                    response_cache=self._response_cache,
                     logger=self._logger,
                 )
                 
                 self._get_summary_use_case = GetSummaryUseCase(
+                    transcription_repo=self._transcription_repository,
+                    response_cache=self._response_cache,
+                    logger=self._logger,
+                )
+                
+                self._retry_transcription_use_case = RetryTranscriptionUseCase(
+                    transcription_repo=self._transcription_repository,
+                    transcription_orchestrator=self._transcription_orchestrator,
+                    process_in_background=settings.process_in_background,
+                    logger=self._logger,
+                )
+                
+                self._cancel_transcription_use_case = CancelTranscriptionUseCase(
+                    transcription_repo=self._transcription_repository,
+                    transcription_orchestrator=self._transcription_orchestrator,
+                    logger=self._logger,
+                )
+                
+                self._list_transcriptions_use_case = ListTranscriptionsUseCase(
+                    transcription_repo=self._transcription_repository,
+                    logger=self._logger,
+                )
+                
+                self._search_transcriptions_use_case = SearchTranscriptionsUseCase(
                     transcription_repo=self._transcription_repository,
                     logger=self._logger,
                 )
         
         return self._transcription_repository
     
+    @asynccontextmanager
+    async def _job_repository(self):
+        """Transcription repository on a session of its own, for one processing job"""
+        async with self._db_session_factory() as session:
+            yield TranscriptionRepositoryImpl(session, response_cache=self._response_cache)
+    
+    @property
+    def progress_channel(self) -> ProgressChannel:
+        """Get progress channel"""
+        return self._progress_channel
+    
+    @property
+    def summary_backfill(self) -> SummaryBackfill:
+        """
+        Get the batch summary backfill
+        
+        It has its own client and database session, so it shares neither
+        connections nor rate limits with interactive processing. Both are
+        closed by shutdown().
+        """
+        if self._summary_backfill is None:
+            self._summary_backfill_client = AsyncOpenAI(
+                api_key=settings.summary_backfill_api_key or settings.openai_api_key,
+                base_url=settings.summary_backfill_base_url or None,
+            )
+            self._summary_backfill_session = self._db_session_factory()
+            self._summary_backfill = SummaryBackfill(
+                transcription_repo=TranscriptionRepositoryImpl(
+                    self._summary_backfill_session,
+                    response_cache=self._response_cache,
+                ),
+                provider=OpenAIBatchSummarizationProvider(
+                    client=self._summary_backfill_client,
+                    model=settings.summary_backfill_model or settings.openai_model,
+                    completion_window=settings.summary_backfill_completion_window,
+                    max_prompt_tokens=settings.summarization_max_prompt_tokens,
+                    completion_reserve_tokens=settings.summarization_completion_reserve_tokens,
+                    trim_tolerance=settings.summarization_trim_tolerance,
+                ),
+                batch_size=settings.summary_backfill_batch_size,
+                poll_interval_seconds=settings.summary_backfill_poll_interval_seconds,
+                logger=self._logger,
+            )
+        return self._summary_backfill
+    
+    @property
+    def resummarization_job(self) -> ResummarizationJob:
+        """Get the job refreshing summaries made with outdated prompts"""
+        if self._resummarization_job is None:
+            self._resummarization_job = ResummarizationJob(
+                # Own session: the job runs alongside request handling
+                transcription_repo=TranscriptionRepositoryImpl(
+                    self._db_session_factory(),
+                    response_cache=self._response_cache,
+                ),
+                summarization_provider=self._summarization_provider,
+                prompt_version=PROMPT_VERSION,
+                rate_per_minute=settings.resummarization_rate_per_minute,
+                page_size=settings.resummarization_page_size,
+                logger=self._logger,
+            )
+        return self._resummarization_job
+    
+    @property
+    def progress_keepalive_seconds(self) -> float:
+        """Get interval of keep-alive comments on progress event streams"""
+        return settings.progress_keepalive_seconds
+    
     @property
     def upload_audio_use_case(self) -> UploadAudioUseCase:
         """Get upload audio use case"""
@@ -132,6 +387,30 @@ class ApplicationContainer:
         _ = self.transcription_repository  # Ensure initialization
         return self._get_summary_use_case
     
+    @property
+    def retry_transcription_use_case(self) -> RetryTranscriptionUseCase:
+        """Get retry transcription use case"""
+        _ = self.transcription_repository  # Ensure initialization
+        return self._retry_transcription_use_case
+    
+    @property
+    def cancel_transcription_use_case(self) -> CancelTranscriptionUseCase:
+        """Get cancel transcription use case"""
+        _ = self.transcription_repository  # Ensure initialization
+        return self._cancel_transcription_use_case
+    
+    @property
+    def list_transcriptions_use_case(self) -> ListTranscriptionsUseCase:
+        """Get list transcriptions use case"""
+        _ = self.transcription_repository  # Ensure initialization
+        return self._list_transcriptions_use_case
+    
+    @property
+    def search_transcriptions_use_case(self) -> SearchTranscriptionsUseCase:
+        """Get search transcriptions use case"""
+        _ = self.transcription_repository  # Ensure initialization
+        return self._search_transcriptions_use_case
+    
     def wire(self, modules=None):
         """Wire dependencies (compatibility method - no-op for manual DI)"""
         pass
@@ -139,3 +418,19 @@ class ApplicationContainer:
     def unwire(self):
         """Unwire dependencies (compatibility method - no-op for manual DI)"""
         pass
+    
+    async def shutdown(self) -> None:
+        """Stop background processing jobs, release cache and backfill connections and flush traces"""
+        await self._job_scheduler.shutdown()
+        if self._resummarization_job is not None:
+            await self._resummarization_job.stop()
+        if self._summary_backfill is not None:
+            await self._summary_backfill_session.close()
+            await self._summary_backfill_client.close()
+        if self._lexicons is not None:
+            await self._lexicons.shutdown()
+        if self._shared_response_cache is not None:
+            await self._shared_response_cache.close()
+        if self._tracer is not None:
+            set_tracer(None)
+            await self._tracer.shutdown()
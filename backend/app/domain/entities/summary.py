@@ -22,6 +22,11 @@ class Summary:
     maamuzi: List[str] = field(default_factory=list)  # Important decisions
     kazi: List[ActionItem] = field(default_factory=list)  # Action items
     masuala_yaliyoahirishwa: List[str] = field(default_factory=list)  # Deferred topics
+    model: Optional[str] = None  # Model that generated the summary
+    prompt_version: Optional[str] = None  # Hash of the prompts it was generated with
+    prompt_mode: Optional[str] = None  # How the transcript fit the prompt: direct, trimmed or map_reduce
+    prompt_tokens: Optional[int] = None  # Billed prompt tokens, over every call made for it
+    completion_tokens: Optional[int] = None  # Billed completion tokens, over every call
     
     @classmethod
     def create(
@@ -31,6 +36,8 @@ class Summary:
         maamuzi: Optional[List[str]] = None,
         kazi: Optional[List[ActionItem]] = None,
         masuala_yaliyoahirishwa: Optional[List[str]] = None,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
     ) -> "Summary":
         """Create a new summary"""
         from uuid import uuid4
@@ -42,5 +49,7 @@ class Summary:
             maamuzi=maamuzi or [],
             kazi=kazi or [],
             masuala_yaliyoahirishwa=masuala_yaliyoahirishwa or [],
+            model=model,
+            prompt_version=prompt_version,
         )
 
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from app.domain.entities.summary import Summary
 from app.domain.exceptions.domain_exceptions import InvalidStatusTransitionError
+from app.domain.value_objects.processing_stage import ProcessingStage
 from app.domain.value_objects.processing_status import ProcessingStatus
 
 
@@ -17,6 +18,7 @@ class Transcription:
     filename: str
     file_path: str
     status: ProcessingStatus
+    stage: ProcessingStage = ProcessingStage.STORED
     transcript_text: Optional[str] = None
     summary: Optional[Summary] = None
     error_message: Optional[str] = None
@@ -58,6 +60,7 @@ class Transcription:
             )
         self.transcript_text = transcript
         self.status = ProcessingStatus.COMPLETED
+        self._advance_stage(ProcessingStage.TRANSCRIBED)
         self.updated_at = datetime.utcnow()
     
     def add_summary(self, summary: Summary) -> None:
@@ -65,11 +68,73 @@ class Transcription:
         if summary.transcription_id != self.id:
             raise ValueError("Summary transcription_id must match transcription id")
         self.summary = summary
+        self._advance_stage(ProcessingStage.SUMMARIZED)
         self.updated_at = datetime.utcnow()
     
+    def complete_with_summary(self, summary: Summary) -> None:
+        """
+        Attach a summary generated outside the pipeline (e.g. by a backfill)
+        
+        A transcription whose summarization failed or was cancelled becomes
+        completed; one that is queued or being processed is left to the
+        pipeline.
+        """
+        if self.status in (ProcessingStatus.PENDING, ProcessingStatus.PROCESSING):
+            raise InvalidStatusTransitionError(
+                self.status.value,
+                ProcessingStatus.COMPLETED.value
+            )
+        if not self.has_reached(ProcessingStage.TRANSCRIBED):
+            raise ValueError("Cannot summarize a transcription without a transcript")
+        self.add_summary(summary)
+        self.status = ProcessingStatus.COMPLETED
+        self.error_message = None
+    
     def mark_as_failed(self, error_message: str) -> None:
         """Mark transcription as failed"""
         self.status = ProcessingStatus.FAILED
         self.error_message = error_message
         self.updated_at = datetime.utcnow()
-
+    
+    def mark_as_cancelled(self) -> None:
+        """
+        Mark a transcription that has not finished processing as cancelled
+        
+        The transcript checkpoint already sets the status to completed while
+        the summary is still being generated, so a completed transcription
+        can be cancelled until it has its summary.
+        """
+        finished = self.status in (ProcessingStatus.FAILED, ProcessingStatus.CANCELLED) or (
+            self.has_reached(ProcessingStage.SUMMARIZED)
+        )
+        if finished:
+            raise InvalidStatusTransitionError(
+                self.status.value,
+                ProcessingStatus.CANCELLED.value
+            )
+        self.status = ProcessingStatus.CANCELLED
+        self.updated_at = datetime.utcnow()
+    
+    def reset_for_retry(self) -> None:
+        """Return a failed, cancelled or interrupted transcription to pending for resumption"""
+        if self.status not in (
+            ProcessingStatus.FAILED,
+            ProcessingStatus.CANCELLED,
+            ProcessingStatus.PROCESSING,
+        ):
+            raise InvalidStatusTransitionError(
+                self.status.value,
+                ProcessingStatus.PENDING.value
+            )
+        self.status = ProcessingStatus.PENDING
+        self.error_message = None
+        self.updated_at = datetime.utcnow()
+    
+    def has_reached(self, stage: ProcessingStage) -> bool:
+        """Check whether the given stage has already been completed"""
+        return self.stage.order >= stage.order
+    
+    def _advance_stage(self, stage: ProcessingStage) -> None:
+        """Move the stage checkpoint forward (never backward)"""
+        if not self.has_reached(stage):
+            self.stage = stage
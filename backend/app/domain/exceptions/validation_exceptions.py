@@ -1,4 +1,5 @@
 """Validation exceptions"""
+from typing import Optional
 
 from app.domain.exceptions.domain_exceptions import DomainException
 
@@ -19,6 +20,24 @@ class TranscriptionProviderError(DomainException):
 
 
 class SummarizationProviderError(DomainException):
-    """Error from summarization provider"""
-    pass
+    """
+    Error from summarization provider
+    
+    `retryable` marks transient failures (rate limiting, server errors,
+    timeouts) that another attempt or another model may not hit;
+    `rate_limited` marks 429s, with the provider's suggested wait in
+    seconds as `retry_after` if given.
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        retryable: bool = False,
+        rate_limited: bool = False,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.retryable = retryable or rate_limited
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
 
@@ -0,0 +1,59 @@
+"""Offline (batch) summarization provider interface"""
+from abc import ABC, abstractmethod
+from typing import List, Sequence, Tuple
+from uuid import UUID
+
+from app.domain.value_objects.summary_batch import BatchResult, BatchState
+
+
+class BatchSummarizationProvider(ABC):
+    """Interface for providers that summarize many transcripts asynchronously"""
+    
+    @abstractmethod
+    def accepts(self, transcript: str) -> bool:
+        """
+        Check whether a transcript can be summarized in one batch request
+        
+        Transcripts too large for a single call (map-reduce sized) have to
+        be summarized by the realtime provider instead.
+        """
+        pass
+    
+    @abstractmethod
+    async def submit(self, requests: Sequence[Tuple[UUID, str]]) -> str:
+        """
+        Submit transcripts for summarization as one batch
+        
+        Args:
+            requests: (transcription_id, transcript) pairs, each accepted
+        
+        Returns:
+            Batch ID to poll
+        
+        Raises:
+            SummarizationProviderError: If the batch cannot be submitted
+            ValueError: If a transcript is not accepted
+        """
+        pass
+    
+    @abstractmethod
+    async def poll(self, batch_id: str) -> BatchState:
+        """
+        Get the progress of a batch
+        
+        Raises:
+            SummarizationProviderError: If the batch cannot be retrieved
+        """
+        pass
+    
+    @abstractmethod
+    async def results(self, batch_id: str) -> List[BatchResult]:
+        """
+        Get the outcome of each request of a finished batch
+        
+        Requests without an outcome (e.g. in an expired batch) are left out.
+        
+        Raises:
+            SummarizationProviderError: If the results cannot be retrieved
+        """
+        pass
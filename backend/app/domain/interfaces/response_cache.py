@@ -0,0 +1,42 @@
+"""Response cache interface"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ResponseCache(ABC):
+    """Interface for a byte-oriented key/value cache of serialized responses"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached bytes, or None on a miss
+        """
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value
+        
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl_seconds: Optional time to live
+        """
+        pass
+    
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Remove values
+        
+        Args:
+            keys: Cache keys to remove
+        """
+        pass
@@ -1,9 +1,13 @@
 """Summarization provider interface"""
 from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional
 from uuid import UUID
 
 from app.domain.entities.summary import Summary
 
+# Receives a summary section (name and value) as soon as it is generated
+SectionCallback = Callable[[str, Any], Awaitable[None]]
+
 
 class SummarizationProvider(ABC):
     """Interface for text summarization providers"""
@@ -14,6 +18,7 @@ class SummarizationProvider(ABC):
         transcript: str,
         transcription_id: UUID,
         language: str = "sw",
+        on_section: Optional[SectionCallback] = None,
     ) -> Summary:
         """
         Summarize transcript text
@@ -22,6 +27,10 @@ class SummarizationProvider(ABC):
             transcript: Transcript text to summarize
             transcription_id: ID of the transcription
             language: Language code (default: "sw" for Swahili)
+            on_section: Called with each section (muhtasari, maamuzi, kazi,
+                masuala_yaliyoahirishwa) as soon as it is complete, by
+                providers that stream; sections are normalized as on the
+                returned summary
         
         Returns:
             Summary entity with structured summary
@@ -11,6 +11,7 @@ class TranscriptionProvider(ABC):
         audio_file: bytes,
         language_hint: str = "sw",
         filename: str | None = None,
+        previous_text: str | None = None,
     ) -> str:
         """
         Transcribe audio to text
@@ -19,6 +20,8 @@ class TranscriptionProvider(ABC):
             audio_file: Audio file bytes
             language_hint: Language code hint (default: "sw" for Swahili)
             filename: Optional filename with extension for proper format detection
+            previous_text: Transcript of the preceding audio when a recording
+                is transcribed in chunks, used to keep the chunks consistent
         
         Returns:
             Transcribed text
@@ -3,7 +3,14 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
+from app.domain.entities.summary import Summary
 from app.domain.entities.transcription import Transcription
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.domain.value_objects.transcription_listing import (
+    ListingCursor,
+    TranscriptionListItem,
+)
+from app.domain.value_objects.transcription_search import TranscriptionSearchHit
 
 
 class TranscriptionRepository(ABC):
@@ -16,7 +23,12 @@ class TranscriptionRepository(ABC):
     
     @abstractmethod
     async def get_by_id(self, transcription_id: UUID) -> Transcription:
-        """Get transcription by ID"""
+        """Get transcription by ID (summary is not loaded; see get_summary)"""
+        pass
+    
+    @abstractmethod
+    async def get_summary(self, transcription_id: UUID) -> Optional[Summary]:
+        """Get the summary of a transcription, or None if it has none yet"""
         pass
     
     @abstractmethod
@@ -24,6 +36,61 @@ class TranscriptionRepository(ABC):
         """Update transcription"""
         pass
     
+    @abstractmethod
+    async def get_many(self, transcription_ids: List[UUID]) -> List[Transcription]:
+        """Get the transcriptions that exist among the IDs (summaries are not loaded)"""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, transcriptions: List[Transcription]) -> None:
+        """Update several transcriptions in a single transaction"""
+        pass
+    
+    @abstractmethod
+    async def list_awaiting_summary(
+        self,
+        limit: int = 100,
+        after: Optional[UUID] = None,
+    ) -> List[UUID]:
+        """
+        List transcriptions with a transcript but no summary, not being processed
+        
+        Args:
+            limit: Maximum number of IDs to return
+            after: Last ID of the previous page (IDs are returned in ascending order)
+        
+        Returns:
+            Transcription IDs
+        """
+        pass
+    
+    @abstractmethod
+    async def list_outdated_summaries(
+        self,
+        prompt_version: str,
+        limit: int = 100,
+        after: Optional[UUID] = None,
+    ) -> List[UUID]:
+        """
+        List transcriptions whose summary was generated with another prompt version
+        
+        Summaries without a recorded prompt version count as outdated.
+        
+        Args:
+            prompt_version: Current prompt version
+            limit: Maximum number of IDs to return
+            after: Last ID of the previous page (IDs are returned in ascending order)
+        
+        Returns:
+            Transcription IDs
+        """
+        pass
+    
+    @abstractmethod
+    async def count_outdated_summaries(self, prompt_version: str) -> int:
+        """Count summaries generated with another (or an unknown) prompt version"""
+        pass
+    
     @abstractmethod
     async def get_all(
         self,
@@ -32,4 +99,42 @@ class TranscriptionRepository(ABC):
     ) -> List[Transcription]:
         """Get all transcriptions with pagination"""
         pass
-
+    
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int = 20,
+        after: Optional[ListingCursor] = None,
+        statuses: Optional[List[ProcessingStatus]] = None,
+    ) -> List[TranscriptionListItem]:
+        """
+        List transcriptions newest first using keyset pagination
+        
+        Args:
+            limit: Maximum number of items to return
+            after: Cursor of the last item of the previous page
+            statuses: Optional status filter
+        
+        Returns:
+            Lightweight list items (transcript and summary bodies are not loaded)
+        """
+        pass
+    
+    @abstractmethod
+    async def search(
+        self,
+        terms: List[str],
+        limit: int = 20,
+    ) -> List[TranscriptionSearchHit]:
+        """
+        Full-text search over transcripts and summaries
+        
+        Args:
+            terms: Normalized search terms (see SwahiliProcessor.search_terms);
+                each term matches as a prefix and any term may match
+            limit: Maximum number of hits to return
+        
+        Returns:
+            Hits ordered by relevance, best first
+        """
+        pass
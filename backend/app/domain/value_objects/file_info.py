@@ -23,6 +23,17 @@ class FileInfo:
     # Constants
     MAX_FILE_SIZE_BYTES = 25 * 1024 * 1024  # 25MB
     
+    # Typical bytes per second of audio, used to estimate duration without decoding
+    BYTES_PER_SECOND = {
+        ".mp3": 16_000,  # 128 kbps
+        ".wav": 176_400,  # 16-bit 44.1 kHz stereo PCM
+        ".mp4": 16_000,
+        ".m4a": 16_000,
+        ".webm": 16_000,
+        ".ogg": 16_000,
+    }
+    DEFAULT_BYTES_PER_SECOND = 16_000
+    
     @classmethod
     def get_allowed_extensions(cls) -> set[str]:
         """Get allowed extensions from settings"""
@@ -59,6 +70,15 @@ class FileInfo:
             origin=origin,
         )
     
+    @property
+    def estimated_duration_seconds(self) -> float:
+        """Estimate audio duration from file size and format"""
+        bytes_per_second = self.BYTES_PER_SECOND.get(
+            self.extension,
+            self.DEFAULT_BYTES_PER_SECOND,
+        )
+        return self.size_bytes / bytes_per_second
+    
     def validate(self) -> None:
         """Validate file info and raise exceptions if invalid"""
         allowed_extensions = self.get_allowed_extensions()
@@ -0,0 +1,15 @@
+"""Processing stage value object"""
+from enum import Enum
+
+
+class ProcessingStage(str, Enum):
+    """Last pipeline stage a transcription has durably completed"""
+    
+    STORED = "stored"  # Audio saved to storage
+    TRANSCRIBED = "transcribed"  # Transcript persisted
+    SUMMARIZED = "summarized"  # Summary persisted
+    
+    @property
+    def order(self) -> int:
+        """Position of the stage in the pipeline"""
+        return list(ProcessingStage).index(self)
@@ -0,0 +1,27 @@
+"""Offline summarization batch value objects"""
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities.summary import Summary
+
+
+@dataclass(frozen=True)
+class BatchState:
+    """Progress of a submitted summarization batch"""
+    
+    id: str
+    status: str  # Provider status, e.g. "in_progress" or "completed"
+    finished: bool  # No further progress will be made (completed, failed, expired, cancelled)
+    completed: int = 0
+    failed: int = 0
+    total: int = 0
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one request of a batch: a summary or an error"""
+    
+    transcription_id: UUID
+    summary: Optional[Summary] = None
+    error: Optional[str] = None
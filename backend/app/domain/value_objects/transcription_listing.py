@@ -0,0 +1,58 @@
+"""Transcription listing value objects"""
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.domain.value_objects.processing_stage import ProcessingStage
+from app.domain.value_objects.processing_status import ProcessingStatus
+
+
+@dataclass(frozen=True)
+class TranscriptionListItem:
+    """Lightweight projection of a transcription without transcript or summary bodies"""
+    
+    id: UUID
+    filename: str
+    status: ProcessingStatus
+    stage: ProcessingStage
+    has_transcript: bool
+    has_summary: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class ListingCursor:
+    """Keyset position in the (created_at DESC, id DESC) listing order"""
+    
+    created_at: datetime
+    id: UUID
+    
+    @classmethod
+    def after(cls, item: TranscriptionListItem) -> "ListingCursor":
+        """Cursor pointing just past the given item"""
+        return cls(created_at=item.created_at, id=item.id)
+    
+    def encode(self) -> str:
+        """Encode cursor as an opaque URL-safe token"""
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    
+    @classmethod
+    def decode(cls, token: Optional[str]) -> Optional["ListingCursor"]:
+        """
+        Decode an opaque cursor token
+        
+        Raises:
+            ValueError: If the token is malformed
+        """
+        if not token:
+            return None
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, id_ = base64.urlsafe_b64decode(padded).decode().split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(id_))
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {token}") from e
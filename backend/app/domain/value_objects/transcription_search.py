@@ -0,0 +1,21 @@
+"""Transcription search value objects"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.value_objects.processing_status import ProcessingStatus
+
+
+@dataclass(frozen=True)
+class TranscriptionSearchHit:
+    """A transcription matching a full-text search, with its source texts for snippets"""
+    
+    id: UUID
+    filename: str
+    status: ProcessingStatus
+    rank: float
+    created_at: datetime
+    transcript_text: Optional[str] = None
+    muhtasari: Optional[str] = None
+    maamuzi: List[str] = field(default_factory=list)
@@ -0,0 +1,75 @@
+"""In-process LRU response cache"""
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.domain.interfaces.response_cache import ResponseCache
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    LRU cache bounded by entry count and total bytes
+    
+    Used as the in-process tier and as a local stand-in for the shared
+    tier in tests and single-instance deployments.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl_seconds: Optional[float] = None,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._size = 0
+    
+    @property
+    def size_bytes(self) -> int:
+        """Total bytes currently cached"""
+        return self._size
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached value and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries to stay in bounds"""
+        if len(value) > self._max_bytes:
+            return
+        
+        self._remove(key)
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._size += len(value)
+        
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+    
+    async def delete(self, *keys: str) -> None:
+        """Remove values"""
+        for key in keys:
+            self._remove(key)
+    
+    def _remove(self, key: str) -> None:
+        """Drop an entry and release its bytes"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
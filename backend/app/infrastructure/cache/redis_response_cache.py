@@ -0,0 +1,61 @@
+"""Redis-backed shared response cache"""
+from typing import Optional
+
+from app.domain.interfaces.response_cache import ResponseCache
+from app.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RedisResponseCache(ResponseCache):
+    """Shared cache tier so all API instances reuse each other's responses"""
+    
+    def __init__(self, url: str, key_prefix: str = "response-cache:"):
+        """
+        Initialize Redis cache
+        
+        Args:
+            url: Redis URL, e.g. redis://localhost:6379/0
+            key_prefix: Namespace prepended to every key
+        """
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise ValueError(
+                "RESPONSE_CACHE_URL is set but the 'redis' package is not installed"
+            ) from e
+        
+        self._client = redis.from_url(url)
+        self._prefix = key_prefix
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached value; cache errors degrade to a miss"""
+        try:
+            return await self._client.get(self._prefix + key)
+        except Exception as e:
+            logger.warning("response_cache.shared.error", operation="get", error=str(e))
+            return None
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value"""
+        try:
+            await self._client.set(
+                self._prefix + key,
+                value,
+                px=int(ttl_seconds * 1000) if ttl_seconds else None,
+            )
+        except Exception as e:
+            logger.warning("response_cache.shared.error", operation="set", error=str(e))
+    
+    async def delete(self, *keys: str) -> None:
+        """Remove values"""
+        if not keys:
+            return
+        try:
+            await self._client.delete(*(self._prefix + key for key in keys))
+        except Exception as e:
+            logger.warning("response_cache.shared.error", operation="delete", error=str(e))
+    
+    async def close(self) -> None:
+        """Close the connection pool"""
+        await self._client.aclose()
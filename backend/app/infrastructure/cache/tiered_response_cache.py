@@ -0,0 +1,48 @@
+"""Two-tier response cache"""
+from typing import Optional
+
+from app.domain.interfaces.response_cache import ResponseCache
+
+
+class TieredResponseCache(ResponseCache):
+    """
+    In-process tier in front of a shared tier
+    
+    Reads check the local tier first and populate it from the shared tier.
+    Local entries expire after a short TTL so an invalidation made by
+    another instance is picked up without cross-instance messaging.
+    """
+    
+    def __init__(
+        self,
+        local: ResponseCache,
+        shared: ResponseCache,
+        local_ttl_seconds: Optional[float] = 60.0,
+    ):
+        self._local = local
+        self._shared = shared
+        self._local_ttl = local_ttl_seconds
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get from the local tier, falling back to the shared tier"""
+        value = await self._local.get(key)
+        if value is not None:
+            return value
+        
+        value = await self._shared.get(key)
+        if value is not None:
+            await self._local.set(key, value, ttl_seconds=self._local_ttl)
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store in both tiers"""
+        local_ttl = self._local_ttl
+        if ttl_seconds is not None and (local_ttl is None or ttl_seconds < local_ttl):
+            local_ttl = ttl_seconds
+        await self._local.set(key, value, ttl_seconds=local_ttl)
+        await self._shared.set(key, value, ttl_seconds=ttl_seconds)
+    
+    async def delete(self, *keys: str) -> None:
+        """Remove from both tiers"""
+        await self._local.delete(*keys)
+        await self._shared.delete(*keys)
@@ -18,7 +18,94 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str
     openai_model: str = "gpt-3.5-turbo"  # Default model for summarization, can be overridden via env
+    summarization_routes: str = Field(
+        default="",
+        description=(
+            "Summarization models in preference order as model:max_input_tokens[:max_concurrency], "
+            "e.g. 'gpt-4o-mini:16000:8,gpt-4o:120000:2' (empty: OPENAI_MODEL only)"
+        )
+    )
+    summarization_cooldown_seconds: float = Field(
+        default=30.0,
+        description="How long a rate-limited model is skipped when no Retry-After is given"
+    )
+    summarization_max_prompt_tokens: int = Field(
+        default=0,
+        description="Largest summarization prompt per call, counted locally (0: the model's context window)"
+    )
+    summarization_completion_reserve_tokens: int = Field(
+        default=2000,
+        description="Context window tokens left for the summary itself"
+    )
+    summarization_trim_tolerance: float = Field(
+        default=0.1,
+        description="Share of an oversized transcript trimmed from the middle before switching to map-reduce"
+    )
+    summarization_streaming: bool = Field(
+        default=True,
+        description="Stream summaries and publish each section to progress subscribers as it is generated"
+    )
+    summary_backfill_model: str = Field(
+        default="",
+        description="Model for batch (backfill) summarization (empty: OPENAI_MODEL)"
+    )
+    summary_backfill_api_key: str = Field(
+        default="",
+        description="API key for batch summarization; a separate project keeps its usage off the interactive limits (empty: OPENAI_API_KEY)"
+    )
+    summary_backfill_base_url: str = Field(
+        default="",
+        description="Base URL of the Batch API (empty: OpenAI); point at a local stand-in for testing"
+    )
+    summary_backfill_batch_size: int = Field(
+        default=1000,
+        description="Transcripts per batch file"
+    )
+    summary_backfill_poll_interval_seconds: float = Field(
+        default=60.0,
+        description="Wait between polls of unfinished batches"
+    )
+    summary_backfill_completion_window: str = Field(
+        default="24h",
+        description="Time the provider has to finish a batch"
+    )
+    resummarization_rate_per_minute: float = Field(
+        default=30.0,
+        description="Summaries regenerated per minute when refreshing outdated summaries"
+    )
+    resummarization_page_size: int = Field(
+        default=100,
+        description="Outdated summaries read per keyset scan"
+    )
+    progress_keepalive_seconds: float = Field(
+        default=15.0,
+        description="Interval of keep-alive comments on progress event streams"
+    )
     openai_whisper_model: str = "whisper-1"  # Whisper model for transcription, can be overridden via env
+    whisper_prompt_enabled: bool = Field(
+        default=True,
+        description="Prompt transcription with lexicon terms so they are recognized and spelled correctly"
+    )
+    whisper_prompt_max_tokens: int = Field(
+        default=200,
+        description="Token budget of the transcription prompt (Whisper uses at most 224)"
+    )
+    transcript_remove_fillers: bool = Field(
+        default=True,
+        description="Drop filler words (the filler_words lexicon) from transcripts"
+    )
+    transcript_max_repeated_ngram: int = Field(
+        default=8,
+        description="Longest phrase, in words, collapsed when repeated in a loop (0 disables)"
+    )
+    transcript_min_repeats: int = Field(
+        default=3,
+        description="Consecutive occurrences from which a repeated phrase is kept once"
+    )
+    transcript_normalize_whitespace: bool = Field(
+        default=True,
+        description="Collapse whitespace and drop invisible characters in transcripts"
+    )
     
     # File Storage
     upload_dir: str = "./uploads"  # For local development
@@ -47,9 +134,113 @@ class Settings(BaseSettings):
         description="Cloudflare R2 bucket name"
     )
     
+    # Processing
+    process_in_background: bool = Field(
+        default=False,
+        description="Return from upload immediately and process the job in the background"
+    )
+    worker_concurrency: int = Field(
+        default=4,
+        description="Maximum number of transcription jobs processed concurrently"
+    )
+    reserved_interactive_workers: int = Field(
+        default=1,
+        description="Worker slots reserved for interactive (live recording) jobs"
+    )
+    interactive_origins: str = "browser-recording,meet-extension"
+    batch_origins: str = "batch"
+    scheduler_weights: str = Field(
+        default="",
+        description="Fair-queuing weights per tenant/origin, e.g. 'file-upload:2,batch:1'"
+    )
+    job_deadline_min_seconds: float = Field(
+        default=300.0,
+        description="Minimum processing deadline for a job"
+    )
+    job_deadline_per_audio_second: float = Field(
+        default=1.0,
+        description="Processing seconds allowed per second of (estimated) audio"
+    )
+    
+    # Response cache
+    response_cache_enabled: bool = Field(
+        default=True,
+        description="Cache serialized transcript/summary responses of completed transcriptions"
+    )
+    response_cache_max_entries: int = 1024
+    response_cache_max_mb: int = 64
+    response_cache_url: str | None = Field(
+        default=None,
+        description="Optional Redis URL for a cache tier shared by all instances"
+    )
+    response_cache_ttl_seconds: float = Field(
+        default=86400.0,
+        description="Time to live of cached responses in the shared tier"
+    )
+    response_cache_local_ttl_seconds: float = Field(
+        default=300.0,
+        description="Time to live of in-process entries, bounding staleness across instances"
+    )
+    
+    # Response compression
+    compression_enabled: bool = True
+    compression_minimum_size: int = Field(
+        default=1024,
+        description="Responses smaller than this many bytes are sent uncompressed"
+    )
+    
+    # Lexicons
+    lexicon_dir: str | None = Field(
+        default=None,
+        description="Directory of technical term / proper noun lists (with tenants/<tenant>/ overlays)"
+    )
+    lexicon_reload_interval_seconds: float = Field(
+        default=30.0,
+        description="How often the lexicon directory is checked for changes (0 disables reloading)"
+    )
+    
+    # Observability
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Expose Prometheus metrics at /metrics"
+    )
+    server_timing_enabled: bool = Field(
+        default=True,
+        description="Add a Server-Timing header with per-stage durations to responses"
+    )
+    tracing_enabled: bool = Field(
+        default=False,
+        description="Trace requests and processing jobs"
+    )
+    tracing_service_name: str = "swahili-transcriber-api"
+    tracing_export_path: str = Field(
+        default="./traces/spans.jsonl",
+        description="File spans are appended to (OTLP/JSON lines) when no collector endpoint is set"
+    )
+    tracing_otlp_endpoint: str | None = Field(
+        default=None,
+        description="OTLP/HTTP traces URL of an OpenTelemetry collector, e.g. http://localhost:4318/v1/traces"
+    )
+    
     # Application
     environment: str = "development"
     log_level: str = "INFO"
+    log_async: bool = Field(
+        default=True,
+        description="Write log records from a background thread instead of the event loop"
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        description="Log records buffered for the writer thread before new ones are dropped"
+    )
+    log_sample_rates: str = Field(
+        default="",
+        description="Fraction of info/debug events to keep, as event:rate pairs"
+    )
+    log_max_field_length: int = Field(
+        default=1024,
+        description="String log fields longer than this are truncated and hashed"
+    )
     cors_origins: str = "http://localhost:5173"
     
     model_config = SettingsConfigDict(
@@ -68,6 +259,49 @@ class Settings(BaseSettings):
     def cors_origins_list(self) -> list[str]:
         """Get CORS origins as a list"""
         return [origin.strip() for origin in self.cors_origins.split(",")]
+    
+    @property
+    def interactive_origins_set(self) -> set[str]:
+        """Get interactive upload origins as a set"""
+        return {origin.strip() for origin in self.interactive_origins.split(",") if origin.strip()}
+    
+    @property
+    def batch_origins_set(self) -> set[str]:
+        """Get batch upload origins as a set"""
+        return {origin.strip() for origin in self.batch_origins.split(",") if origin.strip()}
+    
+    @property
+    def log_sample_rates_map(self) -> dict[str, float]:
+        """Get log sampling rates as a mapping of event to rate"""
+        rates = {}
+        for entry in self.log_sample_rates.split(","):
+            if ":" in entry:
+                event, rate = entry.rsplit(":", 1)
+                rates[event.strip()] = float(rate)
+        return rates
+    
+    @property
+    def summarization_routes_list(self) -> list[tuple[str, int, int]]:
+        """Get summarization routes as (model, max_input_tokens, max_concurrency) tuples"""
+        routes = []
+        for entry in self.summarization_routes.split(","):
+            parts = [part.strip() for part in entry.split(":")]
+            if len(parts) >= 2 and parts[0]:
+                concurrency = int(parts[2]) if len(parts) > 2 else self.worker_concurrency
+                routes.append((parts[0], int(parts[1]), concurrency))
+        if not routes:
+            routes.append((self.openai_model, 128000, self.worker_concurrency))
+        return routes
+    
+    @property
+    def scheduler_weights_map(self) -> dict[str, float]:
+        """Get fair-queuing weights as a mapping of key to weight"""
+        weights = {}
+        for entry in self.scheduler_weights.split(","):
+            if ":" in entry:
+                key, weight = entry.split(":", 1)
+                weights[key.strip()] = float(weight)
+        return weights
 
 
 settings = Settings()
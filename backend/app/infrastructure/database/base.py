@@ -1,9 +1,15 @@
 """SQLAlchemy base configuration"""
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.infrastructure.config.settings import settings
+from app.shared.metrics import DB_POOL_CHECKED_OUT, DB_QUERY_SECONDS
+from app.shared.serialization import dumps_str, loads
+from app.shared.timing import record_timing
 
 # Determine if we're using PostgreSQL or SQLite
 is_postgresql = settings.database_url.startswith("postgresql")
@@ -32,9 +38,49 @@ engine = create_async_engine(
     settings.database_url,
     echo=False,  # Disable SQL query logging
     future=True,
+    # orjson for JSON/JSONB columns (summary lists)
+    json_serializer=dumps_str,
+    json_deserializer=loads,
     **pool_kwargs,
 )
 
+# Statement timing (metrics and request timings) and pool checkout tracking
+_QUERY_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _observe_query_time(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    keyword = statement.lstrip()[:8].split(None, 1)[:1]
+    operation = keyword[0].upper() if keyword else "OTHER"
+    if operation not in _QUERY_OPERATIONS:
+        operation = "OTHER"
+    DB_QUERY_SECONDS.labels(operation=operation).observe(elapsed)
+    record_timing("db", elapsed)
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _discard_query_timer(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+
+@event.listens_for(engine.sync_engine.pool, "checkout")
+def _track_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKED_OUT.inc()
+
+
+@event.listens_for(engine.sync_engine.pool, "checkin")
+def _track_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
 # Create async session factory
 AsyncSessionLocal = sessionmaker(
     engine,
@@ -0,0 +1,79 @@
+"""SQLAlchemy model for the transcription full-text search index"""
+from uuid import UUID
+
+from sqlalchemy import DDL, ForeignKey, Integer, Text, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.transcription_model import GUID
+
+FTS_TABLE = "search_documents_fts"
+
+# SQLite: FTS5 external-content table kept in sync by triggers, so the
+# normalized terms are stored once and the index is maintained per row
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "summary_terms, transcript_terms, "
+    "content='search_documents', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, summary_terms, transcript_terms) "
+    "VALUES (new.id, new.summary_terms, new.transcript_terms); END",
+    "CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, summary_terms, transcript_terms) "
+    "VALUES ('delete', old.id, old.summary_terms, old.transcript_terms); END",
+    "CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, summary_terms, transcript_terms) "
+    "VALUES ('delete', old.id, old.summary_terms, old.transcript_terms); "
+    f"INSERT INTO {FTS_TABLE}(rowid, summary_terms, transcript_terms) "
+    "VALUES (new.id, new.summary_terms, new.transcript_terms); END",
+]
+
+# PostgreSQL: generated tsvector (summary weighted above transcript) with a
+# GIN index. The 'simple' configuration is used because terms are already
+# normalized by SwahiliProcessor; PostgreSQL ships no Swahili dictionary.
+POSTGRESQL_SEARCH_DDL = [
+    "ALTER TABLE search_documents ADD COLUMN IF NOT EXISTS document tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(summary_terms, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(transcript_terms, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS ix_search_documents_document "
+    "ON search_documents USING GIN (document)",
+]
+
+
+class SearchDocumentModel(Base):
+    """Normalized search terms of a transcription's transcript and summary"""
+    
+    __tablename__ = "search_documents"
+    
+    # Integer key doubles as the FTS5 rowid on SQLite
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    transcription_id: Mapped[UUID] = mapped_column(
+        GUID(),
+        ForeignKey("transcriptions.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    summary_terms: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    transcript_terms: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        SearchDocumentModel.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+for statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(
+        SearchDocumentModel.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+event.listen(
+    SearchDocumentModel.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,116 @@
+"""SQLAlchemy models for Summary and its action items"""
+from typing import Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy import JSON, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.domain.entities.summary import ActionItem, Summary
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.transcription_model import GUID
+
+# Native JSONB on PostgreSQL, JSON elsewhere (SQLite stores it as text)
+JSONList = JSON().with_variant(JSONB(), "postgresql")
+
+
+class SummaryModel(Base):
+    """SQLAlchemy model for summary"""
+    
+    __tablename__ = "summaries"
+    
+    id: Mapped[UUID] = mapped_column(GUID(), primary_key=True)
+    transcription_id: Mapped[UUID] = mapped_column(
+        GUID(),
+        ForeignKey("transcriptions.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    muhtasari: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    maamuzi: Mapped[List[Any]] = mapped_column(JSONList, nullable=False, default=list)
+    masuala_yaliyoahirishwa: Mapped[List[Any]] = mapped_column(
+        JSONList,
+        nullable=False,
+        default=list,
+    )
+    model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    prompt_version: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)
+    prompt_mode: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    prompt_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    completion_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    
+    kazi: Mapped[List["ActionItemModel"]] = relationship(
+        back_populates="summary",
+        cascade="all, delete-orphan",
+        order_by="ActionItemModel.position",
+        lazy="selectin",
+        passive_deletes=True,
+    )
+    
+    @classmethod
+    def from_entity(cls, summary: Summary) -> "SummaryModel":
+        """Create model from domain entity"""
+        return cls(
+            id=summary.id,
+            transcription_id=summary.transcription_id,
+            muhtasari=summary.muhtasari,
+            maamuzi=list(summary.maamuzi),
+            masuala_yaliyoahirishwa=list(summary.masuala_yaliyoahirishwa),
+            model=summary.model,
+            prompt_version=summary.prompt_version,
+            prompt_mode=summary.prompt_mode,
+            prompt_tokens=summary.prompt_tokens,
+            completion_tokens=summary.completion_tokens,
+            kazi=[
+                ActionItemModel(
+                    position=position,
+                    person=item.person,
+                    task=item.task,
+                    due_date=item.due_date,
+                )
+                for position, item in enumerate(summary.kazi)
+            ],
+        )
+    
+    def to_entity(self) -> Summary:
+        """Convert model to domain entity"""
+        return Summary(
+            id=self.id,
+            transcription_id=self.transcription_id,
+            muhtasari=self.muhtasari,
+            maamuzi=list(self.maamuzi or []),
+            kazi=[
+                ActionItem(
+                    person=item.person,
+                    task=item.task,
+                    due_date=item.due_date,
+                )
+                for item in self.kazi
+            ],
+            masuala_yaliyoahirishwa=list(self.masuala_yaliyoahirishwa or []),
+            model=self.model,
+            prompt_version=self.prompt_version,
+            prompt_mode=self.prompt_mode,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+        )
+
+
+class ActionItemModel(Base):
+    """SQLAlchemy model for a summary action item"""
+    
+    __tablename__ = "action_items"
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    summary_id: Mapped[UUID] = mapped_column(
+        GUID(),
+        ForeignKey("summaries.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    person: Mapped[str] = mapped_column(String(255), nullable=False, default="", index=True)
+    task: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    due_date: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    
+    summary: Mapped[SummaryModel] = relationship(back_populates="kazi")
@@ -0,0 +1 @@
+"""Lexicon sources"""
@@ -0,0 +1,62 @@
+"""Lexicons loaded from text files"""
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.application.services.lexicon import CATEGORIES, Lexicon
+
+
+class FileLexiconSource:
+    """
+    Loads lexicons from a directory of plain-text term lists
+    
+    Layout (one term per line; blank lines and lines starting with `#` are ignored):
+        
+        <root>/technical_terms.txt
+        <root>/proper_nouns.txt
+        <root>/filler_words.txt
+        <root>/tenants/<tenant>/<category>.txt
+    
+    Missing files are treated as empty. Changes are detected from file
+    modification times and sizes, without reading the files.
+    """
+    
+    def __init__(self, root: str):
+        self._root = Path(root)
+    
+    def fingerprint(self) -> str:
+        """Hash of the paths, sizes and modification times of the term files"""
+        digest = hashlib.sha256()
+        for path in self._files():
+            stat = path.stat()
+            digest.update(f"{path.relative_to(self._root)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+    
+    def load(self) -> Tuple[Lexicon, Dict[str, Lexicon]]:
+        """Read the base lexicon and every tenant overlay"""
+        base = self._load_dir(self._root)
+        overlays = {}
+        tenants = self._root / "tenants"
+        if tenants.is_dir():
+            for directory in sorted(tenants.iterdir()):
+                if directory.is_dir():
+                    overlays[directory.name] = self._load_dir(directory)
+        return base, overlays
+    
+    def _files(self) -> List[Path]:
+        if not self._root.is_dir():
+            return []
+        return sorted(
+            path for path in self._root.rglob("*.txt")
+            if path.stem in CATEGORIES and path.is_file()
+        )
+    
+    @staticmethod
+    def _load_dir(directory: Path) -> Lexicon:
+        terms = {}
+        for category in CATEGORIES:
+            path = directory / f"{category}.txt"
+            if path.is_file():
+                lines = path.read_text(encoding="utf-8").splitlines()
+                terms[category] = [line for line in lines if not line.lstrip().startswith("#")]
+        return Lexicon(terms)
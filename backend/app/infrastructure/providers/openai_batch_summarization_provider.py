@@ -0,0 +1,187 @@
+"""OpenAI Batch API summarization provider"""
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from openai import AsyncOpenAI
+
+from app.application.services.prompt_budget import DIRECT, MAP_REDUCE, PromptBudget, PromptPlan
+from app.domain.exceptions.validation_exceptions import SummarizationProviderError
+from app.domain.interfaces.batch_summarization_provider import BatchSummarizationProvider
+from app.domain.value_objects.summary_batch import BatchResult, BatchState
+from app.infrastructure.providers.openai_summarization_provider import (
+    build_messages,
+    parse_summary,
+)
+from app.shared.logging import get_logger
+from app.shared.serialization import dumps, loads
+from app.shared.tokens import TokenCounter, context_window
+
+logger = get_logger(__name__)
+
+# Batch statuses after which a batch makes no further progress
+_FINISHED_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+_ENDPOINT = "/v1/chat/completions"
+
+
+class OpenAIBatchSummarizationProvider(BatchSummarizationProvider):
+    """
+    Summarizes transcripts through the OpenAI Batch API
+    
+    Each batch is uploaded as a JSONL file of chat completion requests
+    (one per transcript, keyed by transcription ID) and processed by OpenAI
+    within the completion window, against the batch quota rather than the
+    realtime rate limits. Requests and responses match the realtime
+    provider's, so batch summaries are interchangeable with realtime ones.
+    
+    Prompts are kept within the same budget as the realtime provider's
+    (see PromptBudget). A batch request is a single call, so a transcript
+    is sent directly or trimmed; one that would need map-reduce is not
+    accepted. The mode used travels in the request's custom ID and is
+    recorded on the summary.
+    
+    Args:
+        client: OpenAI client (a separate client keeps batch traffic off the
+            interactive connection pool and, with its own key, its quota)
+        model: Chat model to call
+        completion_window: Time OpenAI has to finish a batch
+        max_prompt_tokens: Largest prompt per request (0: the model's
+            context window less `completion_reserve_tokens`)
+        completion_reserve_tokens: Context left for the completion
+        trim_tolerance: Share of a transcript that may be trimmed
+    """
+    
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str = "gpt-3.5-turbo",
+        completion_window: str = "24h",
+        max_prompt_tokens: int = 0,
+        completion_reserve_tokens: int = 2000,
+        trim_tolerance: float = 0.1,
+    ):
+        self._client = client
+        self._model = model
+        self._completion_window = completion_window
+        self._counter = TokenCounter(model)
+        limit = context_window(model) - completion_reserve_tokens
+        if max_prompt_tokens > 0:
+            limit = min(limit, max_prompt_tokens)
+        self._budget = PromptBudget(self._counter, limit, trim_tolerance)
+    
+    def accepts(self, transcript: str) -> bool:
+        """Whether the transcript fits one request, directly or trimmed"""
+        return self._plan(transcript).mode != MAP_REDUCE
+    
+    async def submit(self, requests: Sequence[Tuple[UUID, str]]) -> str:
+        """Upload the requests as a batch file and start the batch"""
+        lines = []
+        for transcription_id, transcript in requests:
+            plan = self._plan(transcript)
+            if plan.mode == MAP_REDUCE:
+                raise ValueError(f"Transcript of {transcription_id} needs map-reduce, not a batch request")
+            lines.append(dumps({
+                "custom_id": f"{transcription_id}:{plan.mode}",
+                "method": "POST",
+                "url": _ENDPOINT,
+                "body": {
+                    "model": self._model,
+                    "messages": build_messages(plan.parts[0]),
+                    "temperature": 0.3,
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+        try:
+            batch_file = await self._client.files.create(
+                file=("summaries.jsonl", b"\n".join(lines) + b"\n"),
+                purpose="batch",
+            )
+            batch = await self._client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint=_ENDPOINT,
+                completion_window=self._completion_window,
+                metadata={"purpose": "summary_backfill"},
+            )
+        except Exception as e:
+            raise SummarizationProviderError(f"Failed to submit summary batch: {str(e)}") from e
+        
+        logger.info(
+            "summary_batch.submitted",
+            batch_id=batch.id,
+            requests=len(lines),
+            model=self._model,
+        )
+        return batch.id
+    
+    async def poll(self, batch_id: str) -> BatchState:
+        """Get the progress of a batch"""
+        try:
+            batch = await self._client.batches.retrieve(batch_id)
+        except Exception as e:
+            raise SummarizationProviderError(f"Failed to retrieve summary batch: {str(e)}") from e
+        
+        counts = batch.request_counts
+        return BatchState(
+            id=batch.id,
+            status=batch.status,
+            finished=batch.status in _FINISHED_STATUSES,
+            completed=counts.completed if counts else 0,
+            failed=counts.failed if counts else 0,
+            total=counts.total if counts else 0,
+        )
+    
+    async def results(self, batch_id: str) -> List[BatchResult]:
+        """Read the output and error files of a finished batch"""
+        try:
+            batch = await self._client.batches.retrieve(batch_id)
+            outcomes = []
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    content = await self._client.files.content(file_id)
+                    outcomes.extend(line for line in content.text.splitlines() if line.strip())
+        except Exception as e:
+            raise SummarizationProviderError(f"Failed to read summary batch results: {str(e)}") from e
+        
+        return [self._result(line) for line in outcomes]
+    
+    def _plan(self, transcript: str) -> PromptPlan:
+        """Prompt plan of a transcript within the budget"""
+        return self._budget.plan(transcript, self._counter.count_messages(build_messages(transcript)))
+    
+    def _result(self, line: str) -> BatchResult:
+        """Outcome of one request from a line of a batch output or error file"""
+        outcome = loads(line)
+        # Batches submitted before modes were recorded have a bare ID
+        transcription_id, _, mode = outcome["custom_id"].partition(":")
+        transcription_id = UUID(transcription_id)
+        response = outcome.get("response") or {}
+        error = self._error(outcome, response)
+        if error is not None:
+            return BatchResult(transcription_id=transcription_id, error=error)
+        
+        try:
+            body = response["body"]
+            summary = parse_summary(body["choices"][0]["message"]["content"], transcription_id, self._model)
+        except (KeyError, IndexError, TypeError) as e:
+            return BatchResult(transcription_id=transcription_id, error=f"Malformed response: {e}")
+        except SummarizationProviderError as e:
+            return BatchResult(transcription_id=transcription_id, error=str(e))
+        
+        summary.prompt_mode = mode or DIRECT
+        usage = body.get("usage") or {}
+        summary.prompt_tokens = usage.get("prompt_tokens")
+        summary.completion_tokens = usage.get("completion_tokens")
+        return BatchResult(transcription_id=transcription_id, summary=summary)
+    
+    @staticmethod
+    def _error(outcome: dict, response: dict) -> Optional[str]:
+        """Error of a failed request, or None if it succeeded"""
+        error = outcome.get("error")
+        if error:
+            return error.get("message") if isinstance(error, dict) else str(error)
+        status_code = response.get("status_code")
+        if status_code != 200:
+            body = response.get("body") or {}
+            message = (body.get("error") or {}).get("message") if isinstance(body, dict) else None
+            return message or f"Request failed with status {status_code}"
+        return None
@@ -1,31 +1,225 @@
 """OpenAI GPT summarization provider"""
-import json
-from uuid import UUID
+import asyncio
+import contextlib
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
 
+import openai
 from openai import AsyncOpenAI
 
 from app.domain.entities.summary import ActionItem, Summary
 from app.domain.exceptions.validation_exceptions import SummarizationProviderError
-from app.domain.interfaces.summarization_provider import SummarizationProvider
+from app.domain.interfaces.summarization_provider import SectionCallback, SummarizationProvider
+from app.application.services.prompt_budget import DIRECT, MAP_REDUCE, TRIMMED, PromptBudget
 from app.application.services.swahili_processor import SwahiliProcessor
-from app.infrastructure.providers.prompts import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from app.infrastructure.providers.prompts import PROMPT_VERSION, SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 from app.shared.logging import get_logger
+from app.shared.metrics import (
+    PROVIDER_FAILURES_TOTAL,
+    PROVIDER_REQUEST_SECONDS,
+    SUMMARIZATION_TOKENS_TOTAL,
+)
+from app.shared.json_stream import JsonMemberStream
+from app.shared.timing import timed
+from app.shared.serialization import JSONDecodeError, loads
+from app.shared.tokens import TokenCounter, context_window
 
 logger = get_logger(__name__)
 
+# Rate limiting (429), server errors (5xx), timeouts and connection failures
+_TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError,
+)
+
+# Summary sections, in the order the prompt asks for them
+SECTIONS = ("muhtasari", "maamuzi", "kazi", "masuala_yaliyoahirishwa")
+
+
+def build_messages(transcript: str) -> List[Dict[str, str]]:
+    """Chat messages asking for the structured summary of a transcript"""
+    # Format user prompt with transcript
+    user_prompt = USER_PROMPT_TEMPLATE.format(transcript=transcript)
+    
+    # Enhance for code-switching awareness (preserve technical terms, names, etc.)
+    user_prompt = SwahiliProcessor.enhance_prompt_for_code_switching(
+        user_prompt,
+        transcript
+    )
+    
+    return [
+        {
+            "role": "system",
+            "content": SYSTEM_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": user_prompt,
+        },
+    ]
+
+
+def parse_summary(content: Optional[str], transcription_id: UUID, model: str) -> Summary:
+    """
+    Build the Summary entity from a completion's JSON content
+    
+    Args:
+        content: Message content returned by the model
+        transcription_id: ID of the summarized transcription
+        model: Model that generated the content
+    
+    Returns:
+        Summary entity with validated sections
+    
+    Raises:
+        SummarizationProviderError: If the content is empty or not JSON
+    """
+    if not content:
+        logger.error(
+            "summarization.empty_response",
+            transcription_id=str(transcription_id),
+        )
+        raise SummarizationProviderError("Empty response from OpenAI")
+    
+    # Log raw API response for debugging (truncated by the log pipeline)
+    logger.debug(
+        "summarization.raw_response",
+        transcription_id=str(transcription_id),
+        raw_response=content,
+        response_length=len(content),
+    )
+    
+    try:
+        summary_data = loads(content)
+    except JSONDecodeError as e:
+        # Log the raw response for debugging
+        logger.error(
+            "summarization.invalid_json",
+            transcription_id=str(transcription_id),
+            raw_response=content[:500],  # First 500 chars
+            error=str(e),
+        )
+        raise SummarizationProviderError(
+            f"Invalid JSON response from OpenAI: {str(e)}"
+        ) from e
+    if not isinstance(summary_data, dict):
+        raise SummarizationProviderError("Summary JSON from OpenAI is not an object")
+    
+    return Summary(
+        id=uuid4(),
+        transcription_id=transcription_id,
+        model=model,
+        prompt_version=PROMPT_VERSION,
+        **{name: _normalize_section(name, summary_data.get(name)) for name in SECTIONS},
+    )
+
+
+def partial_notes(summaries: List[Summary]) -> str:
+    """Summaries of consecutive parts of a meeting, as notes to summarize again"""
+    notes = []
+    for number, summary in enumerate(summaries, start=1):
+        lines = [f"Sehemu ya {number} ya kikao:", f"Muhtasari: {summary.muhtasari}"]
+        lines.extend(f"Uamuzi: {decision}" for decision in summary.maamuzi)
+        lines.extend(
+            f"Kazi: {item.person} - {item.task}" + (f" (tarehe: {item.due_date})" if item.due_date else "")
+            for item in summary.kazi
+        )
+        lines.extend(f"Suala lililoahirishwa: {topic}" for topic in summary.masuala_yaliyoahirishwa)
+        notes.append("\n".join(lines))
+    return "\n\n".join(notes)
+
+
+class _Usage:
+    """Tokens billed over the calls made for one summary"""
+    
+    __slots__ = ("prompt_tokens", "completion_tokens", "calls")
+    
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.calls = 0
+    
+    def add(self, usage: Any) -> None:
+        self.calls += 1
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens or 0
+            self.completion_tokens += usage.completion_tokens or 0
+
+
+def _normalize_section(name: str, value: Any) -> Any:
+    """Section value in the shape stored on the summary"""
+    if name == "muhtasari":
+        return value if isinstance(value, str) else ""
+    if not isinstance(value, list):
+        return []
+    if name == "kazi":
+        return [
+            ActionItem(
+                person=item.get("nani", "") or "",
+                task=item.get("kazi", "") or "",
+                due_date=item.get("tarehe") or None,
+            )
+            for item in value
+            if isinstance(item, dict)
+        ]
+    return value
+
 
 class OpenAISummarizationProvider(SummarizationProvider):
-    """OpenAI GPT implementation for summarization"""
+    """
+    OpenAI GPT implementation for summarization
+    
+    In streaming mode the completion is consumed as it is generated and its
+    JSON parsed incrementally, so each section reaches `on_section` as soon
+    as it closes rather than when the whole summary is done.
+    
+    Prompts are counted locally before any call and kept within the budget
+    (see PromptBudget): sent directly, trimmed, or summarized in parts
+    whose summaries are then combined by the same prompt (map-reduce). The
+    prompt mode and the billed tokens of every call are recorded on the
+    summary.
     
-    def __init__(self, client: AsyncOpenAI, model: str = "gpt-3.5-turbo"):
+    Args:
+        client: OpenAI client
+        model: Chat model to call
+        stream: Stream completions when a section callback is given
+        max_prompt_tokens: Largest prompt per call (0: the model's context
+            window less `completion_reserve_tokens`)
+        completion_reserve_tokens: Context left for the completion
+        trim_tolerance: Share of a transcript that may be trimmed rather
+            than summarized in parts
+        max_concurrency: Completions in flight at once across all
+            summaries, map-reduce part calls included (0: unlimited)
+    """
+    
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str = "gpt-3.5-turbo",
+        stream: bool = False,
+        max_prompt_tokens: int = 0,
+        completion_reserve_tokens: int = 2000,
+        trim_tolerance: float = 0.1,
+        max_concurrency: int = 0,
+    ):
         self._client = client
         self._model = model
+        self._stream = stream
+        self._calls = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        self._counter = TokenCounter(model)
+        limit = context_window(model) - completion_reserve_tokens
+        if max_prompt_tokens > 0:
+            limit = min(limit, max_prompt_tokens)
+        self._budget = PromptBudget(self._counter, limit, trim_tolerance)
     
     async def summarize(
         self,
         transcript: str,
         transcription_id: UUID,
         language: str = "sw",
+        on_section: Optional[SectionCallback] = None,
     ) -> Summary:
         """
         Summarize transcript text using OpenAI GPT
@@ -34,6 +228,8 @@ class OpenAISummarizationProvider(SummarizationProvider):
             transcript: Transcript text to summarize
             transcription_id: ID of the transcription
             language: Language code (default: "sw" for Swahili)
+            on_section: Called with each section as soon as it is complete
+                (streaming mode only)
         
         Returns:
             Summary entity with structured summary
@@ -58,111 +254,194 @@ class OpenAISummarizationProvider(SummarizationProvider):
             )
         
         try:
-            # Format user prompt with transcript
-            user_prompt = USER_PROMPT_TEMPLATE.format(transcript=transcript)
-            
-            # Enhance for code-switching awareness (preserve technical terms, names, etc.)
-            user_prompt = SwahiliProcessor.enhance_prompt_for_code_switching(
-                user_prompt,
-                transcript
-            )
+            messages = build_messages(transcript)
+            plan = self._budget.plan(transcript, self._counter.count_messages(messages))
+            usage = _Usage()
             
             # Call OpenAI API with improved prompt structure
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": SYSTEM_PROMPT,
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt,
-                    },
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
-            
-            # Parse response
-            content = response.choices[0].message.content
-            if not content:
-                logger.error(
-                    "summarization.empty_response",
-                    transcription_id=str(transcription_id),
-                )
-                raise SummarizationProviderError("Empty response from OpenAI")
-            
-            # Log raw API response for debugging
-            logger.info(
-                "summarization.raw_response",
-                transcription_id=str(transcription_id),
-                raw_response=content,
-                response_length=len(content),
-            )
-            
-            # Parse JSON response
-            try:
-                summary_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                # Log the raw response for debugging
-                logger.error(
-                    "summarization.invalid_json",
-                    transcription_id=str(transcription_id),
-                    raw_response=content[:500],  # First 500 chars
-                    error=str(e),
-                )
-                raise SummarizationProviderError(
-                    f"Invalid JSON response from OpenAI: {str(e)}"
-                ) from e
-            
-        
-            # Extract and validate data structure
-            normalized_data = {
-                "muhtasari": summary_data.get("muhtasari", ""),
-                "maamuzi": summary_data.get("maamuzi", []),
-                "kazi": summary_data.get("kazi", []),
-                "masuala_yaliyoahirishwa": summary_data.get("masuala_yaliyoahirishwa", []),
-            }
+            timer = PROVIDER_REQUEST_SECONDS.labels(provider="openai_summarization", model=self._model)
+            with timed("provider.summarization", timer, model=self._model):
+                if plan.mode == MAP_REDUCE:
+                    messages = await self._reduce_parts(plan.parts, transcription_id, usage)
+                elif plan.mode == TRIMMED:
+                    messages = build_messages(plan.parts[0])
+                content = await self._request(messages, transcription_id, on_section, usage)
             
-            # Validate array types
-            if not isinstance(normalized_data["maamuzi"], list):
-                normalized_data["maamuzi"] = []
-            if not isinstance(normalized_data["kazi"], list):
-                normalized_data["kazi"] = []
-            if not isinstance(normalized_data["masuala_yaliyoahirishwa"], list):
-                normalized_data["masuala_yaliyoahirishwa"] = []
-            
-            # Create Summary entity
-            from uuid import uuid4
-            summary = Summary(
-                id=uuid4(),
-                transcription_id=transcription_id,
-                muhtasari=normalized_data.get("muhtasari") or "",
-                maamuzi=normalized_data.get("maamuzi") or [],
-                kazi=[
-                    ActionItem(
-                        person=item.get("nani", "") or "",
-                        task=item.get("kazi", "") or "",
-                        due_date=item.get("tarehe") or None,
-                    )
-                    for item in (normalized_data.get("kazi") or [])
-                    if isinstance(item, dict)
-                ],
-                masuala_yaliyoahirishwa=normalized_data.get("masuala_yaliyoahirishwa") or [],
-            )
+            summary = parse_summary(content, transcription_id, self._model)
+            summary.prompt_mode = plan.mode
+            if usage.prompt_tokens or usage.completion_tokens:
+                summary.prompt_tokens = usage.prompt_tokens
+                summary.completion_tokens = usage.completion_tokens
+                SUMMARIZATION_TOKENS_TOTAL.labels(model=self._model, kind="prompt").inc(usage.prompt_tokens)
+                SUMMARIZATION_TOKENS_TOTAL.labels(model=self._model, kind="completion").inc(usage.completion_tokens)
             
             logger.info(
                 "summarization.completed",
                 transcription_id=str(transcription_id),
+                prompt_mode=plan.mode,
+                counted_prompt_tokens=plan.prompt_tokens,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                calls=usage.calls,
             )
             
             return summary
         
-        except SummarizationProviderError:
+        except SummarizationProviderError as e:
+            self._record_failure(e)
             raise
         except Exception as e:
+            self._record_failure(e)
             raise SummarizationProviderError(
-                f"Failed to summarize transcript: {str(e)}"
+                f"Failed to summarize transcript: {str(e)}",
+                retryable=isinstance(e, _TRANSIENT_ERRORS),
+                rate_limited=isinstance(e, openai.RateLimitError),
+                retry_after=self._retry_after(e),
             ) from e
-
+    
+    async def _request(
+        self,
+        messages: List[Dict[str, str]],
+        transcription_id: UUID,
+        on_section: Optional[SectionCallback],
+        usage: _Usage,
+    ) -> Optional[str]:
+        """Request the final summary, streamed if a section callback is given"""
+        if self._stream and on_section is not None:
+            return await self._stream_completion(messages, transcription_id, on_section, usage)
+        return await self._completion(messages, usage)
+    
+    async def _reduce_parts(
+        self,
+        parts: Sequence[str],
+        transcription_id: UUID,
+        usage: _Usage,
+    ) -> List[Dict[str, str]]:
+        """
+        Summarize the parts of an oversized transcript concurrently
+        
+        Part calls take the provider's call slots like any other, so every
+        round stays within its concurrency limit however many parts there
+        are; when one part fails, the others are cancelled.
+        
+        Returns:
+            Messages asking to combine the part summaries, within the budget
+        """
+        while True:
+            tasks = [
+                asyncio.ensure_future(self._completion(build_messages(part), usage))
+                for part in parts
+            ]
+            try:
+                contents = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            notes = partial_notes([
+                parse_summary(content, transcription_id, self._model) for content in contents
+            ])
+            logger.info(
+                "summarization.parts.summarized",
+                transcription_id=str(transcription_id),
+                parts=len(parts),
+            )
+            messages = build_messages(notes)
+            prompt_tokens = self._counter.count_messages(messages)
+            plan = self._budget.plan(notes, prompt_tokens)
+            if plan.mode == MAP_REDUCE and len(plan.parts) >= len(parts):
+                # Another round would not shrink the notes: trim them instead
+                plan = self._budget.plan(notes, prompt_tokens, map_reduce=False)
+            if plan.mode == DIRECT:
+                return messages
+            if plan.mode == TRIMMED:
+                return build_messages(plan.parts[0])
+            parts = plan.parts
+    
+    def _call_slot(self):
+        """Hold one of the model's concurrent call slots"""
+        return self._calls if self._calls is not None else contextlib.nullcontext()
+    
+    async def _completion(self, messages: List[Dict[str, str]], usage: _Usage) -> Optional[str]:
+        """Request the summary and return its content once complete"""
+        async with self._call_slot():
+            response = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+        usage.add(getattr(response, "usage", None))
+        return response.choices[0].message.content
+    
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        transcription_id: UUID,
+        on_section: SectionCallback,
+        usage: _Usage,
+    ) -> str:
+        """Stream the summary, passing each section on as it closes, and return its content"""
+        # The slot is held until the stream is consumed
+        async with self._call_slot():
+            stream = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                temperature=0.3,
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            started = time.perf_counter()
+            parser: Optional[JsonMemberStream] = JsonMemberStream()
+            parts: List[str] = []
+            stream_usage = None
+            async for chunk in stream:
+                # Usage arrives on a final chunk without choices
+                stream_usage = getattr(chunk, "usage", None) or stream_usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                if parser is None:
+                    continue
+                try:
+                    members = parser.feed(delta)
+                except JSONDecodeError:
+                    # Reported with the full content once the stream ends
+                    parser = None
+                    continue
+                for name, value in members:
+                    if name not in SECTIONS:
+                        continue
+                    logger.debug(
+                        "summarization.section.streamed",
+                        transcription_id=str(transcription_id),
+                        section=name,
+                        elapsed_seconds=round(time.perf_counter() - started, 3),
+                    )
+                    await on_section(name, _normalize_section(name, value))
+            usage.add(stream_usage)
+            return "".join(parts)
+    
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Retry-After header of a rate-limited response, in seconds"""
+        response = getattr(error, "response", None)
+        value = response.headers.get("retry-after") if response is not None else None
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _record_failure(error: Exception) -> None:
+        """Count a failed summarization call"""
+        cause = error.__cause__ or error
+        PROVIDER_FAILURES_TOTAL.labels(
+            provider="openai_summarization",
+            error_type=type(cause).__name__,
+        ).inc()
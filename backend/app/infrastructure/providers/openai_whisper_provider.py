@@ -1,12 +1,15 @@
 """OpenAI Whisper transcription provider"""
 import io
-from typing import BinaryIO
+from typing import BinaryIO, Optional
 
 from openai import AsyncOpenAI
 
+from app.application.services.whisper_prompt import WhisperPromptBuilder, estimate_tokens
 from app.domain.exceptions.validation_exceptions import TranscriptionProviderError
 from app.domain.interfaces.transcription_provider import TranscriptionProvider
 from app.shared.logging import get_logger
+from app.shared.metrics import PROVIDER_FAILURES_TOTAL, PROVIDER_REQUEST_SECONDS
+from app.shared.timing import timed
 
 logger = get_logger(__name__)
 
@@ -14,15 +17,22 @@ logger = get_logger(__name__)
 class OpenAIWhisperProvider(TranscriptionProvider):
     """OpenAI Whisper API implementation"""
     
-    def __init__(self, client: AsyncOpenAI, model: str = "whisper-1"):
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str = "whisper-1",
+        prompt_builder: Optional[WhisperPromptBuilder] = None,
+    ):
         self._client = client
         self._model = model
+        self._prompt_builder = prompt_builder
     
     async def transcribe(
         self,
         audio_file: bytes,
         language_hint: str = "sw",
         filename: str | None = None,
+        previous_text: str | None = None,
     ) -> str:
         """
         Transcribe audio to text using OpenAI Whisper API
@@ -31,6 +41,7 @@ class OpenAIWhisperProvider(TranscriptionProvider):
             audio_file: Audio file bytes
             language_hint: Language code hint (default: "sw" for Swahili)
             filename: Optional filename with extension for proper format detection
+            previous_text: Transcript of the preceding chunk, continued by the prompt
         
         Returns:
             Transcribed text
@@ -38,11 +49,18 @@ class OpenAIWhisperProvider(TranscriptionProvider):
         Raises:
             TranscriptionProviderError: If transcription fails
         """
+        # Bias recognition towards lexicon terms (and the preceding chunk);
+        # built from cached lexicon data, so it costs no extra calls
+        prompt = ""
+        if self._prompt_builder is not None:
+            prompt = self._prompt_builder.build(previous_text=previous_text)
+        
         logger.info(
             "transcription.started",
             language=language_hint,
             file_size=len(audio_file),
             filename=filename,
+            prompt_tokens=estimate_tokens(prompt),
         )
         
         try:
@@ -56,12 +74,15 @@ class OpenAIWhisperProvider(TranscriptionProvider):
                 audio_file_obj.name = "audio.mp3"  # Default fallback
             
             # Call OpenAI Whisper API
-            response = await self._client.audio.transcriptions.create(
-                model=self._model,
-                file=audio_file_obj,
-                language=language_hint,
-                response_format="text",
-            )
+            timer = PROVIDER_REQUEST_SECONDS.labels(provider="openai_whisper", model=self._model)
+            with timed("provider.whisper", timer, model=self._model):
+                response = await self._client.audio.transcriptions.create(
+                    model=self._model,
+                    file=audio_file_obj,
+                    language=language_hint,
+                    response_format="text",
+                    **({"prompt": prompt} if prompt else {}),
+                )
             
             transcript = response if isinstance(response, str) else str(response)
             
@@ -74,6 +95,10 @@ class OpenAIWhisperProvider(TranscriptionProvider):
             return transcript
         
         except Exception as e:
+            PROVIDER_FAILURES_TOTAL.labels(
+                provider="openai_whisper",
+                error_type=type(e).__name__,
+            ).inc()
             # Don't log here - let the application layer handle error logging
             raise TranscriptionProviderError(
                 f"Failed to transcribe audio: {str(e)}"
@@ -1,4 +1,5 @@
 """Swahili summarization prompt templates"""
+import hashlib
 
 # System prompt: English - defines role, behavior, and constraints
 SYSTEM_PROMPT = """You are an expert meeting analyst and professional Swahili business writer.
@@ -51,3 +52,9 @@ Transcript:
 
 Return the JSON response now:"""
 
+
+# Recorded on every summary; changes whenever either prompt changes, so
+# summaries generated with older prompts can be found and refreshed
+PROMPT_VERSION = hashlib.sha256(
+    (SYSTEM_PROMPT + "\0" + USER_PROMPT_TEMPLATE).encode("utf-8")
+).hexdigest()[:16]
@@ -1,33 +1,83 @@
 """Transcription repository implementation"""
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    column,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.application.services.transcription_response_cache import (
+    TranscriptionResponseCache,
+)
+from app.domain.entities.summary import Summary
 from app.domain.entities.transcription import Transcription
 from app.domain.exceptions.domain_exceptions import TranscriptionNotFoundError
 from app.domain.interfaces.transcription_repository import TranscriptionRepository
+from app.domain.value_objects.processing_stage import ProcessingStage
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.domain.value_objects.transcription_listing import (
+    ListingCursor,
+    TranscriptionListItem,
+)
+from app.domain.value_objects.transcription_search import TranscriptionSearchHit
+from app.infrastructure.database.models.search_document_model import (
+    FTS_TABLE,
+    SearchDocumentModel,
+)
+from app.infrastructure.database.models.summary_model import (
+    ActionItemModel,
+    SummaryModel,
+)
 from app.infrastructure.database.models.transcription_model import TranscriptionModel
+from app.shared.tracing import traced
 
 
 class TranscriptionRepositoryImpl(TranscriptionRepository):
     """SQLAlchemy implementation of transcription repository"""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        response_cache: Optional[TranscriptionResponseCache] = None,
+    ):
         self._session = session
+        self._response_cache = response_cache
     
+    @traced("repository.create")
     async def create(self, transcription: Transcription) -> None:
         """Create a new transcription"""
         model = TranscriptionModel.from_entity(transcription)
         self._session.add(model)
+        if transcription.summary:
+            await self._save_summary(transcription.summary)
+        if transcription.transcript_text or transcription.summary:
+            await self._index_document(
+                transcription,
+                transcript_changed=True,
+                summary_changed=transcription.summary is not None,
+            )
         await self._session.commit()
         await self._session.refresh(model)
     
+    @traced("repository.get_by_id")
     async def get_by_id(self, transcription_id: UUID) -> Transcription:
         """Get transcription by ID"""
+        # Refresh rows already in the session: other sessions (workers, the
+        # re-summarization job) may have changed them since they were loaded
         result = await self._session.execute(
-            select(TranscriptionModel).where(TranscriptionModel.id == transcription_id)
+            select(TranscriptionModel)
+            .where(TranscriptionModel.id == transcription_id)
+            .execution_options(populate_existing=True)
         )
         model = result.scalar_one_or_none()
         
@@ -36,8 +86,95 @@ class TranscriptionRepositoryImpl(TranscriptionRepository):
         
         return model.to_entity()
     
+    @traced("repository.update")
     async def update(self, transcription: Transcription) -> None:
         """Update transcription"""
+        model = await self._apply_update(transcription)
+        await self._session.commit()
+        await self._session.refresh(model)
+        
+        # Invalidate after commit; a concurrent read of the old row that is
+        # cached later carries the dropped generation and is never served
+        if self._response_cache is not None:
+            await self._response_cache.invalidate(transcription.id)
+    
+    @traced("repository.update_many")
+    async def update_many(self, transcriptions: List[Transcription]) -> None:
+        """Update several transcriptions in a single transaction"""
+        for transcription in transcriptions:
+            await self._apply_update(transcription)
+        await self._session.commit()
+        
+        if self._response_cache is not None:
+            for transcription in transcriptions:
+                await self._response_cache.invalidate(transcription.id)
+    
+    @traced("repository.get_many")
+    async def get_many(self, transcription_ids: List[UUID]) -> List[Transcription]:
+        """Get the transcriptions that exist among the IDs"""
+        if not transcription_ids:
+            return []
+        result = await self._session.execute(
+            select(TranscriptionModel).where(TranscriptionModel.id.in_(transcription_ids))
+        )
+        return [model.to_entity() for model in result.scalars()]
+    
+    @traced("repository.list_awaiting_summary")
+    async def list_awaiting_summary(
+        self,
+        limit: int = 100,
+        after: Optional[UUID] = None,
+    ) -> List[UUID]:
+        """List transcriptions with a transcript but no summary, not being processed"""
+        query = select(TranscriptionModel.id).where(
+            TranscriptionModel.stage == ProcessingStage.TRANSCRIBED.value,
+            TranscriptionModel.status.not_in([
+                ProcessingStatus.PENDING.value,
+                ProcessingStatus.PROCESSING.value,
+            ]),
+        )
+        if after is not None:
+            query = query.where(TranscriptionModel.id > after)
+        result = await self._session.execute(
+            query.order_by(TranscriptionModel.id).limit(limit)
+        )
+        return list(result.scalars())
+    
+    @traced("repository.list_outdated_summaries")
+    async def list_outdated_summaries(
+        self,
+        prompt_version: str,
+        limit: int = 100,
+        after: Optional[UUID] = None,
+    ) -> List[UUID]:
+        """List transcriptions whose summary was generated with another prompt version"""
+        # Seek along the unique transcription_id index so each page costs the same
+        query = select(SummaryModel.transcription_id).where(self._outdated(prompt_version))
+        if after is not None:
+            query = query.where(SummaryModel.transcription_id > after)
+        result = await self._session.execute(
+            query.order_by(SummaryModel.transcription_id).limit(limit)
+        )
+        return list(result.scalars())
+    
+    @traced("repository.count_outdated_summaries")
+    async def count_outdated_summaries(self, prompt_version: str) -> int:
+        """Count summaries generated with another (or an unknown) prompt version"""
+        result = await self._session.execute(
+            select(func.count()).select_from(SummaryModel).where(self._outdated(prompt_version))
+        )
+        return result.scalar_one()
+    
+    @staticmethod
+    def _outdated(prompt_version: str):
+        """Condition matching summaries not generated with the given prompt version"""
+        return or_(
+            SummaryModel.prompt_version.is_(None),
+            SummaryModel.prompt_version != prompt_version,
+        )
+    
+    async def _apply_update(self, transcription: Transcription) -> TranscriptionModel:
+        """Write an entity's changes to its row and related rows, without committing"""
         result = await self._session.execute(
             select(TranscriptionModel).where(TranscriptionModel.id == transcription.id)
         )
@@ -46,15 +183,107 @@ class TranscriptionRepositoryImpl(TranscriptionRepository):
         if not model:
             raise TranscriptionNotFoundError(str(transcription.id))
         
+        transcript_changed = model.transcript_text != transcription.transcript_text
+        
         # Update model from entity
         updated_model = TranscriptionModel.from_entity(transcription)
         for key, value in updated_model.__dict__.items():
             if key != "id" and not key.startswith("_"):
                 setattr(model, key, value)
         
-        await self._session.commit()
-        await self._session.refresh(model)
+        # Summary rows are only written when the entity carries a new summary
+        summary_changed = False
+        if transcription.summary:
+            summary_changed = await self._save_summary(transcription.summary)
+        
+        # Keep the search index in step, touching only the changed columns
+        if transcript_changed or summary_changed:
+            await self._index_document(
+                transcription,
+                transcript_changed=transcript_changed,
+                summary_changed=summary_changed,
+            )
+        
+        return model
     
+    @traced("repository.get_summary")
+    async def get_summary(self, transcription_id: UUID) -> Optional[Summary]:
+        """Get the summary of a transcription, or None if it has none yet"""
+        result = await self._session.execute(
+            select(SummaryModel).where(SummaryModel.transcription_id == transcription_id)
+        )
+        summary_model = result.scalar_one_or_none()
+        
+        if summary_model is not None:
+            return summary_model.to_entity()
+        
+        exists = await self._session.execute(
+            select(TranscriptionModel.id).where(TranscriptionModel.id == transcription_id)
+        )
+        if exists.scalar_one_or_none() is None:
+            raise TranscriptionNotFoundError(str(transcription_id))
+        
+        return None
+    
+    async def _save_summary(self, summary: Summary) -> bool:
+        """
+        Insert a summary, replacing any previous summary of the transcription
+        
+        Returns:
+            True if the summary was written, False if it was already stored
+        """
+        result = await self._session.execute(
+            select(SummaryModel.id).where(
+                SummaryModel.transcription_id == summary.transcription_id
+            )
+        )
+        existing_id = result.scalar_one_or_none()
+        
+        if existing_id == summary.id:
+            return False
+        
+        if existing_id is not None:
+            # Delete children explicitly; SQLite does not enforce ON DELETE CASCADE by default
+            await self._session.execute(
+                delete(ActionItemModel).where(ActionItemModel.summary_id == existing_id)
+            )
+            await self._session.execute(
+                delete(SummaryModel).where(SummaryModel.id == existing_id)
+            )
+        
+        self._session.add(SummaryModel.from_entity(summary))
+        return True
+    
+    async def _index_document(
+        self,
+        transcription: Transcription,
+        transcript_changed: bool,
+        summary_changed: bool,
+    ) -> None:
+        """Upsert the normalized search terms of a transcription"""
+        result = await self._session.execute(
+            select(SearchDocumentModel).where(
+                SearchDocumentModel.transcription_id == transcription.id
+            )
+        )
+        document = result.scalar_one_or_none()
+        if document is None:
+            document = SearchDocumentModel(transcription_id=transcription.id)
+            self._session.add(document)
+        
+        if transcript_changed:
+            document.transcript_terms = " ".join(
+                SwahiliProcessor.search_terms(transcription.transcript_text)
+            )
+        if summary_changed and transcription.summary:
+            summary = transcription.summary
+            document.summary_terms = " ".join(
+                SwahiliProcessor.search_terms(
+                    "\n".join([summary.muhtasari or "", *summary.maamuzi])
+                )
+            )
+    
+    @traced("repository.get_all")
     async def get_all(
         self,
         skip: int = 0,
@@ -69,4 +298,129 @@ class TranscriptionRepositoryImpl(TranscriptionRepository):
         )
         models = result.scalars().all()
         return [model.to_entity() for model in models]
-
+    
+    @traced("repository.list_page")
+    async def list_page(
+        self,
+        limit: int = 20,
+        after: Optional[ListingCursor] = None,
+        statuses: Optional[List[ProcessingStatus]] = None,
+    ) -> List[TranscriptionListItem]:
+        """List transcriptions newest first using keyset pagination"""
+        # Project only the listing columns so transcript and summary bodies
+        # are never read, regardless of their size
+        query = select(
+            TranscriptionModel.id,
+            TranscriptionModel.filename,
+            TranscriptionModel.status,
+            TranscriptionModel.stage,
+            TranscriptionModel.transcript_text.is_not(None).label("has_transcript"),
+            (TranscriptionModel.stage == ProcessingStage.SUMMARIZED.value).label("has_summary"),
+            TranscriptionModel.created_at,
+            TranscriptionModel.updated_at,
+        )
+        
+        if statuses:
+            query = query.where(
+                TranscriptionModel.status.in_([status.value for status in statuses])
+            )
+        
+        if after is not None:
+            # Seek past the cursor instead of OFFSET so each page costs the same
+            query = query.where(
+                tuple_(TranscriptionModel.created_at, TranscriptionModel.id)
+                < tuple_(
+                    literal(after.created_at, TranscriptionModel.created_at.type),
+                    literal(after.id, TranscriptionModel.id.type),
+                )
+            )
+        
+        result = await self._session.execute(
+            query.order_by(
+                TranscriptionModel.created_at.desc(),
+                TranscriptionModel.id.desc(),
+            ).limit(limit)
+        )
+        
+        return [
+            TranscriptionListItem(
+                id=row.id,
+                filename=row.filename,
+                status=ProcessingStatus(row.status),
+                stage=ProcessingStage(row.stage),
+                has_transcript=bool(row.has_transcript),
+                has_summary=bool(row.has_summary),
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in result
+        ]
+    
+    @traced("repository.search")
+    async def search(
+        self,
+        terms: List[str],
+        limit: int = 20,
+    ) -> List[TranscriptionSearchHit]:
+        """Full-text search over transcripts and summaries"""
+        # Terms are already normalized; keep only plain words so they can be
+        # embedded in the MATCH / tsquery syntax safely
+        terms = [term for term in dict.fromkeys(terms) if term.isalnum()]
+        if not terms:
+            return []
+        
+        if self._session.bind.dialect.name == "postgresql":
+            document = literal_column("search_documents.document")
+            tsquery = func.to_tsquery("simple", " | ".join(f"{term}:*" for term in terms))
+            rank = func.ts_rank_cd(document, tsquery)
+            source = SearchDocumentModel.__table__
+            match = document.op("@@")(tsquery)
+        else:
+            fts = literal_column(FTS_TABLE)
+            # bm25() is lower-is-better; summary matches weigh double
+            rank = -func.bm25(fts, 2.0, 1.0)
+            fts_table = table(FTS_TABLE, column("rowid"))
+            source = SearchDocumentModel.__table__.join(
+                fts_table,
+                fts_table.c.rowid == SearchDocumentModel.id,
+            )
+            match = fts.op("MATCH")(" OR ".join(f'"{term}"*' for term in terms))
+        
+        result = await self._session.execute(
+            select(
+                TranscriptionModel.id,
+                TranscriptionModel.filename,
+                TranscriptionModel.status,
+                TranscriptionModel.created_at,
+                TranscriptionModel.transcript_text,
+                SummaryModel.muhtasari,
+                SummaryModel.maamuzi,
+                rank.label("rank"),
+            )
+            .select_from(source)
+            .join(
+                TranscriptionModel,
+                TranscriptionModel.id == SearchDocumentModel.transcription_id,
+            )
+            .outerjoin(
+                SummaryModel,
+                SummaryModel.transcription_id == SearchDocumentModel.transcription_id,
+            )
+            .where(match)
+            .order_by(rank.desc())
+            .limit(limit)
+        )
+        
+        return [
+            TranscriptionSearchHit(
+                id=row.id,
+                filename=row.filename,
+                status=ProcessingStatus(row.status),
+                rank=float(row.rank),
+                created_at=row.created_at,
+                transcript_text=row.transcript_text,
+                muhtasari=row.muhtasari,
+                maamuzi=list(row.maamuzi or []),
+            )
+            for row in result
+        ]
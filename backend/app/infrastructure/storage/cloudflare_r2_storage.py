@@ -9,6 +9,8 @@ from botocore.exceptions import ClientError
 
 from app.domain.interfaces.file_storage import FileStorage
 from app.shared.logging import get_logger
+from app.shared.metrics import STORAGE_OPERATION_SECONDS
+from app.shared.timing import timed
 
 logger = get_logger(__name__)
 
@@ -39,6 +41,10 @@ class CloudflareR2Storage(FileStorage):
         
         self._bucket_name = bucket_name
         self._endpoint_url = f"https://{account_id}.r2.cloudflarestorage.com"
+        self._timers = {
+            operation: STORAGE_OPERATION_SECONDS.labels(backend="r2", operation=operation)
+            for operation in ("save", "load", "delete")
+        }
         
         # Create S3 client configured for R2
         # Note: R2 doesn't use regions, but boto3 requires one, so we use 'auto'
@@ -87,7 +93,8 @@ class CloudflareR2Storage(FileStorage):
             )
         
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _put_object)
+        with timed("storage.save", self._timers["save"]):
+            await loop.run_in_executor(None, _put_object)
         
         logger.info(
             "storage.file.saved",
@@ -121,13 +128,14 @@ class CloudflareR2Storage(FileStorage):
         loop = asyncio.get_event_loop()
         
         try:
-            response = await loop.run_in_executor(None, _get_object)
-            
-            # Read the body content (Body is a streaming body, read it in executor)
-            def _read_body():
-                return response['Body'].read()
-            
-            content = await loop.run_in_executor(None, _read_body)
+            with timed("storage.load", self._timers["load"]):
+                response = await loop.run_in_executor(None, _get_object)
+                
+                # Read the body content (Body is a streaming body, read it in executor)
+                def _read_body():
+                    return response['Body'].read()
+                
+                content = await loop.run_in_executor(None, _read_body)
             
             logger.debug(
                 "storage.file.loaded",
@@ -160,7 +168,8 @@ class CloudflareR2Storage(FileStorage):
         loop = asyncio.get_event_loop()
         
         try:
-            await loop.run_in_executor(None, _delete_object)
+            with timed("storage.delete", self._timers["delete"]):
+                await loop.run_in_executor(None, _delete_object)
             
             logger.info(
                 "storage.file.deleted",
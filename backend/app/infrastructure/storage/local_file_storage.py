@@ -6,6 +6,8 @@ from uuid import uuid4
 from app.domain.interfaces.file_storage import FileStorage
 from app.infrastructure.config.settings import settings
 from app.shared.logging import get_logger
+from app.shared.metrics import STORAGE_OPERATION_SECONDS
+from app.shared.timing import timed
 
 logger = get_logger(__name__)
 
@@ -16,6 +18,10 @@ class LocalFileStorage(FileStorage):
     def __init__(self, upload_dir: str | None = None):
         self._upload_dir = Path(upload_dir or settings.upload_dir)
         self._upload_dir.mkdir(parents=True, exist_ok=True)
+        self._timers = {
+            operation: STORAGE_OPERATION_SECONDS.labels(backend="local", operation=operation)
+            for operation in ("save", "load", "delete")
+        }
     
     async def save(self, file_content: bytes, filename: str) -> str:
         """
@@ -34,7 +40,8 @@ class LocalFileStorage(FileStorage):
         file_path = self._upload_dir / unique_filename
         
         # Write file
-        file_path.write_bytes(file_content)
+        with timed("storage.save", self._timers["save"]):
+            file_path.write_bytes(file_content)
         
         logger.info(
             "storage.file.saved",
@@ -60,7 +67,8 @@ class LocalFileStorage(FileStorage):
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        content = path.read_bytes()
+        with timed("storage.load", self._timers["load"]):
+            content = path.read_bytes()
         
         logger.debug(
             "storage.file.loaded",
@@ -80,7 +88,8 @@ class LocalFileStorage(FileStorage):
         path = Path(file_path)
         
         if path.exists():
-            path.unlink()
+            with timed("storage.delete", self._timers["delete"]):
+                path.unlink()
             logger.info("storage.file.deleted", file_path=file_path)
         else:
             logger.warning("storage.file.not_found", file_path=file_path)
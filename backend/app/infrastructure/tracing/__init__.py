@@ -0,0 +1 @@
+"""Trace exporters"""
@@ -0,0 +1,28 @@
+"""Local file span exporter"""
+import asyncio
+from pathlib import Path
+
+
+class FileSpanExporter:
+    """
+    Appends OTLP/JSON trace payloads to a JSON Lines file
+    
+    Stands in for a collector during local development: every line is a
+    complete OTLP/JSON export request, so the file can be replayed to a
+    real collector or inspected with jq.
+    """
+    
+    def __init__(self, path: str):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+    
+    async def export(self, payload: bytes) -> None:
+        """Append one export request to the file"""
+        await asyncio.to_thread(self._append, payload + b"\n")
+    
+    async def close(self) -> None:
+        """Nothing to release; each export opens the file"""
+    
+    def _append(self, data: bytes) -> None:
+        with self._path.open("ab") as file:
+            file.write(data)
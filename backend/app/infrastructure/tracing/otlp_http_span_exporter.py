@@ -0,0 +1,40 @@
+"""OTLP/HTTP span exporter"""
+import httpx
+
+
+class OtlpHttpSpanExporter:
+    """
+    Sends OTLP/JSON trace payloads to an OpenTelemetry collector
+    
+    Uses the OTLP/HTTP JSON encoding, so no OpenTelemetry SDK is needed;
+    any collector with the otlp receiver's HTTP protocol enabled accepts it.
+    """
+    
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        """
+        Initialize the exporter
+        
+        Args:
+            endpoint: Collector traces URL, e.g. http://localhost:4318/v1/traces
+            timeout: Request timeout in seconds
+        """
+        self._endpoint = endpoint
+        self._client = httpx.AsyncClient(timeout=timeout)
+    
+    async def export(self, payload: bytes) -> None:
+        """
+        Post one export request to the collector
+        
+        Raises:
+            httpx.HTTPError: If the collector is unreachable or rejects the request
+        """
+        response = await self._client.post(
+            self._endpoint,
+            content=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+    
+    async def close(self) -> None:
+        """Close the HTTP client"""
+        await self._client.aclose()
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from app.container import ApplicationContainer
 from app.infrastructure.config.settings import settings
@@ -12,18 +13,28 @@ from app.presentation.api.middleware.error_handler import (
     general_exception_handler,
     value_error_handler,
 )
+from app.presentation.api.middleware.compression_middleware import CompressionMiddleware
 from app.presentation.api.middleware.logging_middleware import LoggingMiddleware
 from app.presentation.api.middleware.request_id_middleware import RequestIDMiddleware
+from app.presentation.api.middleware.server_timing_middleware import ServerTimingMiddleware
+from app.presentation.api.middleware.tracing_middleware import TracingMiddleware
 from app.presentation.api.v1.router import api_router
 from app.domain.exceptions.domain_exceptions import DomainException
-from app.shared.logging import configure_logging
+from app.shared.logging import configure_logging, shutdown_logging
+from app.shared.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
-    configure_logging(settings.log_level)
+    configure_logging(
+        settings.log_level,
+        async_output=settings.log_async,
+        queue_size=settings.log_queue_size,
+        sample_rates=settings.log_sample_rates_map,
+        max_field_length=settings.log_max_field_length,
+    )
     
     try:
         await create_tables()
@@ -42,7 +53,9 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    await container.shutdown()
     container.unwire()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -51,6 +64,7 @@ app = FastAPI(
     description="API for transcribing and summarizing Swahili audio",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -62,12 +76,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request ID middleware (must be before logging middleware)
-app.add_middleware(RequestIDMiddleware)
+# Compression middleware (precompressed cached responses pass through)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+    )
+
+# Server-Timing header (inside logging, which collects the request's stage timings)
+if settings.server_timing_enabled:
+    app.add_middleware(ServerTimingMiddleware)
 
 # Logging middleware
 app.add_middleware(LoggingMiddleware)
 
+# Tracing middleware (server span per request, continues incoming traceparent)
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+
+# Request ID middleware (added last so it wraps logging and the ID is bound)
+app.add_middleware(RequestIDMiddleware)
+
 # Exception handlers
 app.add_exception_handler(DomainException, domain_exception_handler)
 app.add_exception_handler(ValueError, value_error_handler)
@@ -91,3 +120,10 @@ async def root():
 async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics endpoint"""
+        return Response(REGISTRY.render(), headers={"Content-Type": METRICS_CONTENT_TYPE})
@@ -0,0 +1,129 @@
+"""Response compression middleware"""
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.compression import CODECS, encoded_etag, negotiate_encoding
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+
+# Streams whose chunks must reach the client immediately
+UNBUFFERED_TYPES = ("text/event-stream",)
+
+
+class CompressionMiddleware:
+    """
+    Negotiated zstd/br/gzip compression of text and JSON responses
+    
+    Single-body responses are compressed in one pass when they reach
+    `minimum_size`. Streaming responses are compressed chunk by chunk as
+    they are produced, so large bodies are never buffered in full.
+    Responses that already carry a Content-Encoding (e.g. precompressed
+    cache variants) pass through untouched.
+    """
+    
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        responder = _CompressingResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Per-request send wrapper deciding whether and how to compress"""
+    
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._compressor = None
+        self._passthrough = False
+    
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+        
+        if message["type"] == "http.response.start":
+            # Hold the start message until the first body chunk decides
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            if not self._should_compress(message["status"], headers):
+                await self._flush_start(passthrough=True)
+            return
+        
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self._compressor is None and self._start is not None:
+            if not more_body:
+                # Whole body known: compress in one pass if it is worth it
+                if len(body) < self._minimum_size:
+                    await self._flush_start(passthrough=True)
+                    await self._send(message)
+                    return
+                compressed = CODECS[self._encoding].compress(body)
+                self._apply_encoding_headers(len(compressed))
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            
+            # Streaming: compress chunks as they arrive
+            self._compressor = CODECS[self._encoding].stream()
+            self._apply_encoding_headers(None)
+            await self._flush_start()
+        
+        chunk = self._compressor.compress(body)
+        if not more_body:
+            chunk += self._compressor.flush()
+        if chunk or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+    
+    def _should_compress(self, status: int, headers: Headers) -> bool:
+        """Check whether the response is a compressible representation"""
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if content_type.startswith(UNBUFFERED_TYPES):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+    
+    def _apply_encoding_headers(self, content_length: Optional[int]) -> None:
+        """Rewrite headers of the held start message for the encoded body"""
+        headers = MutableHeaders(raw=self._start["headers"])
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        etag = headers.get("etag")
+        if etag:
+            headers["ETag"] = encoded_etag(etag, self._encoding)
+    
+    async def _flush_start(self, passthrough: bool = False) -> None:
+        """Send the held start message"""
+        start, self._start = self._start, None
+        self._passthrough = passthrough
+        await self._send(start)
@@ -1,60 +1,90 @@
 """Logging middleware"""
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.shared.logging import get_logger
+from app.shared.timing import current_timings, end_request_timing, start_request_timing
 
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """Middleware for request/response logging"""
     
-    async def dispatch(self, request: Request, call_next):
-        """Log request and response"""
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log request and response with the request's stage durations"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        # Stage timings recorded while handling this request
+        timing_token = start_request_timing()
+        timings = current_timings()
+        method = scope["method"]
+        path = scope["path"]
         
         # Get request ID from request state (set by RequestIDMiddleware)
-        request_id = getattr(request.state, "request_id", None)
+        request_id = scope.get("state", {}).get("request_id")
         
         # Bind request_id to logger context
         bound_logger = logger.bind(request_id=request_id) if request_id else logger
         
+        client = scope.get("client")
         bound_logger.info(
             "request.started",
-            method=request.method,
-            path=request.url.path,
-            client=request.client.host if request.client else None,
+            method=method,
+            path=path,
+            client=client[0] if client else None,
         )
         
-        try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # Only log successful requests
-            bound_logger.info(
-                "request.completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                process_time=f"{process_time:.3f}s",
-            )
-            
-            return response
+        status_code = None
+        process_time = None
+        stages_ms = None
+        
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code, process_time, stages_ms
+            if message["type"] == "http.response.start":
+                # Measured when the response starts, not when a streamed body ends
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                stages_ms = timings.as_dict()
+            await send(message)
         
+        try:
+            await self.app(scope, receive, send_with_status)
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             # Only log request-level failures (network, middleware errors)
             # Application errors are logged in the application layer
             bound_logger.error(
                 "request.failed",
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 error=str(e),
                 error_type=type(e).__name__,
                 process_time=f"{process_time:.3f}s",
+                stages_ms=timings.as_dict(),
             )
             raise
-
+        finally:
+            end_request_timing(timing_token)
+        
+        if process_time is None:
+            # No response was started
+            process_time = time.perf_counter() - start_time
+            stages_ms = timings.as_dict()
+        
+        # Only log successful requests
+        bound_logger.info(
+            "request.completed",
+            method=method,
+            path=path,
+            status_code=status_code,
+            process_time=f"{process_time:.3f}s",
+            stages_ms=stages_ms,
+        )
@@ -0,0 +1,35 @@
+"""Server-Timing middleware"""
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.timing import current_timings
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware adding a Server-Timing header with the request's stages
+    
+    Stages are collected in the request's timing context (started by
+    LoggingMiddleware), so this must be added inside it. For streamed
+    responses the header only covers work done before the first chunk.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add the Server-Timing header when the response starts"""
+        timings = current_timings()
+        if scope["type"] != "http" or timings is None:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    timings.server_timing(total=timings.elapsed),
+                )
+            await send(message)
+        
+        await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,60 @@
+"""Tracing middleware"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.tracing import SPAN_KIND_SERVER, STATUS_ERROR, get_tracer
+
+
+class TracingMiddleware:
+    """
+    Middleware opening a server span for each request
+    
+    Continues the caller's trace when a W3C `traceparent` header is sent.
+    Background jobs submitted while handling the request run in its
+    context, so their spans join the same trace.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Trace the request"""
+        tracer = get_tracer()
+        if scope["type"] != "http" or tracer is None:
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+        
+        request_span = tracer.start_span(
+            f"{method} {scope['path']}",
+            kind=SPAN_KIND_SERVER,
+            traceparent=traceparent,
+            attributes={
+                "http.request.method": method,
+                "url.path": scope["path"],
+                "request_id": scope.get("state", {}).get("request_id"),
+            },
+        )
+        
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                request_span.set_attribute("http.response.status_code", status)
+                if status >= 500:
+                    request_span.status_code = STATUS_ERROR
+            await send(message)
+        
+        with request_span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                # Name the span after the matched route template, not the raw path
+                route = scope.get("route")
+                if route is not None and getattr(route, "path", None):
+                    request_span.name = f"{method} {route.path}"
+                    request_span.set_attribute("http.route", route.path)
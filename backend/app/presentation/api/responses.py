@@ -0,0 +1,40 @@
+"""Shared response helpers"""
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.application.services.transcription_response_cache import CachedResponse
+from app.infrastructure.config.settings import settings
+from app.shared.compression import negotiate_encoding
+
+
+def preferred_encoding(request: Request) -> Optional[str]:
+    """Content encoding to request from the response cache, if any"""
+    if not settings.compression_enabled:
+        return None
+    return negotiate_encoding(request.headers.get("accept-encoding"))
+
+
+def conditional_json_response(request: Request, cached: CachedResponse) -> Response:
+    """
+    Build a JSON response carrying a strong ETag
+    
+    Returns 304 Not Modified without a body when the client's
+    If-None-Match already names the current representation. Precompressed
+    bodies are sent as-is with their Content-Encoding.
+    """
+    headers = {
+        "ETag": cached.representation_etag,
+        # Clients may store the body but must revalidate before reuse
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if cached.matches(request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if cached.encoding:
+        headers["Content-Encoding"] = cached.encoding
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,75 @@
+"""Refresh of summaries generated with outdated prompts"""
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.presentation.schemas.response_schemas import ResummarizationResponse
+from app.shared.logging import get_logger
+
+if TYPE_CHECKING:
+    from app.container import ApplicationContainer
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+
+def get_container(request: Request) -> "ApplicationContainer":
+    """Get application container from request state"""
+    return request.app.state.container
+
+
+@router.get(
+    "/resummarization",
+    response_model=ResummarizationResponse,
+)
+async def get_resummarization(
+    container: "ApplicationContainer" = Depends(get_container),
+) -> ResummarizationResponse:
+    """Progress of the current or last re-summarization run"""
+    return ResummarizationResponse.from_progress(container.resummarization_job.progress)
+
+
+@router.post(
+    "/resummarization",
+    response_model=ResummarizationResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_resummarization(
+    request: Request,
+    container: "ApplicationContainer" = Depends(get_container),
+) -> ResummarizationResponse:
+    """
+    Regenerate every summary made with an older prompt version
+    
+    Summaries are regenerated from the stored transcripts (audio is not
+    transcribed again) at `RESUMMARIZATION_RATE_PER_MINUTE`, as batch-priority
+    work. Poll `GET /resummarization` for progress.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    bound_logger = logger.bind(request_id=request_id) if request_id else logger
+    
+    job = container.resummarization_job
+    if not job.start():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Re-summarization is already running",
+        )
+    
+    bound_logger.info(
+        "resummarization.requested",
+        prompt_version=job.progress.prompt_version,
+    )
+    return ResummarizationResponse.from_progress(job.progress)
+
+
+@router.post(
+    "/resummarization/stop",
+    response_model=ResummarizationResponse,
+)
+async def stop_resummarization(
+    container: "ApplicationContainer" = Depends(get_container),
+) -> ResummarizationResponse:
+    """Stop the running re-summarization; summaries refreshed so far are kept"""
+    job = container.resummarization_job
+    await job.stop()
+    return ResummarizationResponse.from_progress(job.progress)
@@ -2,10 +2,16 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
+from app.application.dto.summary_dto import SummaryDTO
+from app.presentation.api.responses import (
+    conditional_json_response,
+    preferred_encoding,
+)
 from app.presentation.schemas.response_schemas import SummaryResponse
 from app.shared.logging import get_logger
+from app.shared.serialization import dump_model
 
 if TYPE_CHECKING:
     from app.container import ApplicationContainer
@@ -19,6 +25,24 @@ def get_container(request: Request) -> "ApplicationContainer":
     return request.app.state.container
 
 
+def _serialize(dto: SummaryDTO) -> bytes:
+    """Serialize a summary response body"""
+    response = SummaryResponse.from_dto(dto)
+    
+    logger.info(
+        "summary.serialized",
+        transcription_id=str(dto.transcription_id),
+        summary_id=str(response.id),
+        has_muhtasari=bool(response.muhtasari),
+        muhtasari_length=len(response.muhtasari) if response.muhtasari else 0,
+        maamuzi_count=len(response.maamuzi),
+        kazi_count=len(response.kazi),
+        masuala_count=len(response.masuala_yaliyoahirishwa),
+    )
+    
+    return dump_model(response)
+
+
 @router.get(
     "/summary/{transcription_id}",
     response_model=SummaryResponse,
@@ -28,26 +52,31 @@ async def get_summary(
     transcription_id: UUID,
     request: Request,
     container: "ApplicationContainer" = Depends(get_container),
-) -> SummaryResponse:
-    """Get summary by transcription ID"""
+) -> Response:
+    """
+    Get summary by transcription ID
+    
+    Responses carry a strong ETag; send it back as If-None-Match to get
+    304 Not Modified instead of the full summary.
+    """
     request_id = getattr(request.state, "request_id", None)
     bound_logger = logger.bind(request_id=request_id) if request_id else logger
     
     try:
         use_case = container.get_summary_use_case
-        result = await use_case.execute(transcription_id)
-        logger.info(f"Result: {result}")
-        response = SummaryResponse.from_dto(result)
+        result = await use_case.execute_serialized(
+            transcription_id,
+            serialize=_serialize,
+            encoding=preferred_encoding(request),
+        )
+        response = conditional_json_response(request, result)
         
         bound_logger.info(
             "summary.response",
             transcription_id=str(transcription_id),
-            summary_id=str(response.id),
-            has_muhtasari=bool(response.muhtasari),
-            muhtasari_length=len(response.muhtasari) if response.muhtasari else 0,
-            maamuzi_count=len(response.maamuzi),
-            kazi_count=len(response.kazi),
-            masuala_count=len(response.masuala_yaliyoahirishwa),
+            status_code=response.status_code,
+            content_length=len(result.body),
+            content_encoding=result.encoding,
         )
         
         return response
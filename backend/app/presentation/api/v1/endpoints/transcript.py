@@ -2,10 +2,16 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
+from app.application.dto.transcription_dto import TranscriptionDTO
+from app.presentation.api.responses import (
+    conditional_json_response,
+    preferred_encoding,
+)
 from app.presentation.schemas.response_schemas import TranscriptionResponse
 from app.shared.logging import get_logger
+from app.shared.serialization import dump_model
 
 if TYPE_CHECKING:
     from app.container import ApplicationContainer
@@ -19,6 +25,11 @@ def get_container(request: Request) -> "ApplicationContainer":
     return request.app.state.container
 
 
+def _serialize(dto: TranscriptionDTO) -> bytes:
+    """Serialize a transcript response body"""
+    return dump_model(TranscriptionResponse.from_dto(dto))
+
+
 @router.get(
     "/transcript/{transcription_id}",
     response_model=TranscriptionResponse,
@@ -27,23 +38,32 @@ async def get_transcript(
     transcription_id: UUID,
     request: Request,
     container: "ApplicationContainer" = Depends(get_container),
-) -> TranscriptionResponse:
-    """Get transcript by transcription ID"""
+) -> Response:
+    """
+    Get transcript by transcription ID
+    
+    Responses carry a strong ETag; send it back as If-None-Match to get
+    304 Not Modified instead of the full transcript.
+    """
     request_id = getattr(request.state, "request_id", None)
     bound_logger = logger.bind(request_id=request_id) if request_id else logger
     
     try:
         use_case = container.get_transcript_use_case
-        result = await use_case.execute(transcription_id)
-        response = TranscriptionResponse.from_dto(result)
+        result = await use_case.execute_serialized(
+            transcription_id,
+            serialize=_serialize,
+            encoding=preferred_encoding(request),
+        )
+        response = conditional_json_response(request, result)
         
         # Log response
         bound_logger.info(
             "transcript.response",
             transcription_id=str(transcription_id),
-            status=response.status,
-            has_transcript=bool(response.transcript_text),
-            transcript_length=len(response.transcript_text) if response.transcript_text else 0,
+            status_code=response.status_code,
+            content_length=len(result.body),
+            content_encoding=result.encoding,
         )
         
         return response
@@ -57,4 +77,3 @@ async def get_transcript(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
-
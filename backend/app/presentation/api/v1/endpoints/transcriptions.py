@@ -0,0 +1,314 @@
+"""Transcription management endpoints"""
+from typing import TYPE_CHECKING, List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.application.services.progress_channel import TERMINAL_EVENTS, ProgressEvent
+from app.domain.exceptions.domain_exceptions import (
+    InvalidStatusTransitionError,
+    TranscriptionNotFoundError,
+)
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.presentation.schemas.response_schemas import (
+    TranscriptionListResponse,
+    TranscriptionResponse,
+    TranscriptionSearchResponse,
+)
+from app.shared.logging import get_logger
+from app.shared.serialization import dumps
+
+if TYPE_CHECKING:
+    from app.container import ApplicationContainer
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+# Statuses after which no more progress events follow
+_FINAL_STATUSES = (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED, ProcessingStatus.CANCELLED)
+
+
+def get_container(request: Request) -> "ApplicationContainer":
+    """Get application container from request state"""
+    return request.app.state.container
+
+
+@router.get(
+    "/transcriptions",
+    response_model=TranscriptionListResponse,
+)
+async def list_transcriptions(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    status_filter: Optional[List[ProcessingStatus]] = Query(None, alias="status"),
+    container: "ApplicationContainer" = Depends(get_container),
+) -> TranscriptionListResponse:
+    """
+    List transcriptions, newest first
+    
+    Pass the returned `nextCursor` as `cursor` to fetch the following page.
+    Repeat `status` to filter by several statuses.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    bound_logger = logger.bind(request_id=request_id) if request_id else logger
+    
+    try:
+        use_case = container.list_transcriptions_use_case
+        result = await use_case.execute(
+            limit=limit,
+            cursor=cursor,
+            statuses=status_filter,
+        )
+        response = TranscriptionListResponse.from_dto(result)
+        
+        bound_logger.info(
+            "transcriptions.list.response",
+            count=len(response.items),
+            has_more=response.next_cursor is not None,
+        )
+        
+        return response
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get(
+    "/transcriptions/search",
+    response_model=TranscriptionSearchResponse,
+)
+async def search_transcriptions(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=50),
+    container: "ApplicationContainer" = Depends(get_container),
+) -> TranscriptionSearchResponse:
+    """
+    Full-text search over transcripts, summaries and decisions
+    
+    Inflected Swahili verb forms match each other (e.g. `kujadili` finds
+    "tutajadili"), and each word also matches as a prefix. Hits are ranked
+    by relevance and carry a snippet with matches wrapped in `<mark>`.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    bound_logger = logger.bind(request_id=request_id) if request_id else logger
+    
+    try:
+        use_case = container.search_transcriptions_use_case
+        result = await use_case.execute(q, limit=limit)
+        response = TranscriptionSearchResponse.from_dto(result)
+        
+        bound_logger.info(
+            "transcriptions.search.response",
+            count=len(response.items),
+        )
+        
+        return response
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+def _server_sent_event(progress: ProgressEvent) -> bytes:
+    """Encode a progress event as a server-sent event"""
+    return b"event: " + progress.event.encode() + b"\ndata: " + dumps(progress.data) + b"\n\n"
+
+
+def _final_event(transcription) -> ProgressEvent:
+    """Terminal event matching a finished transcription's status"""
+    if transcription.status == ProcessingStatus.FAILED:
+        return ProgressEvent(event=transcription.status.value, data={"error": transcription.error_message})
+    return ProgressEvent(event=transcription.status.value)
+
+
+@router.get("/transcriptions/{transcription_id}/events")
+async def transcription_events(
+    transcription_id: UUID,
+    request: Request,
+    container: "ApplicationContainer" = Depends(get_container),
+) -> StreamingResponse:
+    """
+    Stream processing progress as server-sent events
+    
+    Events: `transcribed`, `summary.section` (`{"section", "value"}`, sent as
+    soon as each summary section is generated, before the whole summary is
+    saved), then one of `completed`, `failed` (`{"error"}`) or `cancelled`,
+    after which the stream ends. Events already sent for the current job are
+    replayed on connect; a finished transcription gets only its final event.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    bound_logger = logger.bind(request_id=request_id) if request_id else logger
+    
+    # Subscribe before reading the status so no event can fall in between
+    subscription = container.progress_channel.subscribe(transcription_id)
+    try:
+        transcription = await container.transcription_repository.get_by_id(transcription_id)
+    except TranscriptionNotFoundError as e:
+        subscription.close()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except Exception:
+        subscription.close()
+        raise
+    
+    keepalive = container.progress_keepalive_seconds
+    
+    async def events():
+        try:
+            if transcription.status in _FINAL_STATUSES and subscription.queue.empty():
+                yield _server_sent_event(_final_event(transcription))
+                return
+            while True:
+                progress = await subscription.next(timeout=keepalive)
+                if progress is None:
+                    # The job may run in another worker, whose events never arrive here
+                    current = await container.transcription_repository.get_by_id(transcription_id)
+                    if current.status in _FINAL_STATUSES:
+                        yield _server_sent_event(_final_event(current))
+                        return
+                    yield b": keepalive\n\n"
+                    continue
+                yield _server_sent_event(progress)
+                if progress.event in TERMINAL_EVENTS:
+                    return
+        finally:
+            subscription.close()
+    
+    bound_logger.info(
+        "transcriptions.events.subscribed",
+        transcription_id=str(transcription_id),
+        status=transcription.status.value,
+    )
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/transcriptions/{transcription_id}/retry",
+    response_model=TranscriptionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def retry_transcription(
+    transcription_id: UUID,
+    request: Request,
+    container: "ApplicationContainer" = Depends(get_container),
+) -> TranscriptionResponse:
+    """
+    Retry a failed or interrupted transcription
+    
+    Processing resumes at the first incomplete stage, so a transcript that
+    was already persisted is not transcribed again.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    bound_logger = logger.bind(request_id=request_id) if request_id else logger
+    
+    try:
+        use_case = container.retry_transcription_use_case
+        result = await use_case.execute(transcription_id)
+        response = TranscriptionResponse.from_dto(result)
+        
+        bound_logger.info(
+            "retry.response",
+            transcription_id=str(transcription_id),
+            status=response.status,
+            stage=response.stage,
+        )
+        
+        return response
+    except TranscriptionNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except (InvalidStatusTransitionError, ValueError) as e:
+        bound_logger.warning(
+            "retry.rejected",
+            transcription_id=str(transcription_id),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+    except Exception as e:
+        bound_logger.error(
+            "retry.error",
+            transcription_id=str(transcription_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+@router.post(
+    "/transcriptions/{transcription_id}/cancel",
+    response_model=TranscriptionResponse,
+)
+async def cancel_transcription(
+    transcription_id: UUID,
+    request: Request,
+    container: "ApplicationContainer" = Depends(get_container),
+) -> TranscriptionResponse:
+    """
+    Cancel a queued or in-flight transcription
+    
+    In-flight Whisper/GPT calls are cancelled and the worker slot is freed.
+    A cancelled transcription can be resumed later through the retry endpoint.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    bound_logger = logger.bind(request_id=request_id) if request_id else logger
+    
+    try:
+        use_case = container.cancel_transcription_use_case
+        result = await use_case.execute(transcription_id)
+        response = TranscriptionResponse.from_dto(result)
+        
+        bound_logger.info(
+            "cancel.response",
+            transcription_id=str(transcription_id),
+            status=response.status,
+            stage=response.stage,
+        )
+        
+        return response
+    except TranscriptionNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except InvalidStatusTransitionError as e:
+        bound_logger.warning(
+            "cancel.rejected",
+            transcription_id=str(transcription_id),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+    except Exception as e:
+        bound_logger.error(
+            "cancel.error",
+            transcription_id=str(transcription_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
@@ -1,7 +1,14 @@
 """API v1 router"""
 from fastapi import APIRouter
 
-from app.presentation.api.v1.endpoints import audio, summary, transcript, upload
+from app.presentation.api.v1.endpoints import (
+    audio,
+    resummarization,
+    summary,
+    transcript,
+    transcriptions,
+    upload,
+)
 
 api_router = APIRouter()
 
@@ -9,4 +16,6 @@ api_router.include_router(upload.router, tags=["upload"])
 api_router.include_router(transcript.router, tags=["transcript"])
 api_router.include_router(summary.router, tags=["summary"])
 api_router.include_router(audio.router, tags=["audio"])
+api_router.include_router(transcriptions.router, tags=["transcriptions"])
+api_router.include_router(resummarization.router, tags=["resummarization"])
 
@@ -8,6 +8,15 @@ from pydantic.alias_generators import to_camel
 
 from app.application.dto.summary_dto import ActionItemDTO, SummaryDTO
 from app.application.dto.transcription_dto import TranscriptionDTO
+from app.application.dto.transcription_list_dto import (
+    TranscriptionListItemDTO,
+    TranscriptionPageDTO,
+)
+from app.application.dto.transcription_search_dto import (
+    TranscriptionSearchHitDTO,
+    TranscriptionSearchResultDTO,
+)
+from app.application.services.resummarization_job import ResummarizationProgress
 
 
 class TranscriptionResponse(BaseModel):
@@ -15,6 +24,7 @@ class TranscriptionResponse(BaseModel):
     id: UUID
     filename: str
     status: str
+    stage: Optional[str] = None
     transcript_text: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -26,6 +36,7 @@ class TranscriptionResponse(BaseModel):
             id=dto.id,
             filename=dto.filename,
             status=dto.status,
+            stage=dto.stage,
             transcript_text=dto.transcript_text,
             created_at=dto.created_at,
             updated_at=dto.updated_at,
@@ -38,6 +49,106 @@ class TranscriptionResponse(BaseModel):
     )
 
 
+class TranscriptionListItemResponse(BaseModel):
+    """Response schema for a transcription list entry"""
+    id: UUID
+    filename: str
+    status: str
+    stage: str
+    has_transcript: bool
+    has_summary: bool
+    created_at: datetime
+    updated_at: datetime
+    
+    @classmethod
+    def from_dto(cls, dto: TranscriptionListItemDTO) -> "TranscriptionListItemResponse":
+        """Create response from DTO"""
+        return cls(
+            id=dto.id,
+            filename=dto.filename,
+            status=dto.status,
+            stage=dto.stage,
+            has_transcript=dto.has_transcript,
+            has_summary=dto.has_summary,
+            created_at=dto.created_at,
+            updated_at=dto.updated_at,
+        )
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class TranscriptionListResponse(BaseModel):
+    """Response schema for a page of transcriptions"""
+    items: List[TranscriptionListItemResponse]
+    next_cursor: Optional[str] = None
+    
+    @classmethod
+    def from_dto(cls, dto: TranscriptionPageDTO) -> "TranscriptionListResponse":
+        """Create response from DTO"""
+        return cls(
+            items=[TranscriptionListItemResponse.from_dto(item) for item in dto.items],
+            next_cursor=dto.next_cursor,
+        )
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class TranscriptionSearchHitResponse(BaseModel):
+    """Response schema for a search hit"""
+    id: UUID
+    filename: str
+    status: str
+    rank: float
+    snippet: Optional[str] = None
+    created_at: datetime
+    
+    @classmethod
+    def from_dto(cls, dto: TranscriptionSearchHitDTO) -> "TranscriptionSearchHitResponse":
+        """Create response from DTO"""
+        return cls(
+            id=dto.id,
+            filename=dto.filename,
+            status=dto.status,
+            rank=dto.rank,
+            snippet=dto.snippet,
+            created_at=dto.created_at,
+        )
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class TranscriptionSearchResponse(BaseModel):
+    """Response schema for search results"""
+    query: str
+    items: List[TranscriptionSearchHitResponse]
+    
+    @classmethod
+    def from_dto(cls, dto: TranscriptionSearchResultDTO) -> "TranscriptionSearchResponse":
+        """Create response from DTO"""
+        return cls(
+            query=dto.query,
+            items=[TranscriptionSearchHitResponse.from_dto(item) for item in dto.items],
+        )
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
 class ActionItemResponse(BaseModel):
     """Response schema for action item"""
     person: str
@@ -68,6 +179,8 @@ class SummaryResponse(BaseModel):
     maamuzi: List[str]
     kazi: List[ActionItemResponse]
     masuala_yaliyoahirishwa: List[str]
+    model: Optional[str] = None
+    prompt_version: Optional[str] = None
     
     @classmethod
     def from_dto(cls, dto: SummaryDTO) -> "SummaryResponse":
@@ -79,6 +192,46 @@ class SummaryResponse(BaseModel):
             maamuzi=dto.maamuzi,
             kazi=[ActionItemResponse.from_dto(item) for item in dto.kazi],
             masuala_yaliyoahirishwa=dto.masuala_yaliyoahirishwa,
+            model=dto.model,
+            prompt_version=dto.prompt_version,
+        )
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class ResummarizationResponse(BaseModel):
+    """Response schema for re-summarization progress"""
+    state: str
+    prompt_version: str
+    total: int
+    processed: int
+    remaining: int
+    refreshed: int
+    failed: int
+    skipped: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_progress(cls, progress: ResummarizationProgress) -> "ResummarizationResponse":
+        """Create response from job progress"""
+        return cls(
+            state=progress.state,
+            prompt_version=progress.prompt_version,
+            total=progress.total,
+            processed=progress.processed,
+            remaining=progress.remaining,
+            refreshed=progress.refreshed,
+            failed=progress.failed,
+            skipped=progress.skipped,
+            started_at=progress.started_at,
+            finished_at=progress.finished_at,
+            error=progress.error,
         )
     
     model_config = ConfigDict(
@@ -0,0 +1,139 @@
+"""Content-Encoding codecs and Accept-Encoding negotiation"""
+import gzip
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Protocol
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+
+class StreamCompressor(Protocol):
+    """Incremental compressor"""
+    
+    def compress(self, data: bytes) -> bytes: ...
+    
+    def flush(self) -> bytes: ...
+
+
+@dataclass(frozen=True)
+class Codec:
+    """
+    A content encoding
+    
+    `compress` is used for one-shot (and precompressed, stored) bodies and
+    may use a higher level than `stream`, which compresses on the fly.
+    """
+    
+    name: str
+    compress: Callable[[bytes], bytes]
+    stream: Callable[[], StreamCompressor]
+
+
+class _ZstdStream:
+    """Adapts a zstandard compressobj to the StreamCompressor protocol"""
+    
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _gzip_stream() -> StreamCompressor:
+    return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _build_codecs() -> Dict[str, Codec]:
+    """Codecs available in this environment, in server preference order"""
+    codecs = {}
+    if zstandard is not None:
+        codecs["zstd"] = Codec(
+            name="zstd",
+            compress=lambda data: zstandard.ZstdCompressor(level=10).compress(data),
+            stream=lambda: _ZstdStream(level=3),
+        )
+    if brotli is not None:
+        codecs["br"] = Codec(
+            name="br",
+            compress=lambda data: brotli.compress(data, quality=9),
+            stream=lambda: brotli.Compressor(quality=4),
+        )
+    codecs["gzip"] = Codec(
+        name="gzip",
+        compress=lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+        stream=_gzip_stream,
+    )
+    return codecs
+
+
+CODECS: Dict[str, Codec] = _build_codecs()
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the best available encoding for an Accept-Encoding header
+    
+    The client's q-values decide; ties go to the server preference
+    (zstd, br, gzip). Returns None when identity should be used.
+    
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+    
+    Returns:
+        Encoding name, or None for identity
+    """
+    if not accept_encoding:
+        return None
+    
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip()] = quality
+    
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for name in CODECS:
+        quality = weights.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    ETag of an encoded representation
+    
+    Each encoding is a distinct representation, so strong ETags get an
+    encoding suffix ("abc" -> "abc-gzip").
+    """
+    if not encoding or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def base_etag(etag: str) -> str:
+    """Strip the weak prefix and any encoding suffix from an ETag"""
+    etag = etag.removeprefix("W/")
+    for name in CODECS:
+        suffix = f'-{name}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
@@ -0,0 +1,127 @@
+"""Incremental parsing of a streamed JSON object"""
+from typing import Any, List, Optional, Tuple
+
+from app.shared.serialization import loads
+
+_WHITESPACE = " \t\r\n"
+
+
+class JsonMemberStream:
+    """
+    Yields the top-level members of a JSON object as text arrives
+    
+    Feed the object in arbitrary chunks (e.g. streamed completion deltas);
+    each member is returned by `feed` as soon as its value closes, without
+    waiting for the rest of the object. Scanning is incremental: every
+    character is looked at once, however the text is split.
+    
+    Anything before the opening brace (such as a code fence) is skipped.
+    Malformed member values raise JSONDecodeError.
+    """
+    
+    def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        # Member being scanned: "key", "colon", "value_start", "value" or "done"
+        self._expect = "key"
+        self._key_start = 0
+        self._key: Optional[str] = None
+        self._value_start = 0
+        self._done = False
+    
+    @property
+    def done(self) -> bool:
+        """True once the object's closing brace has been read"""
+        return self._done
+    
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add text and return the members completed by it
+        
+        Args:
+            chunk: Next piece of the JSON text
+        
+        Returns:
+            (key, value) pairs of the members that closed, in order
+        """
+        members: List[Tuple[str, Any]] = []
+        if self._done or not chunk:
+            return members
+        self._buffer += chunk
+        buffer = self._buffer
+        
+        position = self._position
+        while position < len(buffer):
+            char = buffer[position]
+            
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._expect == "key":
+                            self._key = loads(buffer[self._key_start:position + 1])
+                            self._expect = "colon"
+                        else:
+                            members.append(self._member(position + 1))
+                position += 1
+                continue
+            
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+            elif self._depth == 1 and self._expect == "value_start" and char not in _WHITESPACE:
+                self._value_start = position
+                self._expect = "value"
+                if char == '"':
+                    self._in_string = True
+                elif char in "{[":
+                    self._depth += 1
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect == "key":
+                    self._key_start = position
+            elif char == ":" and self._depth == 1 and self._expect == "colon":
+                self._expect = "value_start"
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._expect == "value":
+                    members.append(self._member(position + 1))
+                elif self._depth == 0:
+                    if self._expect == "value":
+                        # Scalar (number, true, false, null) as the last member
+                        members.append(self._member(position))
+                    self._done = True
+                    break
+            elif char == "," and self._depth == 1:
+                if self._expect == "value":
+                    members.append(self._member(position))
+                self._expect = "key"
+            position += 1
+        
+        # Completed members are no longer needed; keep only the open one
+        if self._expect == "value":
+            keep = self._value_start
+        elif self._expect == "key" and self._in_string:
+            keep = self._key_start
+        else:
+            keep = position
+        self._buffer = buffer[keep:]
+        self._position = position - keep
+        self._key_start -= keep
+        self._value_start -= keep
+        return members
+    
+    def _member(self, end: int) -> Tuple[str, Any]:
+        """Close the current member, whose value ends at `end`"""
+        value = loads(self._buffer[self._value_start:end])
+        self._expect = "done"
+        return self._key, value
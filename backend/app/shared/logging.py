@@ -1,20 +1,136 @@
 """Structured logging configuration"""
+import hashlib
 import logging
+import queue
+import random
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, TextIO
 
 import structlog
 
 from app.infrastructure.config.settings import settings
+from app.shared.metrics import LOG_RECORDS_DROPPED_TOTAL
+from app.shared.serialization import dumps_str
 
+# Levels that are never sampled away
+_UNSAMPLED_LEVELS = {"warning", "error", "critical", "exception"}
 
-def configure_logging(log_level: str = "INFO") -> None:
-    """Configure structured logging with environment-based formatting"""
+# Fields left intact by truncation
+_UNTRUNCATED_FIELDS = {"event", "exception", "stack"}
+
+_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+
+
+class EventSampler:
+    """
+    Structlog processor keeping a fraction of chosen info/debug events
+    
+    Kept events carry a `sample_rate` field so counts can be scaled back up.
+    Warnings and errors are always kept.
+    """
+    
+    def __init__(self, rates: Dict[str, float]):
+        self._rates = rates
+    
+    def __call__(self, logger, method_name: str, event_dict: dict) -> dict:
+        rate = self._rates.get(event_dict.get("event"))
+        if rate is None or rate >= 1 or method_name in _UNSAMPLED_LEVELS:
+            return event_dict
+        if random.random() >= rate:
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = rate
+        return event_dict
+
+
+class FieldTruncator:
+    """
+    Structlog processor shortening large string fields
+    
+    A truncated value keeps its first `max_length` characters followed by
+    its full length and a SHA-256 prefix, so identical payloads can still
+    be correlated across log lines.
+    """
+    
+    def __init__(self, max_length: int):
+        self._max_length = max_length
+    
+    def __call__(self, logger, method_name: str, event_dict: dict) -> dict:
+        for key, value in event_dict.items():
+            if key in _UNTRUNCATED_FIELDS:
+                continue
+            if isinstance(value, bytes):
+                value = value.decode("utf-8", "replace")
+            elif not isinstance(value, str):
+                continue
+            if len(value) > self._max_length:
+                digest = hashlib.sha256(value.encode("utf-8", "replace")).hexdigest()[:16]
+                event_dict[key] = (
+                    f"{value[:self._max_length]}…[{len(value)} chars, sha256:{digest}]"
+                )
+        return event_dict
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Structlog records arrive already rendered, so formatting (and the
+        # record copy the base class makes) is left to the writer thread
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED_TOTAL.inc()
+
+
+def configure_logging(
+    log_level: str = "INFO",
+    async_output: bool = True,
+    queue_size: int = 10000,
+    sample_rates: Optional[Dict[str, float]] = None,
+    max_field_length: int = 1024,
+    stream: Optional[TextIO] = None,
+) -> None:
+    """
+    Configure structured logging with environment-based formatting
+    
+    Args:
+        log_level: Minimum level to log
+        async_output: Hand records to a background thread for writing, so
+            a slow stdout (log shipper, pipe) never blocks the event loop
+        queue_size: Records buffered for the writer thread; further records
+            are dropped (and counted) while it is full
+        sample_rates: Fraction of each named info/debug event to keep
+        max_field_length: String fields longer than this are truncated
+        stream: Output stream (defaults to stdout)
+    """
+    global _handler, _listener
+    shutdown_logging()
+    
     # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter("%(message)s"))
+    if async_output:
+        records = queue.Queue(maxsize=queue_size)
+        _listener = QueueListener(records, output)
+        _listener.start()
+        _handler = _DroppingQueueHandler(records)
+    else:
+        _handler = output
+    
+    # Output is "%(message)s" only, so skip collecting thread and process
+    # details for every record (the logging HOWTO's optimization switches)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    root = logging.getLogger()
+    root.addHandler(_handler)
+    root.setLevel(getattr(logging, log_level.upper()))
     
     # Hide noisy third-party logs
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -25,6 +141,7 @@ def configure_logging(log_level: str = "INFO") -> None:
     # Base processors for all environments
     base_processors = [
         structlog.stdlib.filter_by_level,
+        EventSampler(sample_rates or {}),
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -32,6 +149,7 @@ def configure_logging(log_level: str = "INFO") -> None:
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
+        FieldTruncator(max_field_length),
     ]
     
     # Environment-based rendering
@@ -43,7 +161,7 @@ def configure_logging(log_level: str = "INFO") -> None:
     else:
         # JSON output for production
         processors = base_processors + [
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=dumps_str),
         ]
     
     # Configure structlog
@@ -56,7 +174,17 @@ def configure_logging(log_level: str = "INFO") -> None:
     )
 
 
+def shutdown_logging() -> None:
+    """Write out queued records and detach the handler installed by configure_logging"""
+    global _handler, _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+
+
 def get_logger(name: str = __name__) -> structlog.BoundLogger:
     """Get a structured logger instance"""
     return structlog.get_logger(name)
-
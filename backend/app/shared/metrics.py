@@ -0,0 +1,365 @@
+"""In-process metrics with Prometheus text exposition"""
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request/call latencies, from sub-millisecond DB queries to long provider calls
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+# Upload sizes in bytes: 64 KiB up to the 25 MiB upload limit and beyond
+SIZE_BUCKETS = tuple(float(64 * 1024 * 2 ** i) for i in range(11))
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Base class for a metric family with optional labels"""
+    
+    kind = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[LabelValues, object] = {}
+    
+    def labels(self, **labels: str):
+        """Get the child metric for a set of label values"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+    
+    def _default(self):
+        """Child used when the metric has no labels"""
+        if self.labelnames:
+            raise ValueError(f"Metric {self.name} requires labels {self.labelnames}")
+        return self.labels()
+    
+    @abstractmethod
+    def _new_child(self):
+        """Create the child metric of one set of label values"""
+        pass
+    
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Sample lines of every child, in the Prometheus text format"""
+        pass
+    
+    def render(self) -> str:
+        """Render the metric family in the Prometheus text format"""
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+    
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+    
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    
+    kind = "counter"
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+    
+    def _new_child(self):
+        return _CounterChild(self._lock)
+    
+    def _samples(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}{labels} {_format_value(child.value)}"
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value", "function")
+    
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+    
+    def set(self, value: float) -> None:
+        self.value = float(value)
+    
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+    
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+    
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value at collection time instead of tracking it"""
+        self.function = function
+    
+    def get(self) -> float:
+        return float(self.function()) if self.function is not None else self.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    
+    kind = "gauge"
+    
+    def set(self, value: float) -> None:
+        self._default().set(value)
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+    
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default().set_function(function)
+    
+    def _new_child(self):
+        return _GaugeChild(self._lock)
+    
+    def _samples(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}{labels} {_format_value(child.get())}"
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_upper_bounds", "counts", "sum")
+    
+    def __init__(self, lock: threading.Lock, upper_bounds: Tuple[float, ...]):
+        self._lock = lock
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+    
+    @contextmanager
+    def time(self):
+        """Observe the wall-clock duration of the block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+    
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets))
+    
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+    
+    def time(self):
+        return self._default().time()
+    
+    def _new_child(self):
+        return _HistogramChild(self._lock, self.buckets)
+    
+    def _samples(self) -> Iterator[str]:
+        names = self.labelnames + ("le",)
+        for values, child in list(self._children.items()):
+            with self._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(names, values + (_format_value(upper_bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+    
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+    
+    def render(self) -> str:
+        """Render every metric family in the Prometheus text format"""
+        families: List[str] = [metric.render() for metric in self._metrics.values()]
+        return "\n".join(families) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Uploads and storage
+UPLOAD_SIZE_BYTES = REGISTRY.histogram(
+    "upload_size_bytes",
+    "Size of uploaded audio files",
+    ["extension"],
+    buckets=SIZE_BUCKETS,
+)
+STORAGE_OPERATION_SECONDS = REGISTRY.histogram(
+    "storage_operation_seconds",
+    "Duration of file storage operations",
+    ["backend", "operation"],
+)
+
+# External providers
+PROVIDER_REQUEST_SECONDS = REGISTRY.histogram(
+    "provider_request_seconds",
+    "Duration of transcription and summarization provider calls",
+    ["provider", "model"],
+)
+PROVIDER_FAILURES_TOTAL = REGISTRY.counter(
+    "provider_failures_total",
+    "Failed provider calls",
+    ["provider", "error_type"],
+)
+SUMMARIZATION_TOKENS_TOTAL = REGISTRY.counter(
+    "summarization_tokens_total",
+    "Billed summarization tokens by model and kind (prompt or completion)",
+    ["model", "kind"],
+)
+SUMMARIZATION_ROUTED_TOTAL = REGISTRY.counter(
+    "summarization_routed_total",
+    "Summaries by serving model and whether it was the first choice or a fallback",
+    ["model", "route"],
+)
+
+# Processing pipeline
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    "pipeline_stage_seconds",
+    "Duration of each transcription pipeline stage",
+    ["stage"],
+)
+JOB_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "job_queue_wait_seconds",
+    "Time processing jobs wait for a worker slot",
+    ["priority"],
+)
+JOBS_TOTAL = REGISTRY.counter(
+    "transcription_jobs_total",
+    "Finished processing jobs by outcome",
+    ["outcome"],
+)
+TRANSCRIPT_TOKENS_SAVED_TOTAL = REGISTRY.counter(
+    "transcript_tokens_saved_total",
+    "Transcript tokens removed by post-processing",
+)
+TRANSCRIPT_WORDS_REMOVED_TOTAL = REGISTRY.counter(
+    "transcript_words_removed_total",
+    "Words removed from transcripts by post-processing step",
+    ["step"],
+)
+JOB_RETRIES_TOTAL = REGISTRY.counter(
+    "transcription_retries_total",
+    "Retries requested for failed or cancelled transcriptions",
+    ["resume_stage"],
+)
+JOBS_IN_FLIGHT = REGISTRY.gauge(
+    "jobs_in_flight",
+    "Processing jobs by scheduler state",
+    ["state"],
+)
+
+# Response cache
+RESPONSE_CACHE_REQUESTS_TOTAL = REGISTRY.counter(
+    "response_cache_requests_total",
+    "Response cache lookups by result",
+    ["kind", "result"],
+)
+
+# Logging
+LOG_RECORDS_DROPPED_TOTAL = REGISTRY.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the log writer queue was full",
+)
+
+# Database
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_seconds",
+    "Duration of database statements",
+    ["operation"],
+)
+DB_POOL_CHECKED_OUT = REGISTRY.gauge(
+    "db_pool_connections_checked_out",
+    "Database connections currently checked out of the pool",
+)
@@ -0,0 +1,36 @@
+"""Fast JSON encoding and decoding"""
+from typing import Any, Callable, Optional, Union
+
+import orjson
+from pydantic import BaseModel
+
+# orjson raises a subclass of json.JSONDecodeError (and ValueError)
+JSONDecodeError = orjson.JSONDecodeError
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (UUIDs, datetimes and dataclasses supported)"""
+    return orjson.dumps(obj, option=_OPTIONS)
+
+
+def dumps_str(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a JSON string (for APIs that require str, e.g. SQLAlchemy JSON columns, log lines)"""
+    return orjson.dumps(obj, default=default, option=_OPTIONS).decode()
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    return orjson.loads(data)
+
+
+def dump_model(model: BaseModel, by_alias: bool = True) -> bytes:
+    """
+    Serialize a Pydantic model to JSON bytes
+    
+    Produces the same bytes as model_dump_json() for the API schemas, but
+    encodes the dumped dict with orjson, which is faster for large
+    transcript bodies.
+    """
+    return orjson.dumps(model.model_dump(by_alias=by_alias), option=_OPTIONS)
@@ -0,0 +1,114 @@
+"""Request-scoped stage timings"""
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional
+
+from app.shared.tracing import span
+
+
+class RequestTimings:
+    """
+    Durations of the stages a request went through
+    
+    Repeated stages (e.g. database queries) are summed and counted.
+    Stages may overlap or nest: a provider call is also part of the
+    pipeline stage that made it.
+    """
+    
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._stages: Dict[str, List[float]] = {}
+    
+    def record(self, name: str, seconds: float) -> None:
+        """Add a stage duration"""
+        stage = self._stages.get(name)
+        if stage is None:
+            self._stages[name] = [seconds, 1]
+        else:
+            stage[0] += seconds
+            stage[1] += 1
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the request started"""
+        return time.perf_counter() - self.start
+    
+    def as_dict(self) -> Dict[str, float]:
+        """Stage durations in milliseconds"""
+        return {name: round(seconds * 1000, 1) for name, (seconds, _) in self._stages.items()}
+    
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """Format the stages as a Server-Timing header value"""
+        entries = []
+        for name, (seconds, count) in self._stages.items():
+            entry = f"{name};dur={seconds * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="{count}x"'
+            entries.append(entry)
+        if total is not None:
+            entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings",
+    default=None,
+)
+
+
+def start_request_timing() -> Token:
+    """Start collecting timings for the current request"""
+    return _current_timings.set(RequestTimings())
+
+
+def end_request_timing(token: Token) -> None:
+    """Stop collecting timings for the current request"""
+    _current_timings.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Timings of the request being handled, if any"""
+    return _current_timings.get()
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Add a stage duration to the current request, if any"""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.record(name, seconds)
+
+
+class timed:
+    """
+    Time a block as a request stage
+    
+    The block is also traced as a span of the same name when tracing is
+    enabled, so one call site feeds metrics, Server-Timing and traces.
+    
+    Args:
+        name: Stage name (a Server-Timing token, e.g. "storage.load")
+        histogram: Optional histogram (or labelled child) that also
+            observes the duration
+        **attributes: Span attributes
+    """
+    
+    __slots__ = ("_name", "_histogram", "_span", "_start")
+    
+    def __init__(self, name: str, histogram=None, **attributes: Any):
+        self._name = name
+        self._histogram = histogram
+        self._span = span(name, **attributes)
+    
+    def __enter__(self) -> "timed":
+        self._span.__enter__()
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = time.perf_counter() - self._start
+        self._span.__exit__(exc_type, exc, tb)
+        if self._histogram is not None:
+            self._histogram.observe(elapsed)
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.record(self._name, elapsed)
@@ -0,0 +1,131 @@
+"""Local token counting for chat model prompts"""
+import functools
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # Optional dependency
+    tiktoken = None
+
+# Tokens added around each chat message and to prime the reply
+_TOKENS_PER_MESSAGE = 3
+_TOKENS_PER_REPLY = 3
+
+# Context windows of known model families, longest prefix first
+_CONTEXT_WINDOWS = (
+    ("gpt-4.1", 1_047_576),
+    ("gpt-4o", 128_000),
+    ("gpt-4-turbo", 128_000),
+    ("gpt-4-32k", 32_768),
+    ("gpt-4", 8_192),
+    ("gpt-3.5-turbo", 16_385),
+)
+DEFAULT_CONTEXT_WINDOW = 16_385
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+# Sentence ends and line breaks, where transcripts are split
+_SENTENCE = re.compile(r"[^.!?\n]*(?:[.!?]+|\n+|$)\s*")
+
+
+def context_window(model: str) -> int:
+    """Context window of a model, in tokens (DEFAULT_CONTEXT_WINDOW if unknown)"""
+    for prefix, tokens in _CONTEXT_WINDOWS:
+        if model.startswith(prefix):
+            return tokens
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def _estimate(text: str) -> int:
+    """Conservative count without a tokenizer (about three characters per token)"""
+    return sum(-(-len(piece) // 3) for piece in _PIECE.findall(text))
+
+
+@functools.lru_cache(maxsize=16)
+def _encoder(model: Optional[str]) -> Callable[[str], int]:
+    """Token counting function for a model's encoding"""
+    if tiktoken is None:
+        return _estimate
+    try:
+        encoding = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("cl100k_base")
+    except KeyError:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use; offline, estimate instead
+        return _estimate
+    return lambda text: len(encoding.encode_ordinary(text))
+
+
+class TokenCounter:
+    """
+    Counts tokens the way a chat model will
+    
+    Uses the model's tiktoken encoding when the package is installed (and
+    its encoding can be loaded), otherwise a conservative estimate that
+    over- rather than under-counts.
+    
+    Args:
+        model: Chat model whose tokenizer is used
+    """
+    
+    def __init__(self, model: Optional[str] = None):
+        self.model = model
+        self._count = _encoder(model)
+    
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's tokenizer"""
+        return self._count is not _estimate
+    
+    def count(self, text: str) -> int:
+        """Tokens of a text"""
+        return self._count(text) if text else 0
+    
+    def count_messages(self, messages: Sequence[Dict[str, str]]) -> int:
+        """Prompt tokens of chat messages, including the per-message framing"""
+        return _TOKENS_PER_REPLY + sum(
+            _TOKENS_PER_MESSAGE + self.count(message["role"]) + self.count(message["content"])
+            for message in messages
+        )
+    
+    def sentences(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Split text at sentence ends and line breaks, with each piece's tokens
+        
+        Returns:
+            (piece, tokens) pairs; the pieces join back into the text
+        """
+        return [
+            (match.group(), self.count(match.group()))
+            for match in _SENTENCE.finditer(text)
+            if match.group()
+        ]
+    
+    def slices(self, text: str, max_tokens: int) -> List[Tuple[str, int]]:
+        """
+        Cut text into consecutive slices of at most `max_tokens` tokens
+        
+        For text without a break to split at, such as a very long word.
+        
+        Returns:
+            (slice, tokens) pairs; the slices join back into the text
+        """
+        pieces = []
+        start = 0
+        while start < len(text):
+            # Longest slice that fits (at least one character)
+            low, high = start + 1, len(text)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self.count(text[start:middle]) <= max_tokens:
+                    low = middle
+                else:
+                    high = middle - 1
+            pieces.append((text[start:low], self.count(text[start:low])))
+            start = low
+        return pieces
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Tokens of a text for a model's tokenizer (see TokenCounter)"""
+    return TokenCounter(model).count(text)
@@ -0,0 +1,304 @@
+"""Lightweight tracing with OpenTelemetry-compatible export"""
+import asyncio
+import functools
+import random
+import re
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Protocol
+
+from app.shared.logging import get_logger
+from app.shared.serialization import dumps
+
+logger = get_logger(__name__)
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class SpanExporter(Protocol):
+    """Destination for encoded OTLP/JSON trace payloads"""
+    
+    async def export(self, payload: bytes) -> None: ...
+    
+    async def close(self) -> None: ...
+
+
+class Span:
+    """A timed operation within a trace"""
+    
+    __slots__ = (
+        "_tracer", "name", "kind", "trace_id", "span_id", "parent_span_id",
+        "attributes", "start_ns", "end_ns", "status_code", "status_message", "_token",
+    )
+    
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        kind: int,
+        trace_id: str,
+        parent_span_id: Optional[str],
+        attributes: Dict[str, Any],
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.status_code = 0
+        self.status_message = ""
+        self._token = None
+    
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value for this span"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+    
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None and not issubclass(exc_type, asyncio.CancelledError):
+            self.status_code = STATUS_ERROR
+            self.status_message = f"{exc_type.__name__}: {exc}"
+        self._tracer._finish(self)
+    
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode the span as an OTLP/JSON span"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_code:
+            span["status"] = {"code": self.status_code, "message": self.status_message}
+        return span
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled"""
+    
+    __slots__ = ()
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+    
+    def __enter__(self) -> "_NoopSpan":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class Tracer:
+    """
+    Creates spans and exports finished ones in batches
+    
+    Finished spans are buffered in memory and flushed by a background task
+    every `flush_interval` seconds (or sooner when a batch fills up), so
+    span creation never waits on the exporter. When the buffer is full the
+    oldest spans are dropped.
+    """
+    
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        service_name: str,
+        max_batch_size: int = 512,
+        max_queue_size: int = 8192,
+        flush_interval: float = 2.0,
+    ):
+        self._exporter = exporter
+        self._resource = {"attributes": _otlp_attributes({"service.name": service_name})}
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._finished: Deque[Span] = deque(maxlen=max_queue_size)
+        self._batch_ready = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def start_span(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_INTERNAL,
+        traceparent: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        """
+        Create a span, parented to the current span or an incoming traceparent
+        
+        Args:
+            name: Span name
+            kind: OTLP span kind
+            traceparent: W3C traceparent of a remote parent (HTTP header)
+            attributes: Initial span attributes
+        """
+        parent = _current_span.get()
+        if traceparent and (match := _TRACEPARENT.match(traceparent.strip().lower())):
+            trace_id, parent_span_id = match.group(1), match.group(2)
+        elif parent is not None:
+            trace_id, parent_span_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_span_id = f"{random.getrandbits(128):032x}", None
+        return Span(self, name, kind, trace_id, parent_span_id, attributes or {})
+    
+    def start(self) -> None:
+        """Start the background flush task"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def shutdown(self) -> None:
+        """Stop the flush task, export buffered spans and close the exporter"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+        await self._exporter.close()
+    
+    async def flush(self) -> None:
+        """Export every buffered span"""
+        while self._finished:
+            batch = [
+                self._finished.popleft()
+                for _ in range(min(self._max_batch_size, len(self._finished)))
+            ]
+            try:
+                await self._exporter.export(self._encode(batch))
+            except Exception as e:
+                logger.warning(
+                    "tracing.export.failed",
+                    spans=len(batch),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+    
+    def _finish(self, span: Span) -> None:
+        self._finished.append(span)
+        if len(self._finished) >= self._max_batch_size:
+            self._batch_ready.set()
+    
+    def _encode(self, spans: List[Span]) -> bytes:
+        return dumps({
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{
+                    "scope": {"name": "app"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }],
+        })
+    
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self._flush_interval)
+            except TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_tracer: Optional[Tracer] = None
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Install (or remove, with None) the process-wide tracer"""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """The process-wide tracer, or None while tracing is disabled"""
+    return _tracer
+
+
+def current_span() -> Optional[Span]:
+    """The active span, if any"""
+    return _current_span.get()
+
+
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any):
+    """
+    Create a span as a context manager
+    
+    Returns a shared no-op span while tracing is disabled.
+    
+    Args:
+        name: Span name, e.g. "storage.load"
+        kind: OTLP span kind
+        **attributes: Span attributes (None values are omitted)
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_span(name, kind=kind, attributes=attributes)
+
+
+def annotate(**attributes: Any) -> None:
+    """Set attributes on the active span (no-op while tracing is disabled)"""
+    if _tracer is None:
+        return
+    active = _current_span.get()
+    if active is not None:
+        active.attributes.update(attributes)
+
+
+def traced(name: str, kind: int = SPAN_KIND_INTERNAL):
+    """Decorator wrapping an async function in a span"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with _tracer.start_span(name, kind=kind):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
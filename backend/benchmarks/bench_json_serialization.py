@@ -0,0 +1,137 @@
+"""
+Micro-benchmark: JSON serialization cost per request
+
+Compares the ways a transcript / summary response body can be produced:
+
+- stdlib:     jsonable_encoder + json.dumps (FastAPI's JSONResponse path)
+- orjson:     jsonable_encoder + orjson (ORJSONResponse path)
+- pydantic:   model_dump_json
+- dump_model: model_dump + orjson (used for cached response bodies)
+- cached:     pre-serialized bytes from the response cache
+
+plus parsing a summarization provider response with json vs orjson.
+
+Usage (from backend/):
+    python -m benchmarks.bench_json_serialization [--minutes 60] [--number 2000]
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime
+from uuid import uuid4
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.application.dto.summary_dto import ActionItemDTO, SummaryDTO
+from app.application.dto.transcription_dto import TranscriptionDTO
+from app.application.services.transcription_response_cache import CachedResponse
+from app.presentation.schemas.response_schemas import SummaryResponse, TranscriptionResponse
+from app.shared.serialization import dump_model, loads
+
+# Roughly 150 spoken words per minute in a meeting
+WORDS_PER_MINUTE = 150
+
+SAMPLE_WORDS = (
+    "leo tutajadili mipango ya deployment ya API kwenye server mpya, "
+    "Juma atahakikisha database migration imekamilika kabla ya Ijumaa "
+    "na timu ya frontend itaanza kazi ya dashboard wiki ijayo."
+).split()
+
+
+def build_transcript(minutes: int) -> TranscriptionResponse:
+    """Transcript response for a meeting of the given length"""
+    count = minutes * WORDS_PER_MINUTE
+    text = " ".join(SAMPLE_WORDS[i % len(SAMPLE_WORDS)] for i in range(count))
+    dto = TranscriptionDTO(
+        id=uuid4(),
+        filename="mkutano.webm",
+        status="completed",
+        stage="summarized",
+        transcript_text=text,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    return TranscriptionResponse.from_dto(dto)
+
+
+def build_summary() -> SummaryResponse:
+    """Summary response with a realistic number of sections"""
+    dto = SummaryDTO(
+        id=uuid4(),
+        transcription_id=uuid4(),
+        muhtasari=" ".join(SAMPLE_WORDS * 8),
+        maamuzi=[" ".join(SAMPLE_WORDS[:12]) for _ in range(10)],
+        kazi=[
+            ActionItemDTO(person=f"Mtu {i}", task=" ".join(SAMPLE_WORDS[:10]), due_date="Ijumaa")
+            for i in range(15)
+        ],
+        masuala_yaliyoahirishwa=[" ".join(SAMPLE_WORDS[:8]) for _ in range(5)],
+    )
+    return SummaryResponse.from_dto(dto)
+
+
+def encoders(model):
+    """Candidate ways to produce the response body"""
+    cached = CachedResponse.from_body(dump_model(model))
+    return {
+        "stdlib": lambda: json.dumps(
+            jsonable_encoder(model),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode(),
+        "orjson": lambda: orjson.dumps(jsonable_encoder(model)),
+        "pydantic": lambda: model.model_dump_json(by_alias=True).encode(),
+        "dump_model": lambda: dump_model(model),
+        "cached": lambda: cached.body,
+    }
+
+
+def report(label: str, candidates: dict, number: int) -> None:
+    """Print per-call cost of each candidate relative to the first"""
+    baseline = None
+    print(f"\n{label}")
+    for name, func in candidates.items():
+        per_call = timeit.timeit(func, number=number) / number * 1e6
+        baseline = baseline or per_call
+        print(f"  {name:<11} {per_call:10.1f} us   x{baseline / per_call:6.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=int, default=60, help="Meeting length")
+    parser.add_argument("--number", type=int, default=2000, help="Iterations per case")
+    args = parser.parse_args()
+    
+    transcript = build_transcript(args.minutes)
+    summary = build_summary()
+    
+    body = dump_model(transcript)
+    assert body == transcript.model_dump_json(by_alias=True).encode()
+    print(f"transcript body: {len(body) / 1024:.1f} KiB ({args.minutes} min)")
+    print(f"summary body:    {len(dump_model(summary)) / 1024:.1f} KiB")
+    
+    report("transcript response", encoders(transcript), args.number)
+    report("summary response", encoders(summary), args.number)
+    
+    raw = json.dumps(
+        {
+            "muhtasari": summary.muhtasari,
+            "maamuzi": summary.maamuzi,
+            "kazi": [
+                {"nani": item.person, "kazi": item.task, "tarehe": item.due_date}
+                for item in summary.kazi
+            ],
+            "masuala_yaliyoahirishwa": summary.masuala_yaliyoahirishwa,
+        },
+        ensure_ascii=False,
+    )
+    report(
+        "provider response parsing",
+        {"stdlib": lambda: json.loads(raw), "orjson": lambda: loads(raw)},
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
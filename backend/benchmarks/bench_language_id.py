@@ -0,0 +1,72 @@
+"""
+Benchmark: per-segment language identification over long transcripts
+
+Times LanguageIdentifier.analyze on a synthetic transcript of Swahili,
+English and mixed sentences (~150 words per minute), and the old
+whole-transcript stopword heuristic for comparison.
+
+Usage (from backend/):
+    python -m benchmarks.bench_language_id [--minutes 60] [--number 20]
+"""
+import argparse
+import random
+import re
+import timeit
+
+from app.application.services import language_samples
+from app.application.services.language_identifier import LanguageIdentifier
+
+ENGLISH_INDICATORS = [
+    rf"\b{word}\b"
+    for word in ("the", "is", "to", "of", "and", "in", "for", "with", "on", "at")
+]
+
+
+def make_transcript(minutes: int, rng: random.Random) -> str:
+    sentences = [
+        sentence.strip()
+        for sample in (language_samples.SWAHILI, language_samples.ENGLISH)
+        for sentence in " ".join(sample.split()).split(".")
+        if sentence.strip()
+    ]
+    words, parts = 0, []
+    while words < minutes * 150:
+        sentence = rng.choice(sentences)
+        if rng.random() < 0.2:
+            # Mixed sentence: half of one, half of another
+            other = rng.choice(sentences).split()
+            sentence = " ".join(sentence.split()[: len(other) // 2] + other[len(other) // 2:])
+        parts.append(sentence + ".")
+        words += len(sentence.split())
+    return " ".join(parts)
+
+
+def stopword_heuristic(text: str) -> bool:
+    text_lower = text.lower()
+    return sum(1 for pattern in ENGLISH_INDICATORS if re.search(pattern, text_lower)) >= 3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=int, default=60, help="Transcript length in minutes")
+    parser.add_argument("--number", type=int, default=20, help="Iterations per case")
+    args = parser.parse_args()
+    
+    text = make_transcript(args.minutes, random.Random(0))
+    identifier = LanguageIdentifier()
+    analysis = identifier.analyze(text)
+    print(
+        f"  transcript: {len(text.split())} words, {len(analysis.segments)} segments, "
+        f"english {analysis.english_ratio:.0%}, switching {analysis.code_switching_ratio:.0%}"
+    )
+    
+    build = timeit.timeit(LanguageIdentifier, number=args.number) / args.number
+    analyze = timeit.timeit(lambda: identifier.analyze(text), number=args.number) / args.number
+    heuristic = timeit.timeit(lambda: stopword_heuristic(text), number=args.number) / args.number
+    print(f"  analyze    {analyze * 1000:8.2f} ms  (per-segment tags)")
+    print(f"  stopwords  {heuristic * 1000:8.2f} ms  (one boolean, old heuristic)")
+    print(f"  build      {build * 1000:8.2f} ms  (n-gram tables)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark: event-loop blocking caused by logging
+
+Runs concurrent "request handlers" that each emit the log events of a
+summary request, including a large raw_response field, while a ticker task
+measures how late the event loop wakes it up. Output goes to a sink that
+takes --sink-latency-us per write, standing in for a stdout pipe to a busy
+log shipper.
+
+- off:     log level WARNING, events are filtered out
+- sync:    records written on the event loop (previous behaviour)
+- queued:  records handed to the background writer thread, large fields
+           truncated
+
+Usage (from backend/):
+    python -m benchmarks.bench_logging [--requests 2000] [--sink-latency-us 200]
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import time
+
+from app.shared.logging import configure_logging, get_logger, shutdown_logging
+
+RAW_RESPONSE = '{"muhtasari": "' + "Mkutano ulijadili bajeti ya mradi. " * 400 + '"}'
+
+
+class SlowSink(io.TextIOBase):
+    """Text stream whose writes block for a fixed time"""
+    
+    def __init__(self, latency: float):
+        self._latency = latency
+        self.bytes_written = 0
+    
+    def write(self, text: str) -> int:
+        time.sleep(self._latency)
+        self.bytes_written += len(text)
+        return len(text)
+
+
+async def handle_request(logger, index: int) -> None:
+    """Emit the log lines of one summary request"""
+    bound = logger.bind(request_id=f"{index:08x}")
+    bound.info("request.started", method="GET", path="/api/v1/summary/x")
+    await asyncio.sleep(0)
+    bound.info("summarization.raw_response", raw_response=RAW_RESPONSE, response_length=len(RAW_RESPONSE))
+    await asyncio.sleep(0)
+    bound.info("summary.serialized", kazi_count=3, maamuzi_count=2)
+    bound.info("request.completed", method="GET", status_code=200, process_time="0.004s")
+
+
+async def measure(requests: int, concurrency: int) -> dict:
+    """Run the requests while sampling event-loop wake-up lag"""
+    logger = get_logger("bench")
+    lags = []
+    done = asyncio.Event()
+    
+    async def ticker():
+        interval = 0.001
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+    
+    async def worker(offset: int):
+        for index in range(offset, requests, concurrency):
+            await handle_request(logger, index)
+    
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    
+    lags.sort()
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(lags) * 1000,
+        "p99": lags[int(len(lags) * 0.99)] * 1000,
+        "max": lags[-1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000, help="Simulated requests")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent handlers")
+    parser.add_argument("--sink-latency-us", type=float, default=200, help="Blocking time per write")
+    args = parser.parse_args()
+    
+    modes = {
+        "off": {"log_level": "WARNING", "async_output": False},
+        "sync": {"log_level": "INFO", "async_output": False, "max_field_length": 1_000_000},
+        "queued": {"log_level": "INFO", "async_output": True, "queue_size": 100_000},
+    }
+    print(f"{'mode':<8} {'loop time':>10} {'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'written':>9}")
+    for name, options in modes.items():
+        sink = SlowSink(args.sink_latency_us / 1e6)
+        configure_logging(stream=sink, **options)
+        result = asyncio.run(measure(args.requests, args.concurrency))
+        shutdown_logging()
+        print(
+            f"{name:<8} {result['elapsed']:>9.2f}s {result['p50']:>7.2f}ms "
+            f"{result['p99']:>7.2f}ms {result['max']:>7.2f}ms {sink.bytes_written / 1e6:>7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark: BaseHTTPMiddleware vs pure ASGI request/logging middleware
+
+Builds the API twice, once with the previous BaseHTTPMiddleware-based
+RequestIDMiddleware/LoggingMiddleware (kept below as the baseline) and
+once with the pure ASGI versions, then drives `/health` and
+`/api/v1/transcript/{id}` in-process and reports requests/sec and
+latency percentiles.
+
+Usage (from backend/):
+    python -m benchmarks.bench_middleware [--requests 2000] [--concurrency 8]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# Isolated database and quiet logs, set before the app reads its settings
+_workdir = tempfile.mkdtemp(prefix="bench-middleware-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_workdir}/bench.db")
+os.environ.setdefault("UPLOAD_DIR", f"{_workdir}/uploads")
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.domain.entities.transcription import Transcription  # noqa: E402
+from app.main import lifespan  # noqa: E402
+from app.presentation.api.middleware.logging_middleware import LoggingMiddleware  # noqa: E402
+from app.presentation.api.middleware.request_id_middleware import (  # noqa: E402
+    RequestIDMiddleware,
+)
+from app.presentation.api.v1.router import api_router  # noqa: E402
+from app.shared.logging import get_logger  # noqa: E402
+
+logger = get_logger(__name__)
+
+
+class BaseHTTPRequestIDMiddleware(BaseHTTPMiddleware):
+    """Baseline: previous RequestIDMiddleware"""
+    
+    async def dispatch(self, request: Request, call_next):
+        import uuid
+        request.state.request_id = uuid.uuid4().hex[:8]
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request.state.request_id
+        return response
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """Baseline: previous LoggingMiddleware"""
+    
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        request_id = getattr(request.state, "request_id", None)
+        bound_logger = logger.bind(request_id=request_id) if request_id else logger
+        bound_logger.info(
+            "request.started",
+            method=request.method,
+            path=request.url.path,
+            client=request.client.host if request.client else None,
+        )
+        response = await call_next(request)
+        bound_logger.info(
+            "request.completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            process_time=f"{time.time() - start_time:.3f}s",
+        )
+        return response
+
+
+def build_app(request_id_middleware, logging_middleware) -> FastAPI:
+    """API app with the given middleware pair"""
+    app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+    app.add_middleware(logging_middleware)
+    app.add_middleware(request_id_middleware)
+    app.include_router(api_router, prefix="/api/v1")
+    
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+    
+    return app
+
+
+async def seed(app: FastAPI) -> str:
+    """Create one completed transcription and return its transcript path"""
+    repo = app.state.container.transcription_repository
+    transcription = Transcription.create(filename="bench.mp3", file_path="/bench/bench.mp3")
+    await repo.create(transcription)
+    transcription.mark_as_processing()
+    transcription.complete_with_transcript("leo tutajadili deployment ya API " * 500)
+    await repo.update(transcription)
+    return f"/api/v1/transcript/{transcription.id}"
+
+
+async def drive(client: httpx.AsyncClient, path: str, requests: int, concurrency: int):
+    """Issue requests with bounded concurrency; return (req/s, latencies)"""
+    latencies = []
+    queue = iter(range(requests))
+    
+    async def worker():
+        for _ in queue:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.status_code
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started), latencies
+
+
+async def run(label: str, app: FastAPI, requests: int, concurrency: int) -> None:
+    async with app.router.lifespan_context(app):
+        transcript_path = await seed(app)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in ("/health", transcript_path):
+                await drive(client, path, 200, concurrency)  # warm-up
+                rps, latencies = await drive(client, path, requests, concurrency)
+                quantiles = statistics.quantiles(latencies, n=100)
+                name = "/health" if path == "/health" else "/transcript/{id}"
+                print(
+                    f"{label:<16} {name:<18} {rps:9.0f} req/s   "
+                    f"p50 {quantiles[49] * 1e3:6.2f} ms   p99 {quantiles[98] * 1e3:6.2f} ms"
+                )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    
+    await run(
+        "BaseHTTP",
+        build_app(BaseHTTPRequestIDMiddleware, BaseHTTPLoggingMiddleware),
+        args.requests,
+        args.concurrency,
+    )
+    await run(
+        "pure ASGI",
+        build_app(RequestIDMiddleware, LoggingMiddleware),
+        args.requests,
+        args.concurrency,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+Benchmark: lexicon term matching over long transcripts
+
+Compares, for a synthetic transcript and lexicon:
+
+- per-term:  one word-boundary regex search per lexicon term (the old approach)
+- compiled:  TermMatcher, a single pass reporting every match with positions
+- build:     time to compile the TermMatcher for the lexicon
+
+The default transcript approximates one hour of speech (~150 words/min)
+with a 10k-term lexicon.
+
+Usage (from backend/):
+    python -m benchmarks.bench_term_matching [--minutes 60] [--terms 10000]
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.application.services.term_matcher import TermMatcher
+
+FILLER_WORDS = (
+    "leo", "tutajadili", "kuhusu", "mradi", "na", "timu", "itafanya", "kazi",
+    "wiki", "ijayo", "the", "team", "will", "review", "mpango", "wa", "bajeti",
+)
+
+
+def make_lexicon(size: int, rng: random.Random) -> list:
+    terms = set(SwahiliProcessor.TECHNICAL_TERMS)
+    while len(terms) < size:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        # Some multi-word terms, as in real glossaries
+        if rng.random() < 0.1:
+            word += " " + "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        terms.add(word)
+    return sorted(terms)
+
+
+def make_transcript(minutes: int, lexicon: list, rng: random.Random) -> str:
+    words = []
+    for _ in range(minutes * 150):
+        words.append(rng.choice(lexicon) if rng.random() < 0.05 else rng.choice(FILLER_WORDS))
+    return " ".join(words)
+
+
+def per_term(lexicon: list, text: str) -> set:
+    text_lower = text.lower()
+    return {
+        term for term in lexicon
+        if re.search(r"\b" + re.escape(term) + r"\b", text_lower, re.IGNORECASE)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=int, default=60, help="Transcript length in minutes")
+    parser.add_argument("--terms", type=int, default=10_000, help="Lexicon size")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    lexicon = make_lexicon(args.terms, rng)
+    text = make_transcript(args.minutes, lexicon, rng)
+    print(f"  transcript: {len(text.split())} words, lexicon: {len(lexicon)} terms")
+    
+    start = time.perf_counter()
+    matcher = TermMatcher(lexicon)
+    build = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matches = matcher.find_all(text)
+    compiled = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    found = per_term(lexicon, text)
+    old = time.perf_counter() - start
+    
+    assert found == {match.term for match in matches}, "matchers disagree"
+    print(f"  per-term  {old * 1000:10.1f} ms  ({len(found)} distinct terms)")
+    print(f"  compiled  {compiled * 1000:10.1f} ms  ({len(matches)} matches)")
+    print(f"  build     {build * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
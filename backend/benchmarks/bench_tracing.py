@@ -0,0 +1,76 @@
+"""
+Micro-benchmark: cost of instrumentation per span
+
+Measures what an instrumented stage pays for tracing:
+
+- bare:      the block with no instrumentation
+- disabled:  span() while tracing is disabled (shared no-op span)
+- enabled:   span() with a tracer buffering spans for export
+- timed:     timed() (histogram + request timings + span) while tracing is disabled
+
+Usage (from backend/):
+    python -m benchmarks.bench_tracing [--number 200000]
+"""
+import argparse
+import asyncio
+import timeit
+
+from app.shared.metrics import Histogram
+from app.shared.timing import end_request_timing, start_request_timing, timed
+from app.shared.tracing import Tracer, set_tracer, span
+
+
+class DiscardingExporter:
+    """Exporter that drops payloads"""
+    
+    async def export(self, payload: bytes) -> None:
+        pass
+    
+    async def close(self) -> None:
+        pass
+
+
+def bare() -> None:
+    pass
+
+
+def with_span() -> None:
+    with span("storage.load", backend="local"):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200_000, help="Iterations per case")
+    args = parser.parse_args()
+    
+    histogram = Histogram("bench_seconds", "Benchmark", ["stage"]).labels(stage="load")
+    
+    def with_timed() -> None:
+        with timed("storage.load", histogram):
+            pass
+    
+    def run(func) -> float:
+        return timeit.timeit(func, number=args.number) / args.number * 1e9
+    
+    token = start_request_timing()
+    results = {
+        "bare": run(bare),
+        "disabled": run(with_span),
+        "timed": run(with_timed),
+    }
+    end_request_timing(token)
+    
+    # The tracer's event is created outside a loop; the buffer is bounded
+    tracer = Tracer(DiscardingExporter(), service_name="bench", max_queue_size=1024)
+    set_tracer(tracer)
+    results["enabled"] = run(with_span)
+    set_tracer(None)
+    asyncio.run(tracer.flush())
+    
+    for name, per_call in results.items():
+        print(f"  {name:<9} {per_call:8.0f} ns/span")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Local stand-in for the OpenAI Files and Batches APIs
+
+Implements just enough of `/v1/files` and `/v1/batches` for the batch
+summarization provider: a batch completes after a configurable number
+of polls, at which point each uploaded JSONL request is answered by a
+responder function. Tests mount it in-process
+through httpx's ASGI transport; for manual runs serve it with
+`uvicorn tests.integration.openai_batch_stub:app --port 8090` and set
+`SUMMARY_BACKFILL_BASE_URL=http://localhost:8090/v1`.
+"""
+import itertools
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import Response
+
+from app.shared.serialization import dumps, dumps_str, loads
+
+
+def default_responder(body: Dict[str, Any]) -> Optional[str]:
+    """Summary JSON echoing the start of the transcript; None fails the request"""
+    prompt = body["messages"][-1]["content"]
+    if "FAIL" in prompt:
+        return None
+    return dumps_str({
+        "muhtasari": f"Muhtasari wa kikao ({len(prompt)} herufi).",
+        "maamuzi": ["Uamuzi wa majaribio"],
+        "kazi": [{"nani": "Juma", "kazi": "Kufuatilia", "tarehe": None}],
+        "masuala_yaliyoahirishwa": [],
+    })
+
+
+class BatchApiStub:
+    """In-memory files and batches, served by `app`"""
+    
+    def __init__(
+        self,
+        responder: Callable[[Dict[str, Any]], Optional[str]] = default_responder,
+        polls_until_complete: int = 1,
+    ):
+        self.responder = responder
+        self.polls_until_complete = polls_until_complete
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self.app = self._build_app()
+    
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids)}"
+    
+    def _store_file(self, content: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        file_id = self._new_id("file")
+        self.files[file_id] = content
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+    
+    def _run_batch(self, batch: Dict[str, Any]) -> None:
+        """Answer every request of the batch's input file"""
+        outputs, errors = [], []
+        for line in self.files[batch["input_file_id"]].splitlines():
+            if not line.strip():
+                continue
+            request = loads(line)
+            content = self.responder(request["body"])
+            request_id = self._new_id("req")
+            if content is None:
+                errors.append(dumps({
+                    "id": request_id,
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 500,
+                        "request_id": request_id,
+                        "body": {"error": {"message": "Stub failure", "type": "server_error"}},
+                    },
+                    "error": None,
+                }))
+                continue
+            outputs.append(dumps({
+                "id": request_id,
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "request_id": request_id,
+                    "body": {
+                        "id": f"chatcmpl-{request_id}",
+                        "object": "chat.completion",
+                        "model": request["body"]["model"],
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }],
+                    },
+                },
+                "error": None,
+            }))
+        
+        if outputs:
+            batch["output_file_id"] = self._store_file(b"\n".join(outputs), "output.jsonl", "batch_output")["id"]
+        if errors:
+            batch["error_file_id"] = self._store_file(b"\n".join(errors), "errors.jsonl", "batch_output")["id"]
+        batch["request_counts"] = {
+            "total": len(outputs) + len(errors),
+            "completed": len(outputs),
+            "failed": len(errors),
+        }
+    
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+        
+        @app.post("/v1/files")
+        async def create_file(file: UploadFile = File(...), purpose: str = Form(...)):
+            return self._store_file(await file.read(), file.filename or "upload.jsonl", purpose)
+        
+        @app.get("/v1/files/{file_id}/content")
+        async def file_content(file_id: str):
+            if file_id not in self.files:
+                raise HTTPException(status_code=404, detail="No such file")
+            return Response(self.files[file_id], media_type="application/octet-stream")
+        
+        @app.post("/v1/batches")
+        async def create_batch(request: Request):
+            params = loads(await request.body())
+            if params["input_file_id"] not in self.files:
+                raise HTTPException(status_code=400, detail="No such file")
+            batch = {
+                "id": self._new_id("batch"),
+                "object": "batch",
+                "endpoint": params["endpoint"],
+                "completion_window": params["completion_window"],
+                "input_file_id": params["input_file_id"],
+                "metadata": params.get("metadata"),
+                "created_at": int(time.time()),
+                "status": "validating",
+                "output_file_id": None,
+                "error_file_id": None,
+                "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                "_polls": 0,
+            }
+            self.batches[batch["id"]] = batch
+            return self._public(batch)
+        
+        @app.get("/v1/batches/{batch_id}")
+        async def retrieve_batch(batch_id: str):
+            batch = self.batches.get(batch_id)
+            if batch is None:
+                raise HTTPException(status_code=404, detail="No such batch")
+            if batch["status"] != "completed":
+                batch["_polls"] += 1
+                batch["status"] = "in_progress"
+                if batch["_polls"] >= self.polls_until_complete:
+                    self._run_batch(batch)
+                    batch["status"] = "completed"
+            return self._public(batch)
+        
+        return app
+    
+    @staticmethod
+    def _public(batch: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in batch.items() if not key.startswith("_")}
+
+
+app = BatchApiStub().app
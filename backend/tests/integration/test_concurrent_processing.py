@@ -0,0 +1,95 @@
+"""Integration tests for transcriptions processed concurrently"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.application.services.job_scheduler import JobScheduler
+from app.application.services.transcription_orchestrator import TranscriptionOrchestrator
+from app.domain.entities.summary import Summary
+from app.domain.entities.transcription import Transcription
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.infrastructure.database.base import Base
+from app.infrastructure.repositories.transcription_repository_impl import (
+    TranscriptionRepositoryImpl,
+)
+
+
+class FakeStorage:
+    async def load(self, file_path):
+        return b"audio"
+
+
+class OverlappingTranscriber:
+    """Transcriber that holds every call until `jobs` calls are in flight"""
+    
+    def __init__(self, jobs):
+        self._jobs = jobs
+        self._started = 0
+        self._all_started = asyncio.Event()
+    
+    async def transcribe(self, audio_file, language_hint="sw", filename=None):
+        self._started += 1
+        if self._started == self._jobs:
+            self._all_started.set()
+        await asyncio.wait_for(self._all_started.wait(), timeout=5)
+        return f"Nakala ya {filename}."
+
+
+class FakeSummarizer:
+    async def summarize(self, transcript, transcription_id, language="sw", on_section=None):
+        await asyncio.sleep(0)
+        return Summary.create(transcription_id, muhtasari=transcript)
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Sessions on a file database, so that they use separate connections"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jobs_use_their_own_sessions(session_factory):
+    """Test that overlapping jobs complete without sharing a database session"""
+    jobs = 3
+    
+    @asynccontextmanager
+    async def repository_scope():
+        async with session_factory() as session:
+            yield TranscriptionRepositoryImpl(session)
+    
+    async with session_factory() as session:
+        repo = TranscriptionRepositoryImpl(session)
+        transcriptions = [
+            Transcription.create(filename=f"kikao{number}.mp3", file_path=f"/test/kikao{number}.mp3")
+            for number in range(jobs)
+        ]
+        for transcription in transcriptions:
+            await repo.create(transcription)
+    
+    scheduler = JobScheduler(max_workers=jobs, reserved_interactive_workers=0)
+    orchestrator = TranscriptionOrchestrator(
+        transcription_repo=None,
+        transcription_provider=OverlappingTranscriber(jobs),
+        summarization_provider=FakeSummarizer(),
+        file_storage=FakeStorage(),
+        scheduler=scheduler,
+        repository_scope=repository_scope,
+    )
+    
+    futures = [orchestrator.enqueue(transcription.id) for transcription in transcriptions]
+    await asyncio.gather(*futures)
+    
+    async with session_factory() as session:
+        repo = TranscriptionRepositoryImpl(session)
+        for transcription in transcriptions:
+            stored = await repo.get_by_id(transcription.id)
+            assert stored.status == ProcessingStatus.COMPLETED
+            summary = await repo.get_summary(transcription.id)
+            assert summary.muhtasari == f"Nakala ya {transcription.filename}."
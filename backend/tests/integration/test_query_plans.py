@@ -0,0 +1,76 @@
+"""Query-plan tests asserting repository queries use indexes"""
+import pytest
+from sqlalchemy import event, text
+
+from app.domain.entities.transcription import Transcription
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.domain.value_objects.transcription_listing import ListingCursor
+from app.infrastructure.repositories.transcription_repository_impl import (
+    TranscriptionRepositoryImpl,
+)
+
+
+@pytest.fixture
+def captured_selects(test_db):
+    """Capture SELECT statements issued against the transcriptions table"""
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "transcriptions" in statement:
+            statements.append((statement, parameters))
+    
+    event.listen(test_db.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_db.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def assert_uses_index(test_db, statements, expected_index):
+    """Run EXPLAIN QUERY PLAN for each statement and check the index used"""
+    assert statements
+    async with test_db.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plan = " | ".join(row[-1] for row in result)
+            assert expected_index in plan, plan
+            assert "SCAN transcriptions" not in plan or "USING" in plan, plan
+    statements.clear()
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(test_db, test_session, captured_selects):
+    """Test that every repository read avoids a full table scan"""
+    repo = TranscriptionRepositoryImpl(test_session)
+    
+    for i in range(20):
+        transcription = Transcription.create(
+            filename=f"test{i}.mp3",
+            file_path=f"/test/path/test{i}.mp3",
+        )
+        await repo.create(transcription)
+    async with test_db.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+    captured_selects.clear()
+    
+    await repo.get_by_id(transcription.id)
+    await assert_uses_index(test_db, captured_selects, "sqlite_autoindex_transcriptions_1")
+    
+    transcription.mark_as_processing()
+    await repo.update(transcription)
+    await assert_uses_index(test_db, captured_selects, "sqlite_autoindex_transcriptions_1")
+    
+    await repo.get_all(skip=0, limit=10)
+    await assert_uses_index(test_db, captured_selects, "ix_transcriptions_created_at_id")
+    
+    page = await repo.list_page(limit=5)
+    await assert_uses_index(test_db, captured_selects, "ix_transcriptions_created_at_id")
+    
+    # Later pages seek into the index instead of skipping rows
+    await repo.list_page(limit=5, after=ListingCursor.after(page[-1]))
+    await assert_uses_index(
+        test_db,
+        captured_selects,
+        "SEARCH transcriptions USING INDEX ix_transcriptions_created_at_id",
+    )
+    
+    await repo.list_page(limit=5, statuses=[ProcessingStatus.PENDING])
+    await assert_uses_index(test_db, captured_selects, "ix_transcriptions_status_created_at")
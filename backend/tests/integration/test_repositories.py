@@ -61,3 +61,148 @@ async def test_repository_get_all(test_session):
     all_transcriptions = await repo.get_all(skip=0, limit=10)
     assert len(all_transcriptions) == 3
 
+
+
+@pytest.mark.asyncio
+async def test_repository_list_page_keyset(test_session):
+    """Test keyset pagination with ties on created_at and status filter"""
+    from datetime import datetime, timedelta
+    
+    from app.domain.value_objects.processing_status import ProcessingStatus
+    from app.domain.value_objects.transcription_listing import ListingCursor
+    
+    repo = TranscriptionRepositoryImpl(test_session)
+    base = datetime(2025, 1, 1)
+    
+    created = []
+    for i in range(5):
+        transcription = Transcription.create(
+            filename=f"test{i}.mp3",
+            file_path=f"/test/path/test{i}.mp3",
+        )
+        # Two rows share a timestamp to exercise the id tie-breaker
+        transcription.created_at = base + timedelta(minutes=min(i, 3))
+        if i == 0:
+            transcription.mark_as_processing()
+            transcription.complete_with_transcript("Nakala")
+        await repo.create(transcription)
+        created.append(transcription)
+    
+    first_page = await repo.list_page(limit=2)
+    cursor = ListingCursor.decode(ListingCursor.after(first_page[-1]).encode())
+    second_page = await repo.list_page(limit=10, after=cursor)
+    
+    seen = [item.id for item in first_page + second_page]
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+    assert [item.created_at for item in first_page + second_page] == sorted(
+        (t.created_at for t in created), reverse=True
+    )
+    
+    completed = await repo.list_page(statuses=[ProcessingStatus.COMPLETED])
+    assert [item.id for item in completed] == [created[0].id]
+    assert completed[0].has_transcript
+    assert not completed[0].has_summary
+
+
+@pytest.mark.asyncio
+async def test_repository_summary_loaded_on_demand(test_session):
+    """Test that summaries persist to their own tables and load via get_summary"""
+    from sqlalchemy import select
+    
+    from app.domain.entities.summary import ActionItem, Summary
+    from app.infrastructure.database.models.summary_model import ActionItemModel
+    
+    repo = TranscriptionRepositoryImpl(test_session)
+    
+    transcription = Transcription.create(
+        filename="test.mp3",
+        file_path="/test/path/test.mp3",
+    )
+    await repo.create(transcription)
+    assert await repo.get_summary(transcription.id) is None
+    
+    transcription.mark_as_processing()
+    transcription.complete_with_transcript("Nakala ya mkutano")
+    transcription.add_summary(
+        Summary.create(
+            transcription_id=transcription.id,
+            muhtasari="Muhtasari",
+            maamuzi=["Kuhamia Postgres"],
+            kazi=[
+                ActionItem(person="Juma", task="Andaa deployment", due_date="Ijumaa"),
+                ActionItem(person="Asha", task="Kagua API"),
+            ],
+            model="gpt-4o-mini",
+        )
+    )
+    transcription.summary.prompt_mode = "map_reduce"
+    transcription.summary.prompt_tokens = 5200
+    transcription.summary.completion_tokens = 610
+    await repo.update(transcription)
+    
+    # Status/transcript reads do not load the summary
+    retrieved = await repo.get_by_id(transcription.id)
+    assert retrieved.summary is None
+    
+    summary = await repo.get_summary(transcription.id)
+    assert summary.muhtasari == "Muhtasari"
+    assert summary.maamuzi == ["Kuhamia Postgres"]
+    assert [item.person for item in summary.kazi] == ["Juma", "Asha"]
+    assert summary.model == "gpt-4o-mini"
+    assert (summary.prompt_mode, summary.prompt_tokens, summary.completion_tokens) == ("map_reduce", 5200, 610)
+    
+    # Action items are queryable directly in SQL
+    result = await test_session.execute(
+        select(ActionItemModel.task).where(ActionItemModel.person == "Juma")
+    )
+    assert result.scalars().all() == ["Andaa deployment"]
+    
+    # Re-saving the entity without a summary leaves the stored summary intact
+    retrieved.mark_as_failed("later failure")
+    await repo.update(retrieved)
+    assert (await repo.get_summary(transcription.id)).id == summary.id
+
+
+@pytest.mark.asyncio
+async def test_repository_search_ranks_and_tracks_updates(test_session):
+    """Test full-text search over transcripts and summaries with incremental indexing"""
+    from app.application.services.swahili_processor import SwahiliProcessor
+    from app.domain.entities.summary import Summary
+    
+    repo = TranscriptionRepositoryImpl(test_session)
+    
+    deployment = Transcription.create(filename="deployment.mp3", file_path="/test/deployment.mp3")
+    budget = Transcription.create(filename="budget.mp3", file_path="/test/budget.mp3")
+    for transcription in (deployment, budget):
+        await repo.create(transcription)
+        transcription.mark_as_processing()
+    
+    deployment.complete_with_transcript("Leo tutajadili deployment ya API kwenye server mpya.")
+    budget.complete_with_transcript("Tulijadili bajeti ya robo ijayo.")
+    await repo.update(deployment)
+    await repo.update(budget)
+    
+    # Inflected verb forms share a stem: kujadili matches tutajadili and tulijadili
+    hits = await repo.search(SwahiliProcessor.search_terms("kujadili"))
+    assert {hit.id for hit in hits} == {deployment.id, budget.id}
+    
+    hits = await repo.search(SwahiliProcessor.search_terms("deploy server"))
+    assert [hit.id for hit in hits] == [deployment.id]
+    assert "deployment" in hits[0].transcript_text
+    
+    # Adding a summary indexes muhtasari and maamuzi without reindexing the transcript
+    budget.add_summary(
+        Summary.create(
+            transcription_id=budget.id,
+            muhtasari="Mkutano wa bajeti",
+            maamuzi=["Kuhamia Postgres mwezi ujao"],
+        )
+    )
+    await repo.update(budget)
+    
+    hits = await repo.search(SwahiliProcessor.search_terms("postgres"))
+    assert [hit.id for hit in hits] == [budget.id]
+    assert hits[0].maamuzi == ["Kuhamia Postgres mwezi ujao"]
+    
+    assert await repo.search([]) == []
@@ -0,0 +1,80 @@
+"""Integration tests for the prompt-version re-summarization job"""
+import pytest
+
+from app.application.services.resummarization_job import COMPLETED, ResummarizationJob
+from app.domain.entities.summary import Summary
+from app.domain.entities.transcription import Transcription
+from app.domain.exceptions.validation_exceptions import SummarizationProviderError
+from app.domain.interfaces.summarization_provider import SummarizationProvider
+from app.infrastructure.repositories.transcription_repository_impl import (
+    TranscriptionRepositoryImpl,
+)
+
+
+class RecordingProvider(SummarizationProvider):
+    """Provider summarizing with the "v2" prompts, failing on request"""
+    
+    def __init__(self, fail_on=()):
+        self.transcripts = []
+        self._fail_on = set(fail_on)
+    
+    async def summarize(self, transcript, transcription_id, language="sw", on_section=None):
+        self.transcripts.append(transcript)
+        if transcription_id in self._fail_on:
+            raise SummarizationProviderError("Server error", retryable=True)
+        return Summary.create(transcription_id, muhtasari="Mpya", model="gpt-new", prompt_version="v2")
+
+
+async def add_summarized(repo, transcript, prompt_version, processing=False):
+    transcription = Transcription.create(filename="kikao.mp3", file_path="/test/kikao.mp3")
+    await repo.create(transcription)
+    transcription.mark_as_processing()
+    transcription.complete_with_transcript(transcript)
+    transcription.add_summary(
+        Summary.create(transcription.id, muhtasari="Zamani", model="gpt-old", prompt_version=prompt_version)
+    )
+    if processing:
+        transcription.mark_as_failed("Interrupted")
+        transcription.reset_for_retry()
+    await repo.update(transcription)
+    return transcription
+
+
+@pytest.mark.asyncio
+async def test_refreshes_outdated_summaries_from_stored_transcripts(test_session):
+    """Test that only outdated summaries are regenerated, page by page"""
+    repo = TranscriptionRepositoryImpl(test_session)
+    old = await add_summarized(repo, "Kikao cha kwanza.", "v1")
+    unknown = await add_summarized(repo, "Kikao cha pili.", None)
+    current = await add_summarized(repo, "Kikao cha tatu.", "v2")
+    queued = await add_summarized(repo, "Kikao cha nne.", "v1", processing=True)
+    failing = await add_summarized(repo, "Kikao cha tano.", "v1")
+    
+    assert await repo.count_outdated_summaries("v2") == 4
+    
+    provider = RecordingProvider(fail_on={failing.id})
+    job = ResummarizationJob(repo, provider, prompt_version="v2", rate_per_minute=0, page_size=1)
+    progress = await job.run()
+    
+    assert progress.state == COMPLETED
+    assert (progress.total, progress.processed, progress.remaining) == (4, 4, 0)
+    assert (progress.refreshed, progress.failed, progress.skipped) == (2, 1, 1)
+    assert sorted(provider.transcripts) == ["Kikao cha kwanza.", "Kikao cha pili.", "Kikao cha tano."]
+    
+    for transcription in (old, unknown):
+        summary = await repo.get_summary(transcription.id)
+        assert (summary.muhtasari, summary.model, summary.prompt_version) == ("Mpya", "gpt-new", "v2")
+    assert (await repo.get_summary(current.id)).muhtasari == "Zamani"
+    assert (await repo.get_summary(queued.id)).prompt_version == "v1"
+    assert sorted(await repo.list_outdated_summaries("v2")) == sorted([queued.id, failing.id])
+
+
+@pytest.mark.asyncio
+async def test_start_refuses_a_second_concurrent_run(test_session):
+    repo = TranscriptionRepositoryImpl(test_session)
+    job = ResummarizationJob(repo, RecordingProvider(), prompt_version="v2")
+    
+    assert job.start()
+    assert not job.start()
+    await job.stop()
+    assert not job.is_running
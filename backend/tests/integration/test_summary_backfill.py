@@ -0,0 +1,113 @@
+"""Integration tests for batch summary backfill against the local Batch API stand-in"""
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from app.application.services.prompt_budget import DIRECT, TRIMMED
+from app.application.services.summary_backfill import SummaryBackfill
+from app.domain.entities.summary import Summary
+from app.domain.entities.transcription import Transcription
+from app.domain.value_objects.processing_stage import ProcessingStage
+from app.domain.value_objects.processing_status import ProcessingStatus
+from app.infrastructure.providers.openai_batch_summarization_provider import (
+    OpenAIBatchSummarizationProvider,
+)
+from app.infrastructure.providers.openai_summarization_provider import build_messages
+from app.infrastructure.repositories.transcription_repository_impl import (
+    TranscriptionRepositoryImpl,
+)
+from tests.integration.openai_batch_stub import BatchApiStub
+
+
+def make_provider(stub, **kwargs):
+    client = AsyncOpenAI(
+        api_key="test",
+        base_url="http://batch-stub/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=stub.app)),
+    )
+    return OpenAIBatchSummarizationProvider(client, model="gpt-batch", **kwargs)
+
+
+async def add_transcription(repo, transcript=None, summarize_fails=False, summary=False):
+    transcription = Transcription.create(filename="kikao.mp3", file_path="/test/kikao.mp3")
+    await repo.create(transcription)
+    if transcript is not None:
+        transcription.mark_as_processing()
+        transcription.complete_with_transcript(transcript)
+        if summarize_fails:
+            transcription.mark_as_failed("Summarization failed")
+        if summary:
+            transcription.add_summary(Summary.create(transcription.id, muhtasari="Zamani", model="old"))
+        await repo.update(transcription)
+    return transcription
+
+
+@pytest.mark.asyncio
+async def test_backfill_summarizes_transcripts_awaiting_a_summary(test_session):
+    """Test that pending summaries are batched, polled and written in bulk"""
+    repo = TranscriptionRepositoryImpl(test_session)
+    failed = await add_transcription(repo, "Tulijadili bajeti ya mwaka.", summarize_fails=True)
+    rejected = await add_transcription(repo, "FAIL kikao hiki", summarize_fails=True)
+    untranscribed = await add_transcription(repo)
+    done = await add_transcription(repo, "Kikao kilichokamilika.", summary=True)
+    
+    stub = BatchApiStub(polls_until_complete=2)
+    backfill = SummaryBackfill(repo, make_provider(stub), batch_size=1, poll_interval_seconds=0)
+    report = await backfill.run()
+    
+    assert (report.batches, report.submitted, report.summarized, report.failed) == (2, 2, 1, 1)
+    assert len(stub.batches) == 2
+    
+    summarized = await repo.get_by_id(failed.id)
+    assert summarized.status == ProcessingStatus.COMPLETED
+    assert summarized.stage == ProcessingStage.SUMMARIZED
+    assert summarized.error_message is None
+    summary = await repo.get_summary(failed.id)
+    assert summary.model == "gpt-batch"
+    assert summary.kazi[0].person == "Juma"
+    
+    assert (await repo.get_by_id(rejected.id)).status == ProcessingStatus.FAILED
+    assert await repo.get_summary(untranscribed.id) is None
+    assert (await repo.get_summary(done.id)).model == "old"
+    assert await repo.list_awaiting_summary() == [rejected.id]
+
+
+@pytest.mark.asyncio
+async def test_backfill_resummarizes_given_transcriptions(test_session):
+    """Test that explicit IDs replace existing summaries and skip busy transcriptions"""
+    repo = TranscriptionRepositoryImpl(test_session)
+    done = await add_transcription(repo, "Kikao kilichokamilika.", summary=True)
+    busy = await add_transcription(repo)
+    busy.mark_as_processing()
+    await repo.update(busy)
+    
+    backfill = SummaryBackfill(repo, make_provider(BatchApiStub()), poll_interval_seconds=0)
+    report = await backfill.run([done.id, busy.id])
+    
+    assert (report.batches, report.submitted, report.summarized, report.skipped) == (1, 1, 1, 1)
+    assert (await repo.get_summary(done.id)).model == "gpt-batch"
+
+
+@pytest.mark.asyncio
+async def test_backfill_keeps_prompts_within_budget(test_session):
+    """Test that long transcripts are trimmed, oversized ones left out, and modes recorded"""
+    repo = TranscriptionRepositoryImpl(test_session)
+    meeting = "Tulianza kikao. " + "Tulijadili bajeti ya mradi. " * 40 + "Tuliamua kuajiri."
+    short = await add_transcription(repo, "Tulijadili bajeti ya mwaka.", summarize_fails=True)
+    long = await add_transcription(repo, meeting, summarize_fails=True)
+    oversized = await add_transcription(repo, meeting * 5, summarize_fails=True)
+    
+    stub = BatchApiStub()
+    provider = make_provider(stub, max_prompt_tokens=provider_tokens(meeting) - 5)
+    report = await SummaryBackfill(repo, provider, poll_interval_seconds=0).run()
+    
+    assert (report.submitted, report.summarized, report.oversized) == (2, 2, 1)
+    assert (await repo.get_summary(short.id)).prompt_mode == DIRECT
+    assert (await repo.get_summary(long.id)).prompt_mode == TRIMMED
+    assert await repo.get_summary(oversized.id) is None
+    assert await repo.list_awaiting_summary() == [oversized.id]
+
+
+def provider_tokens(transcript):
+    """Prompt tokens of a transcript as counted by the batch provider"""
+    return make_provider(BatchApiStub())._counter.count_messages(build_messages(transcript))
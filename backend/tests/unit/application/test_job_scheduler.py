@@ -0,0 +1,217 @@
+"""Unit tests for JobScheduler"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.job_scheduler import JobPriority, JobScheduler
+from app.shared.timing import current_timings, end_request_timing, start_request_timing
+
+
+def make_scheduler(**kwargs) -> JobScheduler:
+    return JobScheduler(
+        interactive_origins={"browser-recording", "meet-extension"},
+        batch_origins={"batch"},
+        **kwargs,
+    )
+
+
+def test_classify_origins():
+    """Test mapping origins to priority classes"""
+    scheduler = make_scheduler()
+    
+    assert scheduler.classify("browser-recording") == JobPriority.INTERACTIVE
+    assert scheduler.classify("file-upload") == JobPriority.STANDARD
+    assert scheduler.classify(None) == JobPriority.STANDARD
+    assert scheduler.classify("batch") == JobPriority.BATCH
+
+
+@pytest.mark.asyncio
+async def test_interactive_jobs_run_before_queued_uploads():
+    """Test that interactive jobs jump ahead of queued file uploads"""
+    scheduler = make_scheduler(max_workers=1, reserved_interactive_workers=0)
+    release = asyncio.Event()
+    order = []
+    
+    async def handler(job_id):
+        order.append(job_id)
+        await release.wait()
+    
+    first, upload, live = uuid4(), uuid4(), uuid4()
+    jobs = [
+        scheduler.submit(first, handler, origin="file-upload"),
+        scheduler.submit(upload, handler, origin="file-upload"),
+        scheduler.submit(live, handler, origin="browser-recording"),
+    ]
+    release.set()
+    await asyncio.gather(*jobs)
+    
+    assert order == [first, live, upload]
+
+
+@pytest.mark.asyncio
+async def test_fair_queuing_interleaves_tenants():
+    """Test that a bulk submitter does not starve another tenant"""
+    scheduler = make_scheduler(max_workers=1, reserved_interactive_workers=0)
+    order = []
+    
+    async def handler(job_id):
+        order.append(job_id)
+    
+    backfill = [uuid4() for _ in range(5)]
+    other = uuid4()
+    jobs = [scheduler.submit(job_id, handler, tenant="bulk") for job_id in backfill]
+    jobs.append(scheduler.submit(other, handler, tenant="other"))
+    await asyncio.gather(*jobs)
+    
+    # First bulk job was dispatched immediately; the other tenant is next
+    assert order.index(other) <= 2
+
+
+@pytest.mark.asyncio
+async def test_reserved_slots_kept_for_interactive_jobs():
+    """Test that batch jobs cannot occupy reserved worker slots"""
+    scheduler = make_scheduler(max_workers=2, reserved_interactive_workers=1)
+    release = asyncio.Event()
+    
+    async def handler(job_id):
+        await release.wait()
+    
+    jobs = [scheduler.submit(uuid4(), handler, origin="batch") for _ in range(3)]
+    await asyncio.sleep(0)
+    assert scheduler.running_count == 1
+    
+    jobs.append(scheduler.submit(uuid4(), handler, origin="meet-extension"))
+    await asyncio.sleep(0)
+    assert scheduler.running_count == 2
+    
+    release.set()
+    await asyncio.gather(*jobs)
+    assert scheduler.running_count == 0
+    assert scheduler.queued_count == 0
+
+
+@pytest.mark.asyncio
+async def test_job_failure_propagates_to_future():
+    """Test that handler exceptions are delivered through the job future"""
+    scheduler = make_scheduler()
+    
+    async def handler(job_id):
+        raise RuntimeError("boom")
+    
+    with pytest.raises(RuntimeError):
+        await scheduler.submit(uuid4(), handler)
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_job_releases_slot():
+    """Test that cancelling a running job frees its worker slot immediately"""
+    scheduler = make_scheduler(max_workers=1, reserved_interactive_workers=0)
+    started = asyncio.Event()
+    interrupted = []
+    
+    async def slow_handler(job_id):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            interrupted.append(job_id)
+            raise
+    
+    async def fast_handler(job_id):
+        return None
+    
+    running_id, queued_id = uuid4(), uuid4()
+    running = scheduler.submit(running_id, slow_handler)
+    queued = scheduler.submit(queued_id, fast_handler)
+    await started.wait()
+    
+    assert await scheduler.cancel(running_id)
+    assert interrupted == [running_id]
+    assert running.cancelled()
+    
+    await queued
+    assert scheduler.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_job():
+    """Test that a queued job is removed without running"""
+    scheduler = make_scheduler(max_workers=1, reserved_interactive_workers=0)
+    release = asyncio.Event()
+    ran = []
+    
+    async def handler(job_id):
+        ran.append(job_id)
+        await release.wait()
+    
+    first, second = uuid4(), uuid4()
+    first_job = scheduler.submit(first, handler)
+    second_job = scheduler.submit(second, handler)
+    
+    assert await scheduler.cancel(second)
+    assert scheduler.queued_count == 0
+    
+    release.set()
+    await first_job
+    assert ran == [first]
+    assert second_job.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_jobs_are_not_charged_to_their_tenant():
+    """Test that a tenant cancelling queued work keeps its fair share"""
+    scheduler = make_scheduler(max_workers=1, reserved_interactive_workers=0)
+    release = asyncio.Event()
+    order = []
+    
+    async def handler(job_id):
+        order.append(job_id)
+        await release.wait()
+    
+    blocker = uuid4()
+    jobs = [scheduler.submit(blocker, handler, tenant="other")]
+    cancelled = [uuid4() for _ in range(4)]
+    for job_id in cancelled:
+        scheduler.submit(job_id, handler, tenant="bulk")
+    for job_id in cancelled:
+        assert await scheduler.cancel(job_id)
+    
+    bulk, other = uuid4(), uuid4()
+    jobs.append(scheduler.submit(bulk, handler, tenant="bulk"))
+    jobs.append(scheduler.submit(other, handler, tenant="other"))
+    release.set()
+    await asyncio.gather(*jobs)
+    
+    # Both tenants start level again; without the refund bulk would wait behind other
+    assert order == [blocker, bulk, other]
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_submitter_context():
+    """Test a job records into its submitter's timings, not the previous job's"""
+    scheduler = make_scheduler(max_workers=1, reserved_interactive_workers=0)
+    release = asyncio.Event()
+    seen = {}
+    
+    async def handler(job_id):
+        seen[job_id] = current_timings()
+        await release.wait()
+    
+    first, second = uuid4(), uuid4()
+    token = start_request_timing()
+    first_timings = current_timings()
+    first_job = scheduler.submit(first, handler)
+    end_request_timing(token)
+    
+    token = start_request_timing()
+    second_timings = current_timings()
+    second_job = scheduler.submit(second, handler)
+    end_request_timing(token)
+    
+    release.set()
+    await asyncio.gather(first_job, second_job)
+    
+    assert seen[first] is first_timings
+    assert seen[second] is second_timings
+    assert "queue" in second_timings.as_dict()
@@ -0,0 +1,111 @@
+"""Unit tests for incremental JSON parsing and streamed summaries"""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.summary import ActionItem
+from app.infrastructure.providers.openai_summarization_provider import OpenAISummarizationProvider
+from app.shared.json_stream import JsonMemberStream
+from app.shared.serialization import JSONDecodeError
+
+SUMMARY_JSON = (
+    '{"muhtasari": "Kikao cha \\"bajeti\\" {robo ya kwanza}.", '
+    '"maamuzi": ["Kuajiri wafanyakazi wa muda", "Bei [mpya]"], '
+    '"kazi": [{"nani": "Juma", "kazi": "Kuandaa ripoti", "tarehe": null}], '
+    '"idadi": 3, '
+    '"masuala_yaliyoahirishwa": []}'
+)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_members_complete_however_text_is_split(size):
+    """Test that every member is returned once, whatever the chunking"""
+    text = "```json\n" + SUMMARY_JSON + "\n```"
+    parser = JsonMemberStream()
+    members = []
+    for start in range(0, len(text), size):
+        members.extend(parser.feed(text[start:start + size]))
+    
+    assert [name for name, _ in members] == [
+        "muhtasari", "maamuzi", "kazi", "idadi", "masuala_yaliyoahirishwa",
+    ]
+    assert members[0][1] == 'Kikao cha "bajeti" {robo ya kwanza}.'
+    assert members[1][1] == ["Kuajiri wafanyakazi wa muda", "Bei [mpya]"]
+    assert members[3][1] == 3
+    assert parser.done
+
+
+def test_member_returned_when_its_value_closes():
+    """Test that a section is available before the rest of the object arrives"""
+    parser = JsonMemberStream()
+    assert parser.feed('{"muhtasari": "Kikao') == []
+    assert parser.feed(' kifupi", "maamuzi": [') == [("muhtasari", "Kikao kifupi")]
+    assert parser.feed('"A"], "n": 1') == [("maamuzi", ["A"])]
+    assert parser.feed("}") == [("n", 1)]
+
+
+def test_malformed_value_raises():
+    parser = JsonMemberStream()
+    with pytest.raises(JSONDecodeError):
+        parser.feed('{"maamuzi": [1 2]}')
+
+
+class FakeStream:
+    def __init__(self, deltas):
+        self._deltas = deltas
+    
+    def __aiter__(self):
+        return self._chunks()
+    
+    async def _chunks(self):
+        for delta in self._deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+
+class FakeCompletions:
+    def __init__(self, content):
+        self._content = content
+        self.calls = []
+    
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("stream"):
+            return FakeStream([self._content[i:i + 5] for i in range(0, len(self._content), 5)])
+        message = SimpleNamespace(content=self._content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def make_provider(stream):
+    completions = FakeCompletions(SUMMARY_JSON)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return OpenAISummarizationProvider(client, model="gpt-test", stream=stream), completions
+
+
+async def test_streaming_provider_emits_sections_before_returning():
+    """Test that streamed sections are normalized and match the returned summary"""
+    provider, completions = make_provider(stream=True)
+    sections = []
+    
+    async def on_section(name, value):
+        sections.append((name, value))
+    
+    summary = await provider.summarize("Kikao " * 50, uuid4(), on_section=on_section)
+    
+    assert completions.calls[0]["stream"] is True
+    assert [name for name, _ in sections] == ["muhtasari", "maamuzi", "kazi", "masuala_yaliyoahirishwa"]
+    assert sections[2][1] == [ActionItem(person="Juma", task="Kuandaa ripoti", due_date=None)]
+    assert dict(sections) == {
+        "muhtasari": summary.muhtasari,
+        "maamuzi": summary.maamuzi,
+        "kazi": summary.kazi,
+        "masuala_yaliyoahirishwa": summary.masuala_yaliyoahirishwa,
+    }
+
+
+async def test_provider_does_not_stream_without_listener():
+    provider, completions = make_provider(stream=True)
+    summary = await provider.summarize("Kikao " * 50, uuid4())
+    
+    assert "stream" not in completions.calls[0]
+    assert summary.maamuzi == ["Kuajiri wafanyakazi wa muda", "Bei [mpya]"]
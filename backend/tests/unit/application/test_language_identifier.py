@@ -0,0 +1,50 @@
+"""Unit tests for n-gram language identification"""
+from app.application.services.language_identifier import (
+    ENGLISH,
+    MIXED,
+    SWAHILI,
+    LanguageIdentifier,
+)
+from app.application.services.swahili_processor import SwahiliProcessor
+
+
+def test_segments_are_tagged_swahili_english_or_mixed():
+    """Test per-sentence tagging and the transcript-level ratios"""
+    text = (
+        "Kesho tutakutana na wateja wetu ofisini. "
+        "We need to fix the bug before Friday.\n"
+        "Nimeona kwamba database imekuwa slow sana tangu jana. "
+        "Mradi huu ni muhimu sana kwa kampuni yetu. 2024!"
+    )
+    
+    analysis = LanguageIdentifier().analyze(text)
+    
+    assert [segment.language for segment in analysis.segments] == [
+        SWAHILI, ENGLISH, MIXED, SWAHILI,
+    ]
+    first = analysis.segments[0]
+    assert text[first.start:first.end] == "Kesho tutakutana na wateja wetu ofisini."
+    assert analysis.dominant_language == SWAHILI
+    assert analysis.code_switching_ratio == 0.5
+    assert 0 < analysis.english_ratio < 0.5
+
+
+def test_empty_and_unidentifiable_text():
+    """Test that text without letters yields no segments"""
+    identifier = LanguageIdentifier()
+    
+    for text in ("", "123 456.", "!!"):
+        analysis = identifier.analyze(text)
+        assert analysis.segments == ()
+        assert analysis.code_switching_ratio == 0.0
+
+
+def test_prompt_enhancement_only_for_code_switched_transcripts():
+    """Test that the enhancement lists terms from switching segments"""
+    swahili = "Leo tutajadili bajeti ya mwaka. Mradi huu ni muhimu sana kwa kampuni yetu."
+    mixed = swahili + " Tutafanya deployment ya API kwenye server; the team is ready."
+    
+    assert SwahiliProcessor.enhance_prompt_for_code_switching("P", swahili) == "P"
+    enhanced = SwahiliProcessor.enhance_prompt_for_code_switching("P", mixed)
+    assert "code-switching" in enhanced
+    assert "api, deployment, server" in enhanced
@@ -0,0 +1,73 @@
+"""Unit tests for reloadable lexicons"""
+import os
+
+import pytest
+
+from app.application.services.lexicon import (
+    PROPER_NOUNS,
+    TECHNICAL_TERMS,
+    Lexicon,
+    LexiconRegistry,
+)
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.infrastructure.lexicons.file_lexicon_source import FileLexiconSource
+
+
+@pytest.fixture
+def lexicon_dir(tmp_path):
+    (tmp_path / "technical_terms.txt").write_text("# Products\nMpesa API\nkafka\n")
+    tenant = tmp_path / "tenants" / "acme"
+    tenant.mkdir(parents=True)
+    (tenant / "proper_nouns.txt").write_text("Juma Hamisi\n")
+    return tmp_path
+
+
+@pytest.fixture
+def registry(lexicon_dir):
+    registry = LexiconRegistry(
+        {TECHNICAL_TERMS: ["docker"], PROPER_NOUNS: ["nairobi"]},
+        source=FileLexiconSource(str(lexicon_dir)),
+    )
+    registry.reload()
+    original = SwahiliProcessor._lexicons
+    SwahiliProcessor.use_lexicons(registry)
+    yield registry
+    SwahiliProcessor.use_lexicons(original)
+
+
+def test_lexicon_keeps_sorted_unique_terms():
+    """Test term normalization, spellings, binary-search membership and versioning"""
+    lexicon = Lexicon({TECHNICAL_TERMS: ["Kafka", "api", "kafka", " "]})
+    
+    assert lexicon.terms(TECHNICAL_TERMS) == ("api", "kafka")
+    assert lexicon.contains(TECHNICAL_TERMS, "KAFKA")
+    assert not lexicon.contains(TECHNICAL_TERMS, "kaf")
+    assert lexicon.spelling("kafka") == "Kafka"
+    assert lexicon.version == Lexicon({TECHNICAL_TERMS: ["api", "Kafka"]}).version
+
+
+def test_file_lexicons_extend_defaults_with_tenant_overlays(registry):
+    """Test that loaded terms join the built-ins and overlays apply per tenant"""
+    text = "Juma Hamisi alisema kafka na docker ziko Nairobi"
+    
+    assert SwahiliProcessor.extract_technical_terms(text) == {"kafka", "docker"}
+    assert SwahiliProcessor.extract_proper_nouns(text) == {"nairobi"}
+    assert SwahiliProcessor.extract_proper_nouns(text, "acme") == {"juma hamisi", "nairobi"}
+    assert SwahiliProcessor.extract_proper_nouns(text, "unknown") == {"nairobi"}
+
+
+def test_reload_swaps_snapshot_only_when_files_change(registry, lexicon_dir):
+    """Test that in-flight snapshots are kept and reloads are change-driven"""
+    before = registry.snapshot
+    assert not registry.reload()
+    
+    path = lexicon_dir / "technical_terms.txt"
+    path.write_text("kafka\nredis\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert registry.reload()
+    assert registry.snapshot is not before
+    assert SwahiliProcessor.extract_technical_terms("redis na mpesa api") == {"redis"}
+    assert before.matcher(TECHNICAL_TERMS).distinct("redis na mpesa api") == {"mpesa api"}
+    assert registry.snapshot.base.version != before.base.version
@@ -0,0 +1,57 @@
+"""Unit tests for the log pipeline processors and queued output"""
+import io
+
+import pytest
+import structlog
+
+from app.shared.logging import (
+    EventSampler,
+    FieldTruncator,
+    configure_logging,
+    get_logger,
+    shutdown_logging,
+)
+from app.shared.serialization import loads
+
+
+def test_sampler_drops_info_events_but_keeps_warnings():
+    """Test sampled events are dropped at rate 0 and warnings always pass"""
+    sampler = EventSampler({"request.started": 0.0, "request.completed": 1.0})
+    
+    with pytest.raises(structlog.DropEvent):
+        sampler(None, "info", {"event": "request.started"})
+    assert sampler(None, "warning", {"event": "request.started"}) == {"event": "request.started"}
+    assert sampler(None, "info", {"event": "request.completed"}) == {"event": "request.completed"}
+    assert sampler(None, "info", {"event": "other"}) == {"event": "other"}
+
+
+def test_truncator_shortens_and_hashes_large_fields():
+    """Test long string fields are cut and tagged, short ones untouched"""
+    truncator = FieldTruncator(max_length=10)
+    raw = "x" * 50
+    
+    event = truncator(None, "info", {"event": "e" * 20, "raw_response": raw, "short": "ok", "count": 5})
+    
+    assert event["event"] == "e" * 20
+    assert event["short"] == "ok"
+    assert event["count"] == 5
+    assert event["raw_response"].startswith("x" * 10 + "…[50 chars, sha256:")
+    assert truncator(None, "info", {"raw_response": raw})["raw_response"] == event["raw_response"]
+
+
+def test_queued_output_is_written_on_shutdown(monkeypatch):
+    """Test records go through the writer thread and are flushed on shutdown"""
+    monkeypatch.setattr("app.shared.logging.settings.environment", "production")
+    stream = io.StringIO()
+    configure_logging("INFO", async_output=True, max_field_length=16, stream=stream)
+    try:
+        logger = get_logger("tests.logging_pipeline")
+        logger.info("summarization.raw_response", raw_response="y" * 100)
+        logger.debug("hidden")
+    finally:
+        shutdown_logging()
+    
+    (line,) = stream.getvalue().splitlines()
+    record = loads(line)
+    assert record["event"] == "summarization.raw_response"
+    assert record["raw_response"].startswith("y" * 16 + "…[100 chars")
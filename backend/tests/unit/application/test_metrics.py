@@ -0,0 +1,52 @@
+"""Unit tests for the metrics registry"""
+import pytest
+
+from app.shared.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test histogram buckets are cumulative and include +Inf, sum and count"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "Stage duration", ["stage"], buckets=[0.1, 1.0])
+    
+    child = histogram.labels(stage="transcribe")
+    for value in (0.05, 0.5, 0.5, 3.0):
+        child.observe(value)
+    
+    output = registry.render()
+    assert "# TYPE stage_seconds histogram" in output
+    assert 'stage_seconds_bucket{stage="transcribe",le="0.1"} 1' in output
+    assert 'stage_seconds_bucket{stage="transcribe",le="1"} 3' in output
+    assert 'stage_seconds_bucket{stage="transcribe",le="+Inf"} 4' in output
+    assert 'stage_seconds_sum{stage="transcribe"} 4.05' in output
+    assert 'stage_seconds_count{stage="transcribe"} 4' in output
+
+
+def test_counter_and_gauge_render_by_label():
+    """Test counters and callback gauges are rendered per label set"""
+    registry = MetricsRegistry()
+    counter = registry.counter("failures_total", "Failures", ["provider"])
+    gauge = registry.gauge("jobs", "Jobs", ["state"])
+    running = [2]
+    
+    counter.labels(provider="whisper").inc()
+    counter.labels(provider="whisper").inc()
+    counter.labels(provider='odd"name').inc()
+    gauge.labels(state="running").set_function(lambda: running[0])
+    running[0] = 3
+    
+    output = registry.render()
+    assert 'failures_total{provider="whisper"} 2' in output
+    assert 'failures_total{provider="odd\\"name"} 1' in output
+    assert 'jobs{state="running"} 3' in output
+
+
+def test_counter_rejects_decrease_and_duplicate_names():
+    """Test counters only increase and metric names are unique"""
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "Events")
+    
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+    with pytest.raises(ValueError):
+        registry.counter("events_total", "Events")
@@ -0,0 +1,148 @@
+"""Unit tests for local token counting and prompt budgets"""
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.application.services.prompt_budget import (
+    DIRECT,
+    MAP_REDUCE,
+    TRIM_MARKER,
+    TRIMMED,
+    PromptBudget,
+)
+from app.infrastructure.providers.openai_summarization_provider import (
+    OpenAISummarizationProvider,
+    build_messages,
+)
+from app.shared.tokens import TokenCounter
+
+SENTENCE = "Tulijadili bajeti ya mradi. "
+TRANSCRIPT = "Tulianza kikao. " + SENTENCE * 100 + "Tuliamua kuajiri."
+
+
+def test_budget_chooses_direct_trimmed_or_map_reduce():
+    """Test that the mode follows how far the transcript is over budget"""
+    counter = TokenCounter()
+    prompt_tokens = counter.count(TRANSCRIPT) + 100  # As if the template took 100 tokens
+    
+    assert PromptBudget(counter, prompt_tokens).plan(TRANSCRIPT, prompt_tokens).mode == DIRECT
+    
+    trimmed = PromptBudget(counter, prompt_tokens - 50).plan(TRANSCRIPT, prompt_tokens)
+    assert trimmed.mode == TRIMMED
+    text = trimmed.parts[0]
+    assert text.startswith("Tulianza kikao.") and text.endswith("Tuliamua kuajiri.")
+    assert TRIM_MARKER in text
+    assert counter.count(text) <= counter.count(TRANSCRIPT) - 50
+    
+    split = PromptBudget(counter, 500).plan(TRANSCRIPT, prompt_tokens)
+    assert split.mode == MAP_REDUCE
+    assert len(split.parts) > 2
+    assert all(counter.count(part) <= 400 for part in split.parts)
+    assert " ".join(split.parts) == TRANSCRIPT
+
+
+
+def test_budget_splits_long_sentences_and_words_to_fit_large_templates():
+    """Test that no part exceeds what is left beside a large template"""
+    counter = TokenCounter()
+    transcript = "Tulianza kikao " + "na tukajadili " * 60 + "x" * 600 + ". Tuliamua kuajiri."
+    max_prompt_tokens = 400
+    overhead = 360  # The template leaves 40 tokens per call
+    prompt_tokens = counter.count(transcript) + overhead
+    
+    split = PromptBudget(counter, max_prompt_tokens).plan(transcript, prompt_tokens)
+    
+    assert split.mode == MAP_REDUCE
+    assert all(counter.count(part) <= max_prompt_tokens - overhead for part in split.parts)
+    assert "".join(split.parts).replace(" ", "") == transcript.replace(" ", "")
+    
+    trimmed = PromptBudget(counter, max_prompt_tokens).plan(transcript, prompt_tokens, map_reduce=False)
+    assert trimmed.mode == TRIMMED
+    assert counter.count(trimmed.parts[0]) <= max_prompt_tokens - overhead
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = []
+    
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = (
+            f'{{"muhtasari": "Sehemu {len(self.calls)}", "maamuzi": ["Kuajiri"], '
+            '"kazi": [], "masuala_yaliyoahirishwa": []}'
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=300, completion_tokens=40),
+        )
+
+
+async def test_provider_summarizes_oversized_transcripts_in_parts_and_records_usage():
+    """Test map-reduce summarization and the billed tokens summed over its calls"""
+    completions = FakeCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    counter = TokenCounter("gpt-test")
+    max_prompt_tokens = counter.count_messages(build_messages("")) + 400
+    provider = OpenAISummarizationProvider(client, model="gpt-test", max_prompt_tokens=max_prompt_tokens)
+    
+    summary = await provider.summarize(TRANSCRIPT, uuid4())
+    
+    prompts = [call["messages"][-1]["content"] for call in completions.calls]
+    assert len(prompts) > 3
+    assert all(counter.count_messages(call["messages"]) <= max_prompt_tokens for call in completions.calls)
+    assert "Tulianza kikao." in prompts[0] and "Tuliamua kuajiri." in prompts[-2]
+    assert "Sehemu ya 1 ya kikao:" in prompts[-1] and "Uamuzi: Kuajiri" in prompts[-1]
+    
+    assert summary.prompt_mode == MAP_REDUCE
+    assert summary.prompt_tokens == 300 * len(prompts)
+    assert summary.completion_tokens == 40 * len(prompts)
+    assert summary.muhtasari == f"Sehemu {len(prompts)}"
+
+
+class LongNotesCompletions(FakeCompletions):
+    """Completions returning long part summaries, with the peak number of calls in flight"""
+    
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+    
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+        self.calls.append(kwargs)
+        muhtasari = "Tulijadili bajeti ya mradi kwa kina. " * 15
+        content = (
+            f'{{"muhtasari": "{muhtasari}", "maamuzi": [], "kazi": [], "masuala_yaliyoahirishwa": []}}'
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=300, completion_tokens=40),
+        )
+
+
+async def test_provider_part_calls_stay_within_concurrency_limit_over_rounds():
+    """Test that part notes needing a second split never exceed the call limit"""
+    completions = LongNotesCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    counter = TokenCounter("gpt-test")
+    max_prompt_tokens = counter.count_messages(build_messages("")) + 400
+    provider = OpenAISummarizationProvider(
+        client,
+        model="gpt-test",
+        max_prompt_tokens=max_prompt_tokens,
+        max_concurrency=2,
+    )
+    
+    summary = await provider.summarize(TRANSCRIPT * 3, uuid4())
+    
+    transcript_parts = len(PromptBudget(counter, max_prompt_tokens).plan(
+        TRANSCRIPT * 3, counter.count_messages(build_messages(TRANSCRIPT * 3))
+    ).parts)
+    assert summary.prompt_mode == MAP_REDUCE
+    assert len(completions.calls) > transcript_parts + 1  # The notes were split again
+    assert completions.peak == 2
@@ -0,0 +1,122 @@
+"""Unit tests for summarization model routing"""
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.job_scheduler import JobPriority, JobScheduler
+from app.application.services.summarization_router import ModelRoute, SummarizationRouter
+from app.domain.entities.summary import Summary
+from app.domain.exceptions.validation_exceptions import SummarizationProviderError
+from app.domain.interfaces.summarization_provider import SummarizationProvider
+from app.infrastructure.providers.openai_summarization_provider import OpenAISummarizationProvider
+
+
+class FakeProvider(SummarizationProvider):
+    """Provider returning a summary or raising a queued error"""
+    
+    def __init__(self, errors=()):
+        self.calls = 0
+        self._errors = list(errors)
+    
+    async def summarize(self, transcript, transcription_id, language="sw", on_section=None):
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        return Summary.create(transcription_id=transcription_id, muhtasari="Muhtasari")
+
+
+def make_router(small=None, large=None, **kwargs):
+    return SummarizationRouter(
+        [
+            ModelRoute("small", small or FakeProvider(), max_input_tokens=1000, max_concurrency=2),
+            ModelRoute("large", large or FakeProvider(), max_input_tokens=100000, max_concurrency=2),
+        ],
+        **kwargs,
+    )
+
+
+async def test_routes_by_transcript_size_and_records_model():
+    """Test that short transcripts use the first model and long ones skip it"""
+    router = make_router()
+    
+    short = await router.summarize("Kikao kifupi", uuid4())
+    long = await router.summarize("neno " * 2000, uuid4())
+    
+    assert short.model == "small"
+    assert long.model == "large"
+
+
+async def test_falls_back_on_rate_limit_and_cools_down():
+    """Test 429 fallback and that the limited model is skipped afterwards"""
+    small = FakeProvider([SummarizationProviderError("429", rate_limited=True, retry_after=60)])
+    large = FakeProvider()
+    router = make_router(small, large)
+    
+    first = await router.summarize("Kikao", uuid4())
+    second = await router.summarize("Kikao", uuid4())
+    
+    assert (first.model, second.model) == ("large", "large")
+    assert small.calls == 1
+    assert router.headroom("small") == 0
+
+
+async def test_non_transient_errors_are_not_retried():
+    """Test that a bad response does not hop to another model"""
+    large = FakeProvider()
+    router = make_router(FakeProvider([SummarizationProviderError("Invalid JSON")]), large)
+    
+    with pytest.raises(SummarizationProviderError, match="Invalid JSON"):
+        await router.summarize("Kikao", uuid4())
+    assert large.calls == 0
+
+
+async def test_batch_jobs_leave_headroom_for_interactive_jobs():
+    """Test that batch work moves off a model with only reserved headroom left"""
+    router = make_router(reserved_interactive=1)
+    router._state["small"].in_flight = 1
+    
+    assert [route.model for route in router.candidates(10, JobPriority.BATCH)] == ["large", "small"]
+    assert router.candidates(10, JobPriority.INTERACTIVE)[0].model == "small"
+    
+    # The scheduler exposes the running job's priority to the router
+    seen = []
+    
+    async def handler(job_id):
+        seen.append((await router.summarize("Kikao", job_id)).model)
+    
+    scheduler = JobScheduler(batch_origins={"batch"})
+    await asyncio.wait_for(scheduler.submit(uuid4(), handler, origin="batch"), 1)
+    assert seen == ["large"]
+
+
+class SlowCompletions:
+    """Chat completions fake recording the peak number of calls in flight"""
+    
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+    
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        content = '{"muhtasari": "Muhtasari", "maamuzi": [], "kazi": [], "masuala_yaliyoahirishwa": []}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+async def test_saturated_route_calls_stay_within_its_concurrency_limit():
+    """Test that jobs routed to a saturated model wait for its call slots"""
+    completions = SlowCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    provider = OpenAISummarizationProvider(client, model="gpt-test", max_concurrency=2)
+    router = SummarizationRouter([ModelRoute("gpt-test", provider, max_input_tokens=100000, max_concurrency=2)])
+    
+    summaries = await asyncio.gather(*(router.summarize("Kikao", uuid4()) for _ in range(6)))
+    
+    assert all(summary.model == "gpt-test" for summary in summaries)
+    assert completions.peak == 2
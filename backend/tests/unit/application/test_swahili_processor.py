@@ -0,0 +1,87 @@
+"""Unit tests for Swahili search normalization, term matching and transcript cleanup"""
+from app.application.services.swahili_processor import SwahiliProcessor
+from app.application.services.term_matcher import TermMatcher
+from app.application.services.transcript_cleaner import TranscriptCleaner
+
+
+def test_search_terms_share_stems_across_inflections():
+    """Test that inflected verb forms normalize to one stem"""
+    for word in ("tutajadili", "walijadili", "kujadili", "tunajadili"):
+        assert SwahiliProcessor.normalize_search_term(word) == "jadili"
+    
+    # Technical terms and short words are left intact
+    assert SwahiliProcessor.normalize_search_term("Deployment") == "deployment"
+    assert SwahiliProcessor.normalize_search_term("kikao") == "kikao"
+
+
+def test_search_terms_fold_case_diacritics_and_stopwords():
+    """Test tokenization drops stopwords and folds apostrophes and accents"""
+    terms = SwahiliProcessor.search_terms("Ng'ombe na Café ya timu")
+    assert terms == ["ngombe", "cafe", "timu"]
+
+
+def test_search_snippet_highlights_original_words():
+    """Test that snippets keep the original text and mark matches"""
+    text = "Hii ni mkutano. Leo tutajadili deployment <API> mpya."
+    snippet = SwahiliProcessor.search_snippet(text, ["jadili", "deploy"])
+    
+    assert "<mark>tutajadili</mark>" in snippet
+    assert "<mark>deployment</mark>" in snippet
+    assert "&lt;API&gt;" in snippet
+    assert SwahiliProcessor.search_snippet(text, ["bajeti"]) is None
+
+
+def test_term_matcher_reports_positions_and_prefers_longest_term():
+    """Test that overlapping terms resolve to the longest whole-word match"""
+    matcher = TermMatcher(["java", "javascript", "dar es salaam", "c++"])
+    text = "Tunatumia JavaScript na Java huko Dar es Salaam; javas si term. C++ pia."
+    
+    matches = matcher.find_all(text)
+    
+    assert [match.term for match in matches] == ["javascript", "java", "dar es salaam", "c++"]
+    assert text[matches[2].start:matches[2].end] == "Dar es Salaam"
+    assert matcher.counts("java, Java na javascript") == {"java": 2, "javascript": 1}
+    assert TermMatcher([]).find_all(text) == []
+
+
+def test_technical_terms_and_code_switching_use_single_pass_matchers():
+    """Test term extraction and code-switching detection"""
+    text = "Tutafanya deployment ya API kwenye server; the team is ready to ship"
+    
+    assert SwahiliProcessor.extract_technical_terms(text) == {"deployment", "api", "server"}
+    assert SwahiliProcessor.count_technical_terms("api na API") == {"api": 2}
+    assert SwahiliProcessor.detect_code_switching(text)
+    assert not SwahiliProcessor.detect_code_switching("Leo tutajadili mradi wa the API")
+
+
+def test_clean_transcript_drops_fillers_loops_and_whitespace():
+    """Test that post-processing removes what adds tokens but no meaning"""
+    raw = (
+        "Eeh, tuanze   kikao.  Sasa, mmh, tutajadili deployment eeh.\n\n\n"
+        "Sawa sawa.\u200b Asante kwa kutazama. Asante kwa kutazama. "
+        "Asante kwa kutazama. Asante kwa kutazama.  "
+    )
+    
+    cleaned = SwahiliProcessor.clean_transcript(raw)
+    
+    assert cleaned.text == (
+        "tuanze kikao. Sasa, tutajadili deployment.\n\n"
+        "Sawa sawa. Asante kwa kutazama."
+    )
+    assert cleaned.fillers_removed == 3
+    assert cleaned.repeats_removed == 9
+    assert cleaned.tokens_saved == cleaned.tokens_before - cleaned.tokens_after > 0
+
+
+def test_transcript_cleaner_steps_are_configurable():
+    """Test that repeats below the threshold and disabled steps are left alone"""
+    text = "ndiyo ndiyo ndiyo eeh  mpango"
+    fillers = TermMatcher(["eeh"])
+    
+    assert TranscriptCleaner().clean(text, fillers).text == "ndiyo mpango"
+    assert TranscriptCleaner(min_repeats=4).clean(text, fillers).text == "ndiyo ndiyo ndiyo mpango"
+    
+    untouched = TranscriptCleaner(remove_fillers=False, max_ngram=0, normalize_whitespace=False)
+    cleaned = untouched.clean(text, fillers)
+    assert cleaned.text == text
+    assert cleaned.tokens_saved == 0
@@ -0,0 +1,86 @@
+"""Unit tests for tracing"""
+import asyncio
+
+import pytest
+
+from app.shared.serialization import loads
+from app.shared.timing import timed
+from app.shared.tracing import Tracer, get_tracer, set_tracer, span, traced
+
+
+class RecordingExporter:
+    """Exporter keeping decoded spans in memory"""
+    
+    def __init__(self):
+        self.spans = []
+        self.closed = False
+    
+    async def export(self, payload: bytes) -> None:
+        for resource_spans in loads(payload)["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                self.spans.extend(scope_spans["spans"])
+    
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def exporter():
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, service_name="test")
+    set_tracer(tracer)
+    yield exporter
+    set_tracer(None)
+
+
+def test_span_is_noop_when_disabled():
+    """Test spans are not recorded while tracing is disabled"""
+    with span("storage.load") as first, span("storage.save") as second:
+        first.set_attribute("key", "value")
+    
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_tasks_and_export(exporter):
+    """Test child spans, including ones in spawned tasks, join the parent's trace"""
+    
+    @traced("repository.update")
+    async def update():
+        await asyncio.sleep(0)
+    
+    async def job():
+        with timed("stage.transcribe", model="whisper-1"):
+            await update()
+    
+    with span("upload_audio", size_bytes=2048) as root:
+        await asyncio.create_task(job())
+    
+    await get_tracer().shutdown()
+    
+    by_name = {item["name"]: item for item in exporter.spans}
+    assert set(by_name) == {"upload_audio", "stage.transcribe", "repository.update"}
+    assert {item["traceId"] for item in exporter.spans} == {root.trace_id}
+    assert "parentSpanId" not in by_name["upload_audio"]
+    assert by_name["stage.transcribe"]["parentSpanId"] == root.span_id
+    assert by_name["repository.update"]["parentSpanId"] == by_name["stage.transcribe"]["spanId"]
+    assert {"key": "model", "value": {"stringValue": "whisper-1"}} in by_name["stage.transcribe"]["attributes"]
+    assert {"key": "size_bytes", "value": {"intValue": "2048"}} in by_name["upload_audio"]["attributes"]
+    assert exporter.closed
+
+
+@pytest.mark.asyncio
+async def test_remote_parent_and_error_status(exporter):
+    """Test an incoming traceparent is continued and failures mark the span"""
+    tracer = get_tracer()
+    traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    
+    with pytest.raises(RuntimeError):
+        with tracer.start_span("POST /api/v1/upload", traceparent=traceparent):
+            raise RuntimeError("boom")
+    await tracer.flush()
+    
+    (recorded,) = exporter.spans
+    assert recorded["traceId"] == "0af7651916cd43dd8448eb211c80319c"
+    assert recorded["parentSpanId"] == "b7ad6b7169203331"
+    assert recorded["status"] == {"code": 2, "message": "RuntimeError: boom"}
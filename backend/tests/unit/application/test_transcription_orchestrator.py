@@ -0,0 +1,194 @@
+"""Unit tests for TranscriptionOrchestrator"""
+import asyncio
+import copy
+from uuid import UUID
+
+import pytest
+
+from app.application.services.job_scheduler import JobScheduler
+from app.application.services.progress_channel import ProgressChannel
+from app.application.services.transcription_orchestrator import TranscriptionOrchestrator
+from app.application.use_cases.cancel_transcription import CancelTranscriptionUseCase
+from app.domain.entities.summary import Summary
+from app.domain.entities.transcription import Transcription
+from app.domain.exceptions.validation_exceptions import SummarizationProviderError
+from app.domain.value_objects.processing_stage import ProcessingStage
+from app.domain.value_objects.processing_status import ProcessingStatus
+
+
+class InMemoryRepository:
+    """Repository fake storing entity copies"""
+    
+    def __init__(self):
+        self.items = {}
+    
+    async def create(self, transcription):
+        self.items[transcription.id] = copy.deepcopy(transcription)
+    
+    async def get_by_id(self, transcription_id):
+        return copy.deepcopy(self.items[transcription_id])
+    
+    async def update(self, transcription):
+        self.items[transcription.id] = copy.deepcopy(transcription)
+
+
+class FakeStorage:
+    async def load(self, file_path):
+        return b"audio"
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.calls = 0
+    
+    async def transcribe(self, audio_file, language_hint="sw", filename=None):
+        self.calls += 1
+        return "Hii ni, eeh, nakala ya  mkutano."
+
+
+class FlakySummarizer:
+    def __init__(self, failures=1):
+        self.failures = failures
+    
+    async def summarize(self, transcript, transcription_id: UUID, language="sw", on_section=None):
+        if self.failures:
+            self.failures -= 1
+            raise SummarizationProviderError("rate limited")
+        if on_section is not None:
+            await on_section("muhtasari", "Muhtasari")
+        return Summary.create(transcription_id, muhtasari="Muhtasari")
+
+
+@pytest.mark.asyncio
+async def test_retry_resumes_after_transcription_checkpoint():
+    """Test that a failed summarization retry does not re-run transcription"""
+    repo = InMemoryRepository()
+    transcriber = FakeTranscriber()
+    orchestrator = TranscriptionOrchestrator(
+        transcription_repo=repo,
+        transcription_provider=transcriber,
+        summarization_provider=FlakySummarizer(failures=1),
+        file_storage=FakeStorage(),
+    )
+    transcription = Transcription.create(filename="test.mp3", file_path="/test/test.mp3")
+    await repo.create(transcription)
+    
+    with pytest.raises(SummarizationProviderError):
+        await orchestrator.process_transcription(transcription.id)
+    
+    failed = await repo.get_by_id(transcription.id)
+    assert failed.status == ProcessingStatus.FAILED
+    assert failed.stage == ProcessingStage.TRANSCRIBED
+    assert failed.transcript_text == "Hii ni, nakala ya mkutano."  # Cleaned before the checkpoint
+    
+    failed.reset_for_retry()
+    await repo.update(failed)
+    await orchestrator.process_transcription(transcription.id)
+    
+    completed = await repo.get_by_id(transcription.id)
+    assert completed.status == ProcessingStatus.COMPLETED
+    assert completed.stage == ProcessingStage.SUMMARIZED
+    assert completed.summary is not None
+    assert transcriber.calls == 1
+
+
+class HangingTranscriber:
+    async def transcribe(self, audio_file, language_hint="sw", filename=None):
+        await asyncio.sleep(60)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_in_flight_call_and_fails_job():
+    """Test that an exceeded deadline interrupts the provider and marks failure"""
+    repo = InMemoryRepository()
+    orchestrator = TranscriptionOrchestrator(
+        transcription_repo=repo,
+        transcription_provider=HangingTranscriber(),
+        summarization_provider=FlakySummarizer(failures=0),
+        file_storage=FakeStorage(),
+    )
+    transcription = Transcription.create(filename="test.mp3", file_path="/test/test.mp3")
+    await repo.create(transcription)
+    
+    with pytest.raises(TimeoutError):
+        await orchestrator.process_transcription(transcription.id, deadline_seconds=0.05)
+    
+    failed = await repo.get_by_id(transcription.id)
+    assert failed.status == ProcessingStatus.FAILED
+    assert "deadline" in failed.error_message
+
+
+@pytest.mark.asyncio
+async def test_progress_events_reach_subscribers_in_order():
+    """Test that sections are published before completion and late subscribers catch up"""
+    repo = InMemoryRepository()
+    progress = ProgressChannel()
+    orchestrator = TranscriptionOrchestrator(
+        transcription_repo=repo,
+        transcription_provider=FakeTranscriber(),
+        summarization_provider=FlakySummarizer(failures=0),
+        file_storage=FakeStorage(),
+        progress=progress,
+    )
+    transcription = Transcription.create(filename="test.mp3", file_path="/test/test.mp3")
+    await repo.create(transcription)
+    
+    early = progress.subscribe(transcription.id)
+    await orchestrator.process_transcription(transcription.id)
+    
+    events = [await early.next(timeout=1) for _ in range(3)]
+    assert [event.event for event in events] == ["transcribed", "summary.section", "completed"]
+    assert events[1].data == {"section": "muhtasari", "value": "Muhtasari"}
+    early.close()
+    assert not progress.is_open(transcription.id)
+    
+    late = progress.subscribe(transcription.id)
+    assert await late.next(timeout=0.01) is None
+    late.close()
+    assert not progress.is_open(transcription.id)
+
+
+class HangingSummarizer:
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+    
+    async def summarize(self, transcript, transcription_id: UUID, language="sw", on_section=None):
+        self.started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_summarization_stops_job_and_keeps_transcript():
+    """Test that a job cancelled while summarizing is stopped and recorded once"""
+    repo = InMemoryRepository()
+    summarizer = HangingSummarizer()
+    orchestrator = TranscriptionOrchestrator(
+        transcription_repo=repo,
+        transcription_provider=FakeTranscriber(),
+        summarization_provider=summarizer,
+        file_storage=FakeStorage(),
+        scheduler=JobScheduler(max_workers=2),
+    )
+    use_case = CancelTranscriptionUseCase(repo, orchestrator)
+    transcription = Transcription.create(filename="test.mp3", file_path="/test/test.mp3")
+    await repo.create(transcription)
+    
+    job = orchestrator.enqueue(transcription.id)
+    await asyncio.wait_for(summarizer.started.wait(), timeout=1)
+    assert (await repo.get_by_id(transcription.id)).status == ProcessingStatus.COMPLETED
+    
+    result = await use_case.execute(transcription.id)
+    
+    assert result.status == ProcessingStatus.CANCELLED.value
+    assert summarizer.cancelled
+    assert job.cancelled()
+    assert not orchestrator.is_active(transcription.id)
+    cancelled = await repo.get_by_id(transcription.id)
+    assert cancelled.status == ProcessingStatus.CANCELLED
+    assert cancelled.stage == ProcessingStage.TRANSCRIBED
+    assert cancelled.transcript_text == "Hii ni, nakala ya mkutano."
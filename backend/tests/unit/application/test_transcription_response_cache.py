@@ -0,0 +1,130 @@
+"""Unit tests for the transcript/summary response cache"""
+import pytest
+
+from app.application.services.transcription_response_cache import (
+    CachedResponse,
+    TranscriptionResponseCache,
+)
+from app.application.use_cases.get_transcript import GetTranscriptUseCase
+from app.domain.entities.transcription import Transcription
+from app.infrastructure.cache.memory_response_cache import InMemoryResponseCache
+from app.infrastructure.cache.tiered_response_cache import TieredResponseCache
+from app.infrastructure.repositories.transcription_repository_impl import (
+    TranscriptionRepositoryImpl,
+)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """Test LRU eviction by entry count and by total bytes"""
+    cache = InMemoryResponseCache(max_entries=2, max_bytes=10)
+    await cache.set("a", b"1234")
+    await cache.set("b", b"1234")
+    await cache.get("a")
+    await cache.set("c", b"12")
+    
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1234"
+    
+    await cache.set("d", b"123456789")
+    assert len(cache) == 1
+    assert cache.size_bytes == 9
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_fills_local_tier_from_shared():
+    """Test reads fall through to the shared tier and populate the local one"""
+    local, shared = InMemoryResponseCache(), InMemoryResponseCache()
+    tiered = TieredResponseCache(local=local, shared=shared)
+    
+    await shared.set("k", b"v")
+    assert await tiered.get("k") == b"v"
+    assert await local.get("k") == b"v"
+    
+    await tiered.delete("k")
+    assert await local.get("k") is None
+    assert await shared.get("k") is None
+
+
+def test_cached_response_etag_matching():
+    """Test strong ETags and If-None-Match comparison"""
+    response = CachedResponse.from_body(b'{"id": 1}')
+    
+    assert response.etag.startswith('"') and response.etag.endswith('"')
+    assert response.matches(response.etag)
+    assert response.matches(f'"other", W/{response.etag}')
+    assert response.matches("*")
+    assert not response.matches('"other"')
+    assert not response.matches(None)
+    assert CachedResponse.from_bytes(response.to_bytes()) == response
+
+
+@pytest.mark.asyncio
+async def test_completed_transcript_is_cached_until_update(test_session):
+    """Test read-through caching of completed transcripts and invalidation on update"""
+    response_cache = TranscriptionResponseCache(InMemoryResponseCache())
+    repo = TranscriptionRepositoryImpl(test_session, response_cache=response_cache)
+    use_case = GetTranscriptUseCase(repo, response_cache=response_cache)
+    
+    serialized = []
+    
+    def serialize(dto):
+        serialized.append(dto)
+        return f"{dto.status}:{dto.transcript_text}".encode()
+    
+    transcription = Transcription.create(filename="test.mp3", file_path="/test/test.mp3")
+    await repo.create(transcription)
+    
+    # In-progress transcriptions are never cached
+    await use_case.execute_serialized(transcription.id, serialize)
+    await use_case.execute_serialized(transcription.id, serialize)
+    assert len(serialized) == 2
+    
+    transcription.mark_as_processing()
+    transcription.complete_with_transcript("Habari")
+    await repo.update(transcription)
+    
+    first = await use_case.execute_serialized(transcription.id, serialize)
+    second = await use_case.execute_serialized(transcription.id, serialize)
+    assert len(serialized) == 3
+    assert first == second
+    
+    transcription.mark_as_failed("re-run")
+    await repo.update(transcription)
+    third = await use_case.execute_serialized(transcription.id, serialize)
+    assert len(serialized) == 4
+    assert third.etag != first.etag
+
+
+@pytest.mark.asyncio
+async def test_read_interleaved_with_update_is_not_cached_stale(test_session):
+    """Test that a row read before an update and cached after its invalidation is never served"""
+    response_cache = TranscriptionResponseCache(InMemoryResponseCache())
+    repo = TranscriptionRepositoryImpl(test_session, response_cache=response_cache)
+    
+    transcription = Transcription.create(filename="test.mp3", file_path="/test/test.mp3")
+    await repo.create(transcription)
+    transcription.mark_as_processing()
+    transcription.complete_with_transcript("Habari")
+    await repo.update(transcription)
+    
+    class UpdatedAfterRead:
+        """Repository whose row is updated right after a reader loaded it"""
+        
+        async def get_by_id(self, transcription_id):
+            loaded = await repo.get_by_id(transcription_id)
+            transcription.transcript_text = "Habari za asubuhi"
+            await repo.update(transcription)
+            return loaded
+    
+    def serialize(dto):
+        return dto.transcript_text.encode()
+    
+    stale_reader = GetTranscriptUseCase(UpdatedAfterRead(), response_cache=response_cache)
+    stale = await stale_reader.execute_serialized(transcription.id, serialize)
+    assert stale.body == b"Habari"
+    
+    use_case = GetTranscriptUseCase(repo, response_cache=response_cache)
+    fresh = await use_case.execute_serialized(transcription.id, serialize)
+    assert fresh.body == b"Habari za asubuhi"
+    assert await use_case.execute_serialized(transcription.id, serialize) == fresh
@@ -0,0 +1,52 @@
+"""Unit tests for lexicon-biased transcription prompts"""
+from app.application.services.lexicon import (
+    PROPER_NOUNS,
+    TECHNICAL_TERMS,
+    Lexicon,
+    LexiconSnapshot,
+)
+from app.application.services.whisper_prompt import WhisperPromptBuilder, estimate_tokens
+
+
+def make_snapshot(extra_terms=()):
+    base = Lexicon({
+        TECHNICAL_TERMS: ["api", "git", "Kubernetes", "Mpesa API", *extra_terms],
+        PROPER_NOUNS: ["Dar es Salaam", "Nairobi"],
+    })
+    overlays = {"acme": Lexicon({PROPER_NOUNS: ["Juma Hamisi"]})}
+    return LexiconSnapshot(base, overlays)
+
+
+def test_prompt_ranks_tenant_terms_and_names_first():
+    """Test ranking, original spellings and tenant overlays"""
+    builder = WhisperPromptBuilder(make_snapshot)
+    
+    assert builder.build() == "Msamiati: Dar es Salaam, Nairobi, Kubernetes, Mpesa API, git, api."
+    assert builder.build(tenant="acme").startswith("Msamiati: Juma Hamisi, Dar es Salaam")
+
+
+def test_prompt_stays_within_budget_and_continues_previous_chunk():
+    """Test the token budget, heard-term boost and preceding-text tail"""
+    builder = WhisperPromptBuilder(
+        lambda: make_snapshot(f"term{index:04d}" for index in range(5000)),
+        max_tokens=60,
+    )
+    previous = "mwanzo " * 100 + "tulijadili git na api kabla ya mapumziko"
+    
+    prompt = builder.build(previous_text=previous)
+    
+    assert estimate_tokens(prompt) <= 60
+    assert prompt.startswith("Msamiati: git, api,")
+    assert prompt.endswith("tulijadili git na api kabla ya mapumziko")
+
+
+def test_prompt_is_cached_per_lexicon_version():
+    """Test that prompts are rebuilt only when the lexicon changes"""
+    snapshots = [make_snapshot()]
+    builder = WhisperPromptBuilder(lambda: snapshots[-1])
+    
+    first = builder.build()
+    assert builder.build() is first
+    
+    snapshots.append(make_snapshot(["Zanzibar Cloud"]))
+    assert "Zanzibar Cloud" in builder.build()
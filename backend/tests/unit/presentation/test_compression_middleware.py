@@ -0,0 +1,111 @@
+"""Unit tests for response compression"""
+import gzip
+
+import pytest
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.application.services.transcription_response_cache import (
+    CachedResponse,
+    TranscriptionResponseCache,
+)
+from app.infrastructure.cache.memory_response_cache import InMemoryResponseCache
+from app.presentation.api.middleware.compression_middleware import CompressionMiddleware
+from app.shared.compression import negotiate_encoding
+
+BODY = b'{"transcriptText": "' + b"leo tutajadili deployment ya API " * 200 + b'"}'
+
+
+async def large(request):
+    return Response(BODY, media_type="application/json", headers={"ETag": '"abc"'})
+
+
+async def small(request):
+    return Response(b'{"ok": true}', media_type="application/json")
+
+
+async def streamed(request):
+    async def chunks():
+        for _ in range(4):
+            yield BODY
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+async def precompressed(request):
+    return Response(
+        gzip.compress(BODY),
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+app = CompressionMiddleware(
+    Starlette(routes=[
+        Route("/large", large),
+        Route("/small", small),
+        Route("/streamed", streamed),
+        Route("/precompressed", precompressed),
+    ]),
+    minimum_size=1024,
+)
+
+
+def test_negotiate_encoding_honours_q_values():
+    """Test Accept-Encoding negotiation"""
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("*") is not None
+    assert negotiate_encoding(None) is None
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_json_and_suffixes_etag():
+    """Test one-shot compression above the size threshold"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == '"abc-gzip"'
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(BODY)
+        assert response.content == BODY
+        
+        response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_streams_and_passes_through_encoded_responses():
+    """Test chunked compression and untouched precompressed bodies"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/streamed", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.content == BODY * 4
+        
+        response = await client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+        assert response.content == BODY
+
+
+@pytest.mark.asyncio
+async def test_cache_stores_precompressed_variants():
+    """Test encoded variants are created once and matched by ETag"""
+    cache = InMemoryResponseCache()
+    response_cache = TranscriptionResponseCache(cache, compress_min_size=1024)
+    transcription_id = "00000000-0000-0000-0000-000000000001"
+    
+    generation = await response_cache.generation(transcription_id)
+    stored = await response_cache.put("transcript", transcription_id, BODY, generation, encoding="gzip")
+    assert stored.encoding == "gzip"
+    assert gzip.decompress(stored.body) == BODY
+    assert len(cache) == 3  # Generation, identity body and gzip variant
+    
+    hit = await response_cache.get("transcript", transcription_id, generation, encoding="gzip")
+    assert hit == stored
+    assert hit.matches(CachedResponse.from_body(BODY).etag)
+    assert hit.matches(hit.representation_etag)
+    
+    await response_cache.invalidate(transcription_id)
+    assert len(cache) == 0
@@ -0,0 +1,105 @@
+"""Unit tests for the request ID and logging middleware"""
+import asyncio
+
+import pytest
+import structlog
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.presentation.api.middleware.logging_middleware import LoggingMiddleware
+from app.presentation.api.middleware.request_id_middleware import RequestIDMiddleware
+from app.presentation.api.middleware.server_timing_middleware import ServerTimingMiddleware
+from app.shared.timing import timed
+
+
+async def echo_request_id(request: Request):
+    return JSONResponse({"request_id": request.state.request_id})
+
+
+async def slow_stages(request: Request):
+    for _ in range(2):
+        with timed("db"):
+            pass
+    with timed("provider.whisper"):
+        pass
+    return JSONResponse({})
+
+
+async def streamed(request: Request):
+    async def chunks():
+        for index in range(3):
+            yield f"chunk-{index};".encode()
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def slow_stream(request: Request):
+    async def chunks():
+        for _ in range(2):
+            await asyncio.sleep(0.1)
+            yield b"."
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+app = RequestIDMiddleware(
+    LoggingMiddleware(
+        ServerTimingMiddleware(
+            Starlette(routes=[
+                Route("/id", echo_request_id),
+                Route("/stages", slow_stages),
+                Route("/stream", streamed),
+                Route("/slow-stream", slow_stream),
+            ])
+        )
+    )
+)
+
+
+@pytest.mark.asyncio
+async def test_request_id_in_state_and_header():
+    """Test the request ID is visible to handlers and returned to the client"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/id")
+    
+    assert response.headers["x-request-id"] == response.json()["request_id"]
+    assert len(response.headers["x-request-id"]) == 8
+
+
+@pytest.mark.asyncio
+async def test_streaming_responses_pass_through():
+    """Test streamed bodies are forwarded chunk by chunk"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/stream")
+    
+    assert response.text == "chunk-0;chunk-1;chunk-2;"
+    assert "x-request-id" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_server_timing_lists_request_stages():
+    """Test stages timed while handling a request are reported in Server-Timing"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/stages")
+        other = await client.get("/id")
+    
+    entries = [entry.strip() for entry in response.headers["server-timing"].split(",")]
+    assert entries[0].startswith("db;dur=") and entries[0].endswith(';desc="2x"')
+    assert entries[1].startswith("provider.whisper;dur=")
+    assert entries[-1].startswith("total;dur=")
+    # Timings do not leak into the next request
+    assert other.headers["server-timing"].startswith("total;dur=")
+
+
+@pytest.mark.asyncio
+async def test_process_time_measured_until_response_start():
+    """Test that a streamed body's duration is not counted in process_time"""
+    with structlog.testing.capture_logs() as logs:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/slow-stream")
+    
+    assert response.text == ".."
+    completed = next(log for log in logs if log["event"] == "request.completed")
+    assert completed["status_code"] == 200
+    assert float(completed["process_time"].rstrip("s")) < 0.1